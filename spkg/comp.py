@@ -244,6 +244,42 @@ EXAMPLES:
 from sage.structure.sage_object import SageObject
 from sage.rings.integer import Integer
 
+# Cache of the permutations of range(n) together with their signs, for the
+# (anti)symmetrization of components (see _permutations_with_signs):
+_permutations_with_signs_cache = {}
+
+def _permutations_with_signs(n):
+    r"""
+    Return the permutations of `\{0,1,\ldots,n-1\}`, as tuples, together
+    with their signs. 
+    
+    The result is computed only once for a given `n` and stored in a 
+    module-level cache. 
+    
+    INPUT:
+    
+    - ``n`` -- number of elements permuted
+    
+    OUTPUT:
+    
+    - tuple of pairs ``(perm, sign)``, where ``perm`` is a tuple of length `n`
+      and ``sign`` is `\pm 1` 
+    
+    """
+    if n not in _permutations_with_signs_cache:
+        from itertools import permutations
+        result = []
+        for perm in permutations(range(n)):
+            sign = 1
+            for i in range(n):
+                for j in range(i+1, n):
+                    if perm[i] > perm[j]:
+                        sign = -sign
+            result.append((perm, sign))
+        _permutations_with_signs_cache[n] = tuple(result)
+    return _permutations_with_signs_cache[n]
+
+
 class Components(SageObject):
     r"""
     Class for storing components with respect to a given "frame".  
@@ -1264,6 +1300,17 @@ class Components(SageObject):
                     result[[ind_res]] += val
             return result
 
+    def _nonzero_items(self):
+        r"""
+        Generator of the pairs (indices, value) for all the nonzero 
+        components. 
+        
+        For the base class :class:`Components`, these are simply the stored
+        components. 
+        
+        """
+        return self._comp.iteritems()
+
     def contract(self, *args):
         r""" 
         Contraction on one or many indices with another instance of
@@ -1380,17 +1427,36 @@ class Components(SageObject):
         contractions = [(pos1[i], pos2[i]) for i in range(ncontr)]
         res_nid = self._nid + other._nid - 2*ncontr
         # 
+        # The nonzero components of each operand are grouped according to 
+        # the values of the contracted indices, so that only the pairs of 
+        # nonzero components that match on these indices are multiplied:
+        other_groups = {}
+        for ind_o, val_o in other._nonzero_items():
+            key = tuple(ind_o[pos] for pos in pos2)
+            free_o = tuple(ind_o[pos] for pos in range(other._nid) 
+                           if pos not in pos2)
+            if key in other_groups:
+                other_groups[key].append((free_o, val_o))
+            else:
+                other_groups[key] = [(free_o, val_o)]
+        self_groups = {}
+        for ind_s, val_s in self._nonzero_items():
+            key = tuple(ind_s[pos] for pos in pos1)
+            if key in other_groups:
+                free_s = tuple(ind_s[pos] for pos in range(self._nid) 
+                               if pos not in pos1)
+                if key in self_groups:
+                    self_groups[key].append((free_s, val_s))
+                else:
+                    self_groups[key] = [(free_s, val_s)]
+        #
         # Special case of a scalar result
         #
         if res_nid == 0:
-            # To generate the indices tuples (of size ncontr) involved in the 
-            # the contraction, we create an empty instance of Components with
-            # ncontr indices and call the method index_generator() on it:
-            comp_for_contr = Components(self._ring, self._frame, ncontr, 
-                                        start_index=self._sindex) 
-            res = 0
-            for ind in comp_for_contr.index_generator():
-                res += self[[ind]] * other[[ind]]
+            res = self._ring.zero_element()
+            for key, s_items in self_groups.iteritems():
+                # all indices being contracted, each group has a single item
+                res += s_items[0][1] * other_groups[key][0][1]
             return res
         #
         # Positions of self and other indices in the result
@@ -1414,8 +1480,6 @@ class Components(SageObject):
                     break
             else:
                 pos_o[pos] = self._nid + pos - shift
-        rev_s = [pos_s.index(i) for i in range(self._nid-ncontr)]
-        rev_o = [pos_o.index(i) for i in range(self._nid-ncontr, res_nid)]
         #
         # Determination of the symmetries of the result
         #
@@ -1497,29 +1561,24 @@ class Components(SageObject):
         #
         # Performing the contraction
         #
-        # To generate the indices tuples (of size ncontr) involved in the 
-        # the contraction, we create an empty instance of Components with
-        # ncontr indices and call the method index_generator() on it:
-        comp_for_contr = Components(self._ring, self._frame, ncontr, 
-                                    start_index=self._sindex) 
-        shift_o = self._nid - ncontr
-        for ind in res.non_redundant_index_generator():
-            ind_s = [None for i in range(self._nid)]  # initialization
-            ind_o = [None for i in range(other._nid)] # initialization
-            for i, pos in enumerate(rev_s):
-                ind_s[pos] = ind[i]
-            for i, pos in enumerate(rev_o):
-                ind_o[pos] = ind[shift_o+i]
-            sm = 0
-            for ind_c in comp_for_contr.index_generator():
-                ic = 0
-                for pos_s, pos_o in contractions:
-                    k = ind_c[ic]
-                    ind_s[pos_s] = k
-                    ind_o[pos_o] = k
-                    ic += 1
-                sm += self[[ind_s]] * other[[ind_o]]
-            res[[ind]] = sm
+        sums = {}
+        for key, s_items in self_groups.iteritems():
+            o_items = other_groups[key]
+            for free_s, val_s in s_items:
+                for free_o, val_o in o_items:
+                    ind = free_s + free_o
+                    if ind in sums:
+                        sums[ind] += val_s * val_o
+                    else:
+                        sums[ind] = val_s * val_o
+        # Only the non-redundant components are stored in the result:
+        with_sym = isinstance(res, CompWithSym)
+        for ind, val in sums.iteritems():
+            if val == 0:
+                continue
+            if with_sym and res._ordered_indices(ind)[1] != ind:
+                continue
+            res._comp[ind] = val
         return res
         
 
@@ -1597,6 +1656,71 @@ class Components(SageObject):
         for ind in self.index_generator():
             yield ind
 
+    def non_redundant_index_count(self):
+        r"""
+        Number of indices generated by :meth:`non_redundant_index_generator`.
+        
+        In the absence of declared symmetries, this is simply `n^p`, where 
+        `n` is the dimension and `p` the number of indices.  
+        
+        EXAMPLE::
+        
+            sage: from sage.tensor.modules.comp import Components
+            sage: V = VectorSpace(QQ, 3)
+            sage: c = Components(QQ, V.basis(), 2)
+            sage: c.non_redundant_index_count()
+            9
+            
+        """
+        return Integer(self._dim)**self._nid
+
+
+    def _permutation_average(self, ind, pos, antisym=False):
+        r"""
+        Average of the components obtained by permuting the indices ``ind``
+        at the positions ``pos``, each term being multiplied by the sign of
+        the permutation if ``antisym`` is ``True``. 
+        
+        The permuted indices are grouped according to the stored components 
+        they correspond to, so that each distinct component of ``self`` is
+        read only once, with its multiplicity. 
+        
+        """
+        n_sym = len(pos)
+        perms = _permutations_with_signs(n_sym)
+        values = [ind[p] for p in pos]
+        if antisym and len(set(values)) != n_sym:
+            return 0   # repeated indices in an antisymmetrization
+        # Multiplicity of each distinct permuted index:
+        multiplicities = {}
+        for perm, sign in perms:
+            ind_perm = list(ind)
+            for k in range(n_sym):
+                ind_perm[pos[perm[k]]] = values[k]
+            ind_perm = tuple(ind_perm)
+            if antisym:
+                multiplicities[ind_perm] = multiplicities.get(ind_perm, 0) + sign
+            else:
+                multiplicities[ind_perm] = multiplicities.get(ind_perm, 0) + 1
+        # Weight of each stored component:
+        weights = {}
+        if isinstance(self, CompWithSym):
+            for ind_perm, mult in multiplicities.iteritems():
+                sign, key = self._ordered_indices(ind_perm)
+                if sign != 0:
+                    weights[key] = weights.get(key, 0) + sign*mult
+        else:
+            weights = multiplicities
+        res = 0
+        for key, weight in weights.iteritems():
+            if weight != 0 and key in self._comp:
+                if weight == 1:
+                    res += self._comp[key]
+                elif weight == -1:
+                    res -= self._comp[key]
+                else:
+                    res += weight * self._comp[key]
+        return res / Integer(len(perms))
 
     def symmetrize(self, *pos):
         r"""
@@ -1727,7 +1851,6 @@ class Components(SageObject):
             True True True True True True True True True True True True True True True True True True True True True True True True True True True
 
         """
-        from sage.groups.perm_gps.permgroup_named import SymmetricGroup
         if not pos:
             pos = range(self._nid)
         else:
@@ -1743,17 +1866,8 @@ class Components(SageObject):
         else:
             result = CompWithSym(self._ring, self._frame, self._nid, self._sindex, 
                                  self._output_formatter, sym=pos)
-        sym_group = SymmetricGroup(n_sym)
         for ind in result.non_redundant_index_generator():
-            sum = 0
-            for perm in sym_group.list():
-                # action of the permutation on [0,1,...,n_sym-1]:
-                perm_action = map(lambda x: x-1, perm.domain())
-                ind_perm = list(ind)
-                for k in range(n_sym):
-                    ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                sum += self[[ind_perm]]
-            result[[ind]] = sum / sym_group.order()
+            result[[ind]] = self._permutation_average(ind, pos)
         return result
 
             
@@ -1894,7 +2008,6 @@ class Components(SageObject):
             True
         
         """
-        from sage.groups.perm_gps.permgroup_named import SymmetricGroup
         if not pos:
             pos = range(self._nid)
         else:
@@ -1910,20 +2023,8 @@ class Components(SageObject):
         else:
             result = CompWithSym(self._ring, self._frame, self._nid, self._sindex, 
                                  self._output_formatter, antisym=pos)
-        sym_group = SymmetricGroup(n_sym)
         for ind in result.non_redundant_index_generator():
-            sum = 0 
-            for perm in sym_group.list():
-                # action of the permutation on [0,1,...,n_sym-1]:
-                perm_action = map(lambda x: x-1, perm.domain())
-                ind_perm = list(ind)
-                for k in range(n_sym):
-                    ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                if perm.sign() == 1:
-                    sum += self[[ind_perm]]
-                else:
-                    sum -= self[[ind_perm]]
-            result[[ind]] = sum / sym_group.order()
+            result[[ind]] = self._permutation_average(ind, pos, antisym=True)
         return result
 
             
@@ -2254,6 +2355,56 @@ class CompWithSym(Components):
         ind = tuple(ind)
         return (sign, ind)
 
+    def _nonzero_items(self):
+        r"""
+        Generator of the pairs (indices, value) for all the nonzero 
+        components, including those that are deduced from the stored ones
+        by symmetry or antisymmetry. 
+        
+        EXAMPLES::
+        
+            sage: from sage.tensor.modules.comp import CompFullyAntiSym
+            sage: V = VectorSpace(QQ, 3)
+            sage: c = CompFullyAntiSym(QQ, V.basis(), 2)
+            sage: c[0,1], c[1,2] = 3, -1
+            sage: sorted(c._nonzero_items())
+            [((0, 1), 3), ((1, 0), -3), ((1, 2), -1), ((2, 1), 1)]
+
+        """
+        from itertools import permutations
+        groups = [(isym, False) for isym in self._sym] + \
+                 [(isym, True) for isym in self._antisym]
+        for ind, val in self._comp.iteritems():
+            # all the rearrangements of the stored indices, with the 
+            # associated signs, are generated group by group:
+            variants = [(list(ind), 1)]
+            for isym, anti in groups:
+                new_variants = []
+                for ind_var, sign in variants:
+                    done = set()
+                    for perm in permutations(range(len(isym))):
+                        values = tuple(ind[isym[k]] for k in perm)
+                        if values in done:
+                            continue  # repeated indices in a symmetry
+                        done.add(values)
+                        new_ind = list(ind_var)
+                        for k, pos in enumerate(isym):
+                            new_ind[pos] = values[k]
+                        new_sign = sign
+                        if anti:
+                            # signature of perm from its number of inversions
+                            for i in range(len(perm)):
+                                for j in range(i+1, len(perm)):
+                                    if perm[i] > perm[j]:
+                                        new_sign = -new_sign
+                        new_variants.append((new_ind, new_sign))
+                variants = new_variants
+            for ind_var, sign in variants:
+                if sign == 1:
+                    yield tuple(ind_var), val
+                else:
+                    yield tuple(ind_var), -val
+
     def __getitem__(self, args):
         r"""
         Returns the component corresponding to the given indices.
@@ -2851,34 +3002,88 @@ class CompWithSym(Components):
         """
         si = self._sindex
         imax = self._dim - 1 + si
-        ind = [si for k in range(self._nid)]
-        ind_end = [si for k in range(self._nid)]
-        ind_end[0] = imax+1
-        while ind != ind_end:
-            ordered = True
-            for isym in self._sym:
-                for k in range(len(isym)-1):
-                    if ind[isym[k+1]] < ind[isym[k]]:
-                        ordered = False
-                        break                
-            for isym in self._antisym:
-                for k in range(len(isym)-1):
-                    if ind[isym[k+1]] <= ind[isym[k]]:
-                        ordered = False
-                        break
-            if ordered:
+        nid = self._nid
+        # For each index position, symmetry group it belongs to, rank in the
+        # group and minimal step between consecutive indices in the group 
+        # (0 for a symmetry, 1 for an antisymmetry):
+        groups = [None for pos in range(nid)]
+        for isym in self._sym:
+            for r, pos in enumerate(isym):
+                groups[pos] = (isym, r, 0)
+        for isym in self._antisym:
+            for r, pos in enumerate(isym):
+                groups[pos] = (isym, r, 1)
+        def bounds(p, ind):
+            # Range of the index at position p, given the indices at the 
+            # positions < p (the range is never empty if p is the first
+            # position of its group and the dimension is large enough):
+            if groups[p] is None:
+                return (si, imax)
+            isym, r, step = groups[p]
+            lo = si + step*r
+            for rr in range(r-1, -1, -1):
+                if isym[rr] < p:
+                    lo = ind[isym[rr]] + step*(r-rr)
+                    break
+            hi = imax - step*(len(isym)-1-r)
+            for rr in range(r+1, len(isym)):
+                if isym[rr] < p:
+                    hi = ind[isym[rr]] - step*(rr-r)
+                    break
+            return (lo, hi)
+        # Only ordered indices are generated, in lexicographic order:
+        ind = [si for pos in range(nid)]
+        ind_max = [imax for pos in range(nid)]
+        ind[0], ind_max[0] = bounds(0, ind)
+        p = 0
+        while True:
+            if ind[p] > ind_max[p]:
+                # all the values at position p have been considered
+                p -= 1
+                if p < 0:
+                    break
+                ind[p] += 1
+            elif p == nid - 1:
                 yield tuple(ind)
-            ret = 1
-            for pos in range(self._nid-1,-1,-1):
-                if ind[pos] != imax:
-                    ind[pos] += ret
-                    ret = 0
-                elif ret == 1:
-                    if pos == 0:
-                        ind[pos] = imax + 1 # end point reached
-                    else:
-                        ind[pos] = si
-                        ret = 1
+                ind[p] += 1
+            else:
+                p += 1
+                ind[p], ind_max[p] = bounds(p, ind)
+
+    def non_redundant_index_count(self):
+        r"""
+        Number of indices generated by :meth:`non_redundant_index_generator`,
+        computed without running the generator. 
+        
+        EXAMPLES:
+        
+        Counts on a 4-dimensional space::
+        
+            sage: from sage.tensor.modules.comp import CompWithSym, \
+            ...    CompFullySym, CompFullyAntiSym
+            sage: V = VectorSpace(QQ, 4)
+            sage: CompFullySym(QQ, V.basis(), 4).non_redundant_index_count()
+            35
+            sage: CompFullyAntiSym(QQ, V.basis(), 4).non_redundant_index_count()
+            1
+            sage: c = CompWithSym(QQ, V.basis(), 4, sym=(0,1), antisym=(2,3))
+            sage: c.non_redundant_index_count()
+            60
+            sage: c.non_redundant_index_count() == len(list(c.non_redundant_index_generator()))
+            True
+
+        """
+        from sage.rings.arith import binomial
+        n = self._dim
+        nb_free = self._nid
+        res = Integer(1)
+        for isym in self._sym:
+            res *= binomial(n + len(isym) - 1, len(isym))
+            nb_free -= len(isym)
+        for isym in self._antisym:
+            res *= binomial(n, len(isym))
+            nb_free -= len(isym)
+        return res * n**nb_free
 
     def symmetrize(self, *pos):
         r"""
@@ -3085,7 +3290,6 @@ class CompWithSym(Components):
             True
             
         """
-        from sage.groups.perm_gps.permgroup_named import SymmetricGroup
         if not pos:
             pos = range(self._nid)
         else:
@@ -3166,18 +3370,8 @@ class CompWithSym(Components):
         #
         # Symmetrization
         #
-        n_sym = len(pos) # number of indices involved in the symmetry
-        sym_group = SymmetricGroup(n_sym)
         for ind in result.non_redundant_index_generator():
-            sum = 0 
-            for perm in sym_group.list():
-                # action of the permutation on [0,1,...,n_sym-1]:
-                perm_action = map(lambda x: x-1, perm.domain())
-                ind_perm = list(ind)
-                for k in range(n_sym):
-                    ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                sum += self[[ind_perm]]
-            result[[ind]] = sum / sym_group.order()
+            result[[ind]] = self._permutation_average(ind, pos)
         return result
 
 
@@ -3345,7 +3539,6 @@ class CompWithSym(Components):
             -27/2
 
         """
-        from sage.groups.perm_gps.permgroup_named import SymmetricGroup
         if not pos:
             pos = range(self._nid)
         else:
@@ -3428,21 +3621,8 @@ class CompWithSym(Components):
         #
         # Antisymmetrization
         #
-        n_sym = len(pos) # number of indices involved in the antisymmetry
-        sym_group = SymmetricGroup(n_sym)
         for ind in result.non_redundant_index_generator():
-            sum = 0 
-            for perm in sym_group.list():
-                # action of the permutation on [0,1,...,n_sym-1]:
-                perm_action = map(lambda x: x-1, perm.domain())
-                ind_perm = list(ind)
-                for k in range(n_sym):
-                    ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                if perm.sign() == 1:
-                    sum += self[[ind_perm]]
-                else:
-                    sum -= self[[ind_perm]]
-            result[[ind]] = sum / sym_group.order()
+            result[[ind]] = self._permutation_average(ind, pos, antisym=True)
         return result
 
 
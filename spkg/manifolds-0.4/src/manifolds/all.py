@@ -13,11 +13,11 @@ from rank2field import SymBilinFormField, EndomorphismField, \
 from diffform import DiffForm, OneForm
 from vectorframe import VectorFrame, CoordFrame, CoFrame, CoordCoFrame
 from component import Components, CompWithSym, CompFullySym, CompFullyAntiSym, \
-    KroneckerDelta
+    CompRiemannSym, KroneckerDelta
 from metric import Metric, RiemannMetric, LorentzMetric
 from connection import AffConnection, LeviCivitaConnection
 from functions import xder, ctr, Lie
-from utilities import simple_determinant, simplify_sqrt_real
+from utilities import simple_determinant, simple_inverse, simplify_sqrt_real
 
 
 
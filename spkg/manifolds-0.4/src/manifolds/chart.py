@@ -338,6 +338,13 @@ class Chart(SageObject):
         
         # Additional restrictions on the coordinates
         self.restrictions = []  # to be set with method add_restrictions()
+        
+        # Simplification of the results of arithmetic operations on 
+        # chart functions (to be changed by defer_simplification()):
+        self._deferred_simplif = False
+        # Simplification profile used for the coordinate expressions (to be
+        # changed by set_simplification_profile()):
+        self._simplif_profile = self.manifold._simplif_profile
 
         # The chart is added to the domain's atlas, as well as to all the 
         # superdomains' atlases; moreover the fist defined chart is considered 
@@ -538,6 +545,100 @@ class Chart(SageObject):
         self.restrictions.extend(restrictions)
 
 
+    def defer_simplification(self, deferred=True):
+        r"""
+        Set the simplification mode for the results of arithmetic operations
+        on functions of the coordinates of ``self``.
+        
+        By default, the coordinate expression resulting from any operation 
+        (addition, multiplication, derivation, etc.) on instances of 
+        :class:`FunctionChart` is simplified immediately, via 
+        :func:`~sage.geometry.manifolds.utilities.simplify_chain`. In the 
+        deferred mode, the expressions are kept unsimplified until
+
+        * the result is stored as a component (see :class:`Components`), 
+        * it is displayed (e.g. via ``view()`` or ``expr()``),
+        * or an explicit simplification is required, via 
+          :meth:`FunctionChart.simplify`. 
+          
+        This avoids useless simplifications of intermediate results, such 
+        as the partial sums in a contraction. 
+        
+        INPUT:
+        
+        - ``deferred`` -- (default: True) boolean; if True, the deferred 
+          simplification mode is set, otherwise the immediate one is restored;
+          the setting applies to ``self`` and all its subcharts
+          
+        EXAMPLES:
+        
+        Deferred simplification on a 2-dimensional chart::
+        
+            sage: m = Manifold(2, 'M')
+            sage: c_xy.<x,y> = m.chart('x y')
+            sage: c_xy.defer_simplification()
+            sage: f = FunctionChart(c_xy, cos(x)^2)
+            sage: g = FunctionChart(c_xy, sin(x)^2)
+            sage: h = f + g
+            sage: h.express  # not simplified yet
+            cos(x)^2 + sin(x)^2
+            sage: h  # the display triggers the simplification
+            1
+            sage: h.express 
+            1
+            sage: c_xy.defer_simplification(False)  # back to the default mode
+            sage: f + g
+            1
+            
+        """
+        for chart in self.subcharts:
+            chart._deferred_simplif = deferred
+
+    def set_simplification_profile(self, profile):
+        r"""
+        Set the simplification profile used for the coordinate expressions 
+        of functions on ``self``.
+        
+        The default profile is that of the manifold (cf. 
+        :meth:`Manifold.set_simplification_profile`), which is ``'full'``, 
+        unless specified otherwise. 
+        
+        INPUT:
+        
+        - ``profile`` -- name of the simplification profile, i.e. of a 
+          sequence of simplifications performed by 
+          :func:`~sage.geometry.manifolds.utilities.simplify_chain`; the 
+          predefined profiles are ``'full'``, ``'auto'`` (the relevant 
+          simplifications of ``'full'`` only), ``'trig'``, 
+          ``'rational-only'`` and ``'none'``; the setting applies to ``self`` 
+          and all its subcharts
+          
+        EXAMPLES:
+        
+        Simplification profiles on a 2-dimensional chart::
+        
+            sage: m = Manifold(2, 'M')
+            sage: c_xy.<x,y> = m.chart('x y')
+            sage: f = FunctionChart(c_xy, (x^2-y^2)/(x+y))
+            sage: g = FunctionChart(c_xy, cos(x)^2)
+            sage: c_xy.set_simplification_profile('rational-only')
+            sage: f + g
+            cos(x)^2 + x - y
+            sage: c_xy.set_simplification_profile('none')
+            sage: f + 1
+            (x^2 - y^2)/(x + y) + 1
+            sage: c_xy.set_simplification_profile('full')
+            sage: g + FunctionChart(c_xy, sin(x)^2)
+            1
+            
+        """
+        from utilities import simplification_profiles
+        if profile not in simplification_profiles():
+            raise ValueError("Unknown simplification profile: " + 
+                             str(profile))
+        for chart in self.subcharts:
+            chart._simplif_profile = profile
+
     def subchart(self, domain, restrictions):
         r"""
         Construct a subchart.
@@ -592,6 +693,14 @@ class Chart(SageObject):
             sage: a = M.point((3/2,0))
             sage: a in A
             True
+            
+        The subchart inherits the simplification settings of the mother 
+        chart::
+        
+            sage: c_cart.set_simplification_profile('rational-only')
+            sage: c_cart.subchart(D, x^2+y^2<1/4)._simplif_profile
+            'rational-only'
+            sage: c_cart.set_simplification_profile('full')
 
         """
         if not domain.is_subdomain(self.domain):
@@ -604,6 +713,9 @@ class Chart(SageObject):
         res.bounds = self.bounds
         res.restrictions.extend(self.restrictions)
         res.add_restrictions(restrictions)
+        # The simplification settings of self apply to its subcharts:
+        res._deferred_simplif = self._deferred_simplif
+        res._simplif_profile = self._simplif_profile
         # Update of supercharts and subcharts:
         res.supercharts.update(self.supercharts)
         for schart in self.supercharts:
@@ -666,6 +778,77 @@ class Chart(SageObject):
         # All tests have been passed:
         return True
 
+    def valid_coordinates_on_grid(self, *arrays):
+        r""" 
+        Vectorized version of :meth:`valid_coordinates` for NumPy arrays of
+        coordinate values. 
+
+        INPUT:
+        
+        - ``*arrays`` -- one array (or number) per coordinate; the arrays 
+          are broadcast against each other (in the NumPy sense) to form a 
+          grid of points
+
+        OUTPUT:
+        
+        - NumPy array of booleans, with the shape of the grid, the entries 
+          of which are True where the coordinate values are admissible in 
+          the chart domain. 
+
+        EXAMPLES::
+        
+            sage: m = Manifold(2, 'M')
+            sage: X.<x,y> = m.chart('x y:[0,+oo)')
+            sage: X.add_restrictions(x^2+y^2<1)
+            sage: import numpy
+            sage: X.valid_coordinates_on_grid(numpy.array([0., 0.5, 1.]), 
+            ....:                             numpy.array([[-0.5], [0.5]]))
+            array([[False, False, False],
+                   [ True,  True, False]], dtype=bool)
+
+        """
+        import numpy
+        from utilities import numpy_function
+        n = len(arrays)
+        if n != self.manifold.dim:
+            raise TypeError(str(self.manifold.dim) + 
+                            " arrays of coordinates must be provided.")
+        arrays = numpy.broadcast_arrays(*[numpy.asarray(a, dtype=float) 
+                                          for a in arrays])
+        shape = arrays[0].shape
+        valid = numpy.ones(shape, dtype=bool)
+        # Check of the coordinate ranges:
+        for x, bounds in zip(arrays, self.bounds):
+            xmin = float(bounds[0][0])
+            xmax = float(bounds[1][0])
+            if bounds[0][1]:
+                valid &= (x >= xmin)
+            else:
+                valid &= (x > xmin)
+            if bounds[1][1]:
+                valid &= (x <= xmax)
+            else:
+                valid &= (x < xmax)
+        # Check of additional restrictions:
+        with numpy.errstate(all='ignore'):
+            for restrict in self.restrictions:
+                if isinstance(restrict, tuple): # case of or conditions
+                    conds = restrict
+                else:
+                    conds = (restrict,)
+                combine = numpy.zeros(shape, dtype=bool)
+                for cond in conds:
+                    func = numpy_function(cond, self.xx)
+                    if func is None:
+                        # pointwise check as a last resort:
+                        for ind in zip(*numpy.nonzero(valid)):
+                            coords = [float(a[ind]) for a in arrays]
+                            valid[ind] = self.valid_coordinates(*coords)
+                        return valid
+                    combine |= numpy.asarray(func(*arrays), dtype=bool)
+                valid &= combine
+        return valid
+
     def transition_map(self, other, transformations, intersection_name=None, 
                        restrictions1=None, restrictions2=None):
         r""" 
@@ -866,13 +1049,18 @@ class FunctionChart(SageObject):
         self.chart = chart
         self.express = SR(expression)
         self.nc = len(self.chart.xx)    # number of coordinates
+        # False if some simplification of the expression is pending (deferred
+        # simplification mode, cf. Chart.defer_simplification):
+        self._simplified = True
         # Derived quantities:
         self._der = None  # partial derivatives
+        self._fast_callable = None  # compiled version for numerical values
 
     def _repr_(self):
         r"""
         Special Sage function for the string representation of the object.
         """
+        self._simplify_deferred()
         return str(self.express)
 
     def _latex_(self):
@@ -880,6 +1068,7 @@ class FunctionChart(SageObject):
         Special Sage function for the LaTeX representation of the object.
         """
         from sage.misc.latex import latex
+        self._simplify_deferred()
         return latex(self.express)
 
     def expr(self):
@@ -928,6 +1117,7 @@ class FunctionChart(SageObject):
             True
 
         """
+        self._simplify_deferred()
         return self.express
         
     def view(self):
@@ -952,6 +1142,7 @@ class FunctionChart(SageObject):
         """
         from sage.misc.latex import latex
         from utilities import FormattedExpansion
+        self._simplify_deferred()
         result = FormattedExpansion(self)
         result.txt = repr((self.chart)[:]) + ' |--> ' + repr(self.express)
         result.latex = self.chart._latex_coordinates() + r' \mapsto' + latex(self.express)
@@ -962,13 +1153,78 @@ class FunctionChart(SageObject):
         Delete the derived quantities
         """
         self._der = None
+        self._fast_callable = None
+
+    def _new_from_expr(self, expression):
+        r"""
+        Construct the chart function of coordinate expression ``expression``,
+        resulting from some operation on ``self``.
+        
+        The expression is simplified, unless the deferred simplification mode
+        is set on the chart (see :meth:`Chart.defer_simplification`). 
+        
+        """
+        chart = self.chart
+        if chart._deferred_simplif:
+            if expression.is_trivial_zero():
+                return chart.zero_function
+            result = FunctionChart(chart, expression)
+            result._simplified = False
+            return result
+        expression = simplify_chain(expression, chart._simplif_profile)
+        if expression == 0:
+            return chart.zero_function
+        return FunctionChart(chart, expression)
+
+    def _simplify_deferred(self):
+        r"""
+        Perform the simplification of the coordinate expression if it has 
+        been deferred (see :meth:`Chart.defer_simplification`). 
+        """
+        if not self._simplified:
+            self.simplify()
+
+    def simplify(self):
+        r"""
+        Simplify the coordinate expression. 
+        
+        The simplification is performed by 
+        :func:`~sage.geometry.manifolds.utilities.simplify_chain`, according
+        to the chart's simplification profile (see 
+        :meth:`Chart.set_simplification_profile`).
+        
+        OUTPUT:
+        
+        - ``self``, with ``self.express`` simplified
+
+        EXAMPLES:
+        
+        Simplification on a 2-dimensional chart::
+        
+            sage: m = Manifold(2, 'M')
+            sage: X.<x,y> = m.chart('x y')
+            sage: f = FunctionChart(X, (x^2 - y^2)/(x + y))
+            sage: f.express
+            (x^2 - y^2)/(x + y)
+            sage: f.simplify()
+            x - y
+            sage: f.express  # the method simplify() has changed f:
+            x - y
+
+        """
+        self.express = simplify_chain(self.express, 
+                                      self.chart._simplif_profile)
+        self._simplified = True
+        self._del_derived()
+        return self
 
     def copy(self):
         r"""
         Returns an exact copy of ``self``.
         
-        The derived quantities are not copied, because they can be 
-        reconstructed if necessary.
+        The partial derivatives are shared between ``self`` and the copy, as
+        long as none of them is modified: a partial derivative computed for 
+        one of them is then available for the other one. 
 
         EXAMPLES:
         
@@ -986,9 +1242,16 @@ class FunctionChart(SageObject):
             True
             sage: g is f    # but differs in computer memory:
             False
+            sage: g.diff(x) is f.diff(x)  # the derivatives are shared
+            True
         
         """
-        return FunctionChart(self.chart, self.express)
+        result = FunctionChart(self.chart, self.express)
+        result._simplified = self._simplified
+        if self._der is None:
+            self._der = [None for j in range(self.nc)]
+        result._der = self._der
+        return result
         
     def __call__(self, *coords):
         r"""
@@ -1002,8 +1265,47 @@ class FunctionChart(SageObject):
         OUTPUT:
         
         - the value `f(x^1,...,x^n)`  
+        
+        If all the coordinates are floating-point numbers (Python floats or
+        elements of ``RDF`` or ``RR``), the value is computed by a compiled 
+        version of the coordinate expression (see 
+        :func:`~sage.ext.fast_callable.fast_callable`), which is constructed 
+        at the first call and kept for subsequent ones; no simplification 
+        is then performed and the value is an element of ``RDF`` (even if the
+        coordinates are elements of ``RR``). If the compiled evaluation 
+        does not return a finite number (e.g. for the square root of a 
+        negative number or the logarithm of zero), the value is computed by 
+        substituting the coordinates in the expression, as for symbolic 
+        coordinates. 
+        
+        EXAMPLES:
+        
+        Symbolic and numerical values::
+        
+            sage: m = Manifold(2, 'M')
+            sage: c_xy.<x,y> = m.chart('x y')
+            sage: f = FunctionChart(c_xy, sin(x)*y^2)
+            sage: f(pi/2, 3)
+            9
+            sage: f(1.5, 3.)  # compiled evaluation
+            8.97745487943...
+            sage: abs(f(1.5, 3.) - 9*sin(1.5)) < 1e-14
+            True
+            sage: f(1.5, 3.).parent()
+            Real Double Field
+            
+        Case where the compiled evaluation does not return a finite number::
+        
+            sage: g = FunctionChart(c_xy, sqrt(x) + log(y))
+            sage: g(-1., 1.)
+            1.00000000000000*I
+            sage: g(1., 0.)
+            -Infinity
          
         """
+        resu = self._numerical_value(coords)
+        if resu is not None:
+            return resu
         #!# This should be the Python 2.7 form: 
         # substitutions = {self.chart.xx[j]: coords[j] for j in range(self.nc)}
         #
@@ -1011,7 +1313,55 @@ class FunctionChart(SageObject):
         substitutions = dict([(self.chart.xx[j], coords[j]) for j in 
                                                                range(self.nc)])
         resu = self.express.subs(substitutions)
-        return simplify_chain(resu)
+        return simplify_chain(resu, self.chart._simplif_profile)
+
+    def _numerical_value(self, coords):
+        r"""
+        Fast numerical evaluation at floating-point coordinates. 
+        
+        INPUT:
+        
+        - ``coords`` -- tuple of coordinates
+        
+        OUTPUT:
+        
+        - the value of ``self`` at ``coords``, as an element of ``RDF``, if 
+          all the coordinates are floating-point numbers of double precision,
+          the expression can be compiled and its value is a finite number; 
+          None otherwise
+        
+        """
+        from sage.rings.real_double import RDF
+        from sage.rings.real_mpfr import RR
+        for coord in coords:
+            if not isinstance(coord, float):
+                try:
+                    parent = coord.parent()
+                except AttributeError:
+                    return None
+                if parent is not RDF and parent is not RR:
+                    return None
+        if self._fast_callable is None:
+            from sage.ext.fast_callable import fast_callable
+            try:
+                self._fast_callable = fast_callable(self.express, 
+                                                    vars=self.chart.xx,
+                                                    domain=RDF)
+            except (TypeError, ValueError, NotImplementedError):
+                # the expression cannot be compiled (e.g. it involves some
+                # unspecified function)
+                self._fast_callable = False
+        if self._fast_callable is False:
+            return None
+        try:
+            resu = RDF(self._fast_callable(*coords))
+        except (TypeError, ValueError, ZeroDivisionError):
+            return None
+        if resu.is_NaN() or resu.is_infinity():
+            # the exact value may be complex or infinite, which is left to 
+            # the symbolic evaluation: 
+            return None
+        return resu
                      
     def diff(self, coord):
         r""" 
@@ -1063,18 +1413,29 @@ class FunctionChart(SageObject):
             2*x
             sage: f.diff(1) is f.diff(x)
             True
+        
+        The partial derivatives are computed only when required, one 
+        coordinate at a time::
+        
+            sage: g = FunctionChart(c_xy, x*y^2)
+            sage: g.diff(y)
+            2*x*y
+            sage: g._der
+            [None, 2*x*y]
             
         """
         from sage.calculus.functional import diff
-        if self._der is None:
-            # the partial derivatives have to be updated
-            self._der = [FunctionChart(self.chart,
-                         simplify_chain(diff(self.express, self.chart.xx[j])))
-                                                    for j in range(self.nc) ]
         if isinstance(coord, (int, Integer)):
-            return self._der[coord - self.chart.manifold.sindex]
+            j = coord - self.chart.manifold.sindex
         else:
-            return self._der[self.chart.xx.index(coord)]
+            j = self.chart.xx.index(coord)
+        if self._der is None:
+            self._der = [None for i in range(self.nc)]
+        if self._der[j] is None:
+            # the partial derivative has to be computed
+            self._der[j] = self._new_from_expr(diff(self.express, 
+                                                    self.chart.xx[j]))
+        return self._der[j]
 
     def is_zero(self):
         r""" 
@@ -1141,7 +1502,7 @@ class FunctionChart(SageObject):
         - an exact copy of ``self``
     
         """
-        return FunctionChart(self.chart, self.express)
+        return self.copy()
 
     def __neg__(self):
         r"""
@@ -1152,7 +1513,7 @@ class FunctionChart(SageObject):
         - the opposite of the function ``self``
     
         """
-        return FunctionChart(self.chart, simplify_chain(-self.express))
+        return self._new_from_expr(-self.express)
 
     def __add__(self, other):
         r"""
@@ -1173,15 +1534,12 @@ class FunctionChart(SageObject):
                                 "chart cannot be added.")
             if isinstance(other, ZeroFunctionChart):
                 return self.copy()
-            res = simplify_chain(self.express + other.express)
+            res = self.express + other.express
         elif isinstance(other, (int, RingElement)):  #!# check
-            res = simplify_chain(self.express + other)
+            res = self.express + other
         else:
             return other.__radd__(self)
-        if res == 0:
-            return self.chart.zero_function
-        else:
-            return FunctionChart(self.chart, res)
+        return self._new_from_expr(res)
 
     def __radd__(self, other):
         r"""
@@ -1221,15 +1579,12 @@ class FunctionChart(SageObject):
                                 "chart cannot be subtracted.")
             if isinstance(other, ZeroFunctionChart):
                 return self.copy()
-            res = simplify_chain(self.express - other.express)
+            res = self.express - other.express
         elif isinstance(other, (int, RingElement)):  #!# check
-            res = simplify_chain(self.express - other)
+            res = self.express - other
         else:
             return other.__rsub__(self)
-        if res == 0:
-            return self.chart.zero_function
-        else:
-            return FunctionChart(self.chart, res)
+        return self._new_from_expr(res)
 
     def __rsub__(self, other):
         r"""
@@ -1270,15 +1625,12 @@ class FunctionChart(SageObject):
                                 "chart cannot be multiplied.")
             if isinstance(other, ZeroFunctionChart):
                 return self.chart.zero_function
-            res = simplify_chain(self.express * other.express)
+            res = self.express * other.express
         elif isinstance(other, (int, RingElement)):  #!# check
-            res = simplify_chain(self.express * other)
+            res = self.express * other
         else:
             return other.__rmul__(self)
-        if res == 0:
-            return self.chart.zero_function
-        else:
-            return FunctionChart(self.chart, res)
+        return self._new_from_expr(res)
 
     def __rmul__(self, other):
         r"""
@@ -1319,17 +1671,14 @@ class FunctionChart(SageObject):
                                 "chart cannot be divided.")
             if isinstance(other, ZeroFunctionChart):
                 raise ZeroDivisionError("Division of a FunctionChart by zero.")
-            res = simplify_chain(self.express / other.express)
+            res = self.express / other.express
         elif isinstance(other, (int, RingElement)):  #!# check
-            res = simplify_chain(self.express / other)
+            res = self.express / other
         else:
             if other == 0:
                 raise ZeroDivisionError("Division of a FunctionChart by zero.")
             return other.__rdiv__(self)
-        if res == 0:
-            return self.chart.zero_function
-        else:
-            return FunctionChart(self.chart, res)
+        return self._new_from_expr(res)
 
     def __rdiv__(self, other):
         r"""
@@ -1337,8 +1686,7 @@ class FunctionChart(SageObject):
         
         """
         #!# to be improved
-        res = simplify_chain(other / self.express)
-        return FunctionChart(self.chart, res)
+        return self._new_from_expr(other / self.express)
 
 
     def __idiv__(self, other):
@@ -1948,6 +2296,20 @@ class MultiFunctionChart(SageObject):
         OUTPUT:
         
         - the values of the `m` functions.   
+        
+        For floating-point coordinates, each function is evaluated via a 
+        compiled version of its expression, as in 
+        :meth:`FunctionChart.__call__`.
+        
+        EXAMPLE::
+        
+            sage: m = Manifold(2, 'M')
+            sage: c_xy.<x,y> = m.chart('x y') 
+            sage: f = MultiFunctionChart(c_xy, x-y, x*y)
+            sage: f(2, 3)
+            (-1, 6)
+            sage: f(2., 3.)
+            (-1.0, 6.0)
          
         """
         return tuple( self.functions[i](*coords) for i in range(self.nf) )
@@ -1991,7 +2353,8 @@ class MultiFunctionChart(SageObject):
         if self._jacob is None:
             self._jacob = [[ FunctionChart(self.chart, 
                             simplify_chain(diff(self.functions[i].express, 
-                                                self.chart.xx[j])) )
+                                                self.chart.xx[j]), 
+                                           self.chart._simplif_profile) )
                     for j in range(self.nc) ] for i in range(self.nf) ]
             self._jacob_matrix = matrix( [[ self._jacob[i][j].express 
                     for j in range(self.nc) ] for i in range(self.nf) ] )
@@ -2034,8 +2397,9 @@ class MultiFunctionChart(SageObject):
                 raise ValueError("The Jacobian matrix is not square.")
             self.jacobian() # to force the computation of self._jacob_matrix
             #!# the following is a workaround for a bug in Sage (cf. trac ticket #14403)
+            simplif = lambda x: simplify_chain(x, self.chart._simplif_profile)
             self._jacob_det = FunctionChart(self.chart, 
-                       simplify_chain(simple_determinant(self._jacob_matrix)) )
+                       simplif(simple_determinant(self._jacob_matrix, simplif)))
             # the proper writing should be this:
             # self._jacob_det = FunctionChart(self.chart, simplify_chain(self._jacob_matrix.det()) )
         return self._jacob_det
@@ -2123,18 +2487,17 @@ class CoordChange(SageObject):
         # Jacobian matrix is added to the dictionary of changes of frame:
         if chart1.domain == chart2.domain:
             domain = chart1.domain
-            for sdom in domain.superdomains:
-                sdom.coord_changes[(chart1, chart2)] = self
+            domain._set_change('coord_changes', (chart1, chart2), self)
             frame1 = chart1.frame
             frame2 = chart2.frame
             ch_basis = AutomorphismField(chart1.domain) 
             ch_basis.add_comp(frame1)[:, chart1] = self.jacobian
             ch_basis.add_comp(frame2)[:, chart1] = self.jacobian
-            for sdom in domain.superdomains:
-                sdom.frame_changes[(frame2, frame1)] = ch_basis
-            if (frame1, frame2) not in domain.frame_changes:
-                for sdom in domain.superdomains:
-                    sdom.frame_changes[(frame1, frame2)] = ch_basis.inverse()
+            domain._set_change('frame_changes', (frame2, frame1), ch_basis)
+            if (frame1, frame2) not in domain.frame_changes or \
+               (frame1, frame2) in domain._composed_frame_changes:
+                domain._set_change('frame_changes', (frame1, frame2), 
+                                   ch_basis.inverse())
 
     def _repr_(self):
         r"""
@@ -2223,7 +2586,8 @@ class CoordChange(SageObject):
                            for i in range(n1)]
         for i in range(n1):
             try:
-                inv_transf[i] = simplify_chain(inv_transf[i])
+                inv_transf[i] = simplify_chain(inv_transf[i], 
+                                               self.chart2._simplif_profile)
             except AttributeError:
                 pass        
         self._inverse = CoordChange(self.chart2, self.chart1, *inv_transf)
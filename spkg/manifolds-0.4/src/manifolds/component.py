@@ -14,6 +14,8 @@ Various subclasses of the class :class:`Components` are
   antisymmetric indices)
 * :class:`CompFullySym` for storing fully symmetric components.
 * :class:`CompFullyAntiSym` for storing fully antisymmetric components.
+* :class:`CompRiemannSym` for storing components with the symmetries of the 
+  Riemann curvature tensor.
 * :class:`KroneckerDelta` for the Kronecker delta symbol. 
 
 
@@ -126,6 +128,42 @@ from sage.structure.sage_object import SageObject
 from sage.rings.integer import Integer
 from vectorframe import VectorFrame
 
+# Cache of the permutations of range(n) together with their signs, for the
+# (anti)symmetrization of components (see _permutations_with_signs):
+_permutations_with_signs_cache = {}
+
+def _permutations_with_signs(n):
+    r"""
+    Return the permutations of `\{0,1,\ldots,n-1\}`, as tuples, together
+    with their signs. 
+    
+    The result is computed only once for a given `n` and stored in a 
+    module-level cache. 
+    
+    INPUT:
+    
+    - ``n`` -- number of elements permuted
+    
+    OUTPUT:
+    
+    - tuple of pairs ``(perm, sign)``, where ``perm`` is a tuple of length `n`
+      and ``sign`` is `\pm 1` 
+    
+    """
+    if n not in _permutations_with_signs_cache:
+        from itertools import permutations
+        result = []
+        for perm in permutations(range(n)):
+            sign = 1
+            for i in range(n):
+                for j in range(i+1, n):
+                    if perm[i] > perm[j]:
+                        sign = -sign
+            result.append((perm, sign))
+        _permutations_with_signs_cache[n] = tuple(result)
+    return _permutations_with_signs_cache[n]
+
+
 
 class Components(SageObject):
     r"""
@@ -609,6 +647,10 @@ class Components(SageObject):
         else: 
             # Case where indices is a set of indices
             ind = self._check_indices(indices)
+            if isinstance(value, (ScalarField, FunctionChart)):
+                # possibly deferred simplification (cf. 
+                # Chart.defer_simplification):
+                value._simplify_deferred()
             if value == 0:   #!# is_zero() instead ?
                 # if the component has been set previously, it is deleted,
                 # otherwise nothing is done:
@@ -885,6 +927,9 @@ class Components(SageObject):
         if other.frame != self.frame:
             raise TypeError("The two sets of components are not defined on " +
                             "the same vector frame.")
+        if isinstance(other, CompRiemannSym):
+            # to deal properly with the pair symmetry:
+            return self * other._comp_with_sym()
         if isinstance(other, CompWithSym):
             sym = []
             if other.sym != []:
@@ -1089,21 +1134,35 @@ class Components(SageObject):
             return result
 
 
-    def contract(self, pos1, other, pos2):
+    def contract(self, *args):
         r""" 
         Index contraction with another instance of :class:`Components`. 
         
+        The contraction is performed directly on the components of ``self`` 
+        and ``other``, without forming their tensor product: only the 
+        components of the result are computed (the non-redundant ones if the
+        result has some symmetries). 
+        
         INPUT:
             
-        - ``pos1`` -- position of the first index (in ``self``) for the 
-          contraction
+        - ``pos1`` -- position(s) of the indices in ``self`` involved in the 
+          contraction, with the convention position=0 for the first index;
+          if none is provided, a single contraction on the last index 
+          position of ``self`` is assumed
         - ``other`` -- the set of components to contract with
-        - ``pos2`` -- position of the second index (in ``other``) for the 
-          contraction
+        - ``pos2`` -- position(s) of the indices in ``other`` involved in the 
+          contraction, with the same conventions as for ``pos1``; if none is
+          provided, a single contraction on the first index position of 
+          ``other`` is assumed
           
         OUTPUT:
         
-        - set of components resulting from the (pos1, pos2) contraction
+        - set of components resulting from the contraction, the indices of 
+          ``self`` that are not contracted coming first, followed by those of
+          ``other``; the symmetries and antisymmetries of ``self`` and 
+          ``other`` that do not involve contracted indices are kept in the 
+          result
+        - a scalar field if all the indices are contracted
        
         EXAMPLES:
 
@@ -1126,17 +1185,170 @@ class Components(SageObject):
             [14, 32, 50]
             sage: [sum(a[j]*c[i,j] for j in m.irange()) for i in m.irange()]  # check
             [14, 32, 50]
+            
+        The default positions are the last index of ``self`` and the first 
+        index of ``other``::
+        
+            sage: a.contract(c)[:] == s[:]
+            True
+            
+        Contraction on two indices::
+        
+            sage: b = a*c ; b
+            3-indices components w.r.t. the vector frame (M, (e_0,e_1,e_2))
+            sage: s = b.contract(1,2, c, 0,1) ; s
+            1-index components w.r.t. the vector frame (M, (e_0,e_1,e_2))
+            sage: s[:]
+            [285, 570, 855]
+            sage: [sum(sum(b[i,j,k]*c[j,k] for k in m.irange()) for j in m.irange()) for i in m.irange()] # check
+            [285, 570, 855]
+            sage: c.contract(0,1, c, 1,0).expr()  # full contraction
+            261
+            
+        The symmetries not involved in the contraction are preserved::
+        
+            sage: f = CompFullyAntiSym(e, 2)
+            sage: f[0,1], f[0,2], f[1,2] = (4, 5, 6)
+            sage: s = c.contract(1, a*f, 0) ; s
+            3-indices components w.r.t. the vector frame (M, (e_0,e_1,e_2)), with antisymmetry on the index positions (1, 2)
+            sage: s == (c*(a*f)).self_contract(1, 2)  # check
+            True
 
         """
-        if not isinstance(other, Components):
+        from scalarfield import ZeroScalarField
+        #
+        # Treatment of the input
+        #
+        nargs = len(args)
+        for i, arg in enumerate(args):
+            if isinstance(arg, Components):
+                other = arg
+                it = i
+                break
+        else:
             raise TypeError("For the contraction, other must be an instance " +
                             "of Components.")
-        if pos1 < 0 or pos1 > self.nid - 1:
-            raise IndexError("pos1 out of range.")
-        if pos2 < 0 or pos2 > other.nid - 1:
-            raise IndexError("pos2 out of range.")
-        return (self*other).self_contract(pos1, 
-                                          pos2+self.nid) #!# correct but not optimal
+        if it == 0:
+            pos1 = (self.nid - 1,)
+        else:
+            pos1 = tuple(args[:it])
+        if it == nargs-1:
+            pos2 = (0,)
+        else:
+            pos2 = tuple(args[it+1:])
+        ncontr = len(pos1) # number of contractions
+        if len(pos2) != ncontr:
+            raise TypeError("Different number of indices for the contraction.")
+        for pos in pos1:
+            if pos < 0 or pos > self.nid - 1:
+                raise IndexError("pos1 out of range.")
+        for pos in pos2:
+            if pos < 0 or pos > other.nid - 1:
+                raise IndexError("pos2 out of range.")
+        if len(set(pos1)) != ncontr or len(set(pos2)) != ncontr:
+            raise IndexError("The same index position appears more than " + 
+                             "once in the contraction.")
+        if other.frame != self.frame:
+            raise TypeError("The two sets of components are not defined on " +
+                            "the same vector frame.")
+        contractions = [(pos1[i], pos2[i]) for i in range(ncontr)]
+        res_nid = self.nid + other.nid - 2*ncontr
+        # Generator of the values taken by the contracted indices:
+        contr_indices = list(self.manifold.index_generator(ncontr))
+        #
+        # Special case of a scalar result
+        #
+        if res_nid == 0:
+            ind_s = [None for i in range(self.nid)]
+            ind_o = [None for i in range(other.nid)]
+            res = 0
+            for ind_c in contr_indices:
+                for k, (p_s, p_o) in enumerate(contractions):
+                    ind_s[p_s] = ind_c[k]
+                    ind_o[p_o] = ind_c[k]
+                val_s = self[[ind_s]]
+                if isinstance(val_s, ZeroScalarField):
+                    continue
+                val_o = other[[ind_o]]
+                if isinstance(val_o, ZeroScalarField):
+                    continue
+                res += val_s * val_o
+            if isinstance(res, (int, Integer)):
+                # no non-vanishing term in the sum
+                return self.domain.zero_scalar_field
+            return res
+        #
+        # Positions of the free indices of self and other in the result
+        # (None = the position is involved in a contraction)
+        #
+        pos_s = [None for i in range(self.nid)]
+        pos_o = [None for i in range(other.nid)]
+        shift = 0
+        for pos in range(self.nid):
+            if pos in pos1:
+                shift += 1
+            else:
+                pos_s[pos] = pos - shift
+        for pos in range(other.nid):
+            if pos in pos2:
+                shift += 1
+            else:
+                pos_o[pos] = self.nid + pos - shift
+        #
+        # Symmetries of the result
+        #
+        res_sym = []
+        res_antisym = []
+        for comp, pos_res in ((self, pos_s), (other, pos_o)):
+            if isinstance(comp, CompWithSym):
+                for isym in comp.sym:
+                    r_isym = tuple(pos_res[pos] for pos in isym 
+                                   if pos_res[pos] is not None)
+                    if len(r_isym) > 1:
+                        res_sym.append(r_isym)
+                for isym in comp.antisym:
+                    r_isym = tuple(pos_res[pos] for pos in isym 
+                                   if pos_res[pos] is not None)
+                    if len(r_isym) > 1:
+                        res_antisym.append(r_isym)
+        if res_sym == [] and res_antisym == []:
+            result = Components(self.frame, res_nid)
+        elif len(res_sym) == 1 and len(res_sym[0]) == res_nid:
+            result = CompFullySym(self.frame, res_nid)
+        elif len(res_antisym) == 1 and len(res_antisym[0]) == res_nid:
+            result = CompFullyAntiSym(self.frame, res_nid)
+        else:
+            result = CompWithSym(self.frame, res_nid, sym=res_sym, 
+                                 antisym=res_antisym)
+        #
+        # Computation of the independent components of the result
+        #
+        free_s = [(pos, pos_s[pos]) for pos in range(self.nid) 
+                  if pos_s[pos] is not None]
+        free_o = [(pos, pos_o[pos]) for pos in range(other.nid) 
+                  if pos_o[pos] is not None]
+        ind_s = [None for i in range(self.nid)]
+        ind_o = [None for i in range(other.nid)]
+        for ind in result.non_redundant_index_generator():
+            for pos, pos_res in free_s:
+                ind_s[pos] = ind[pos_res]
+            for pos, pos_res in free_o:
+                ind_o[pos] = ind[pos_res]
+            res = 0
+            for ind_c in contr_indices:
+                for k, (p_s, p_o) in enumerate(contractions):
+                    ind_s[p_s] = ind_c[k]
+                    ind_o[p_o] = ind_c[k]
+                val_s = self[[ind_s]]
+                if isinstance(val_s, ZeroScalarField):
+                    continue
+                val_o = other[[ind_o]]
+                if isinstance(val_o, ZeroScalarField):
+                    continue
+                res += val_s * val_o
+            if not isinstance(res, (int, Integer, ZeroScalarField)):
+                result[[ind]] = res
+        return result
 
     def non_redundant_index_generator(self):
         r"""
@@ -1182,6 +1394,71 @@ class Components(SageObject):
         for ind in self.manifold.index_generator(self.nid):
             yield ind
 
+    def non_redundant_index_count(self):
+        r"""
+        Number of indices generated by :meth:`non_redundant_index_generator`.
+        
+        In the absence of declared symmetries, this is simply `n^p`, where 
+        `n` is the manifold's dimension and `p` the number of indices.  
+        
+        EXAMPLE::
+        
+            sage: m = Manifold(3, 'M')
+            sage: c_xyz = m.chart('x y z')
+            sage: c = Components(m.default_frame(), 2)
+            sage: c.non_redundant_index_count()
+            9
+            
+        """
+        return Integer(self.manifold.dim)**self.nid
+
+    def _permutation_average(self, ind, pos, antisym=False):
+        r"""
+        Average of the components obtained by permuting the indices ``ind``
+        at the positions ``pos``, each term being multiplied by the sign of
+        the permutation if ``antisym`` is ``True``. 
+        
+        The permuted indices are grouped according to the stored components 
+        they correspond to, so that each distinct component of ``self`` is
+        read only once, with its multiplicity. 
+        
+        """
+        n_sym = len(pos)
+        perms = _permutations_with_signs(n_sym)
+        values = [ind[p] for p in pos]
+        if antisym and len(set(values)) != n_sym:
+            return 0   # repeated indices in an antisymmetrization
+        # Multiplicity of each distinct permuted index:
+        multiplicities = {}
+        for perm, sign in perms:
+            ind_perm = list(ind)
+            for k in range(n_sym):
+                ind_perm[pos[perm[k]]] = values[k]
+            ind_perm = tuple(ind_perm)
+            if antisym:
+                multiplicities[ind_perm] = multiplicities.get(ind_perm, 0) + sign
+            else:
+                multiplicities[ind_perm] = multiplicities.get(ind_perm, 0) + 1
+        # Weight of each stored component:
+        weights = {}
+        if isinstance(self, CompWithSym):
+            for ind_perm, mult in multiplicities.iteritems():
+                sign, key = self._ordered_indices(ind_perm)
+                if sign != 0:
+                    weights[key] = weights.get(key, 0) + sign*mult
+        else:
+            weights = multiplicities
+        res = 0
+        for key, weight in weights.iteritems():
+            if weight != 0 and key in self._comp:
+                if weight == 1:
+                    res += self._comp[key]
+                elif weight == -1:
+                    res -= self._comp[key]
+                else:
+                    res += weight * self._comp[key]
+        return res / Integer(len(perms))
+
     def symmetrize(self, pos=None):
         r"""
         Symmetrization over the given index positions
@@ -1253,7 +1530,6 @@ class Components(SageObject):
               [[19, 21, 23], [21, 23, 25], [23, 25, 27]]])
 
         """
-        from sage.groups.perm_gps.permgroup_named import SymmetricGroup
         if pos is None:
             pos = range(self.nid)
         else:
@@ -1267,28 +1543,8 @@ class Components(SageObject):
             result = CompFullySym(self.frame, self.nid)
         else:
             result = CompWithSym(self.frame, self.nid, sym=pos)
-        sym_group = SymmetricGroup(n_sym)
         for ind in result.non_redundant_index_generator():
-            sum = 0
-            #!# try/except to deal with the change list() --> domain() which
-            #   occurred in Sage 5.10:
-            try:
-                for perm in sym_group.list():
-                    # action of the permutation on [0,1,...,n_sym-1]:
-                    perm_action = map(lambda x: x-1, perm.domain())
-                    ind_perm = list(ind)
-                    for k in range(n_sym):
-                        ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                    sum += self[[ind_perm]]
-            except AttributeError:
-                 for perm in sym_group.list():
-                    # action of the permutation on [0,1,...,n_sym-1]:
-                    perm_action = map(lambda x: x-1, perm.list())
-                    ind_perm = list(ind)
-                    for k in range(n_sym):
-                        ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                    sum += self[[ind_perm]]               
-            result[[ind]] = sum / sym_group.order()
+            result[[ind]] = self._permutation_average(ind, pos)
         return result
 
             
@@ -1386,7 +1642,6 @@ class Components(SageObject):
             True
 
         """
-        from sage.groups.perm_gps.permgroup_named import SymmetricGroup
         if pos is None:
             pos = range(self.nid)
         else:
@@ -1400,34 +1655,8 @@ class Components(SageObject):
             result = CompFullyAntiSym(self.frame, self.nid)
         else:
             result = CompWithSym(self.frame, self.nid, antisym=pos)
-        sym_group = SymmetricGroup(n_sym)
         for ind in result.non_redundant_index_generator():
-            sum = 0 
-            #!# try/except to deal with the change list() --> domain() which
-            #   occurred in Sage 5.10:
-            try:
-                for perm in sym_group.list():
-                    # action of the permutation on [0,1,...,n_sym-1]:
-                    perm_action = map(lambda x: x-1, perm.domain())
-                    ind_perm = list(ind)
-                    for k in range(n_sym):
-                        ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                    if perm.sign() == 1:
-                        sum += self[[ind_perm]]
-                    else:
-                        sum -= self[[ind_perm]]
-            except AttributeError:
-                for perm in sym_group.list():
-                    # action of the permutation on [0,1,...,n_sym-1]:
-                    perm_action = map(lambda x: x-1, perm.list())
-                    ind_perm = list(ind)
-                    for k in range(n_sym):
-                        ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                    if perm.sign() == 1:
-                        sum += self[[ind_perm]]
-                    else:
-                        sum -= self[[ind_perm]]
-            result[[ind]] = sum / sym_group.order()
+            result[[ind]] = self._permutation_average(ind, pos, antisym=True)
         return result
 
     def tensor_field(self, tensor_type, name=None, latex_name=None):
@@ -1492,6 +1721,8 @@ class CompWithSym(Components):
     
     * :class:`CompFullySym` for storing fully symmetric components.
     * :class:`CompFullyAntiSym` for storing fully antisymmetric components.
+    * :class:`CompRiemannSym` for storing components with the symmetries of
+      the Riemann curvature tensor.
 
     
     INPUT:
@@ -1766,6 +1997,10 @@ class CompWithSym(Components):
         else: 
             # Case where indices is a set of indices
             sign, ind = self._ordered_indices(indices)
+            if isinstance(value, (ScalarField, FunctionChart)):
+                # possibly deferred simplification (cf. 
+                # Chart.defer_simplification):
+                value._simplify_deferred()
             if sign == 0:
                 if value != 0:
                     raise ValueError(
@@ -1888,6 +2123,9 @@ class CompWithSym(Components):
         if other.frame != self.frame:
             raise TypeError("The two sets of components are not defined on " +
                             "the same vector frame.")
+        if isinstance(other, CompRiemannSym) and \
+                                        not isinstance(self, CompRiemannSym):
+            return other + self     # to deal properly with the pair symmetry
         if isinstance(other, CompWithSym):
             # Are the symmetries of the same type ?
             diff_sym = set(self.sym).symmetric_difference(set(other.sym))
@@ -1950,6 +2188,9 @@ class CompWithSym(Components):
         if other.frame != self.frame:
             raise TypeError("The two sets of components are not defined on " +
                             "the same vector frame.")
+        if isinstance(other, CompRiemannSym):
+            # to deal properly with the pair symmetry:
+            return self * other._comp_with_sym()
         sym = list(self.sym)
         antisym = list(self.antisym)
         
@@ -2238,34 +2479,87 @@ class CompWithSym(Components):
         """
         si = self.manifold.sindex
         imax = self.manifold.dim - 1 + si
-        ind = [si for k in range(self.nid)]
-        ind_end = [si for k in range(self.nid)]
-        ind_end[0] = imax+1
-        while ind != ind_end:
-            ordered = True
-            for isym in self.sym:
-                for k in range(len(isym)-1):
-                    if ind[isym[k+1]] < ind[isym[k]]:
-                        ordered = False
-                        break                
-            for isym in self.antisym:
-                for k in range(len(isym)-1):
-                    if ind[isym[k+1]] <= ind[isym[k]]:
-                        ordered = False
-                        break
-            if ordered:
+        nid = self.nid
+        # For each index position, symmetry group it belongs to, rank in the
+        # group and minimal step between consecutive indices in the group 
+        # (0 for a symmetry, 1 for an antisymmetry):
+        groups = [None for pos in range(nid)]
+        for isym in self.sym:
+            for r, pos in enumerate(isym):
+                groups[pos] = (isym, r, 0)
+        for isym in self.antisym:
+            for r, pos in enumerate(isym):
+                groups[pos] = (isym, r, 1)
+        def bounds(p, ind):
+            # Range of the index at position p, given the indices at the 
+            # positions < p (the range is never empty if p is the first
+            # position of its group and the dimension is large enough):
+            if groups[p] is None:
+                return (si, imax)
+            isym, r, step = groups[p]
+            lo = si + step*r
+            for rr in range(r-1, -1, -1):
+                if isym[rr] < p:
+                    lo = ind[isym[rr]] + step*(r-rr)
+                    break
+            hi = imax - step*(len(isym)-1-r)
+            for rr in range(r+1, len(isym)):
+                if isym[rr] < p:
+                    hi = ind[isym[rr]] - step*(rr-r)
+                    break
+            return (lo, hi)
+        # Only ordered indices are generated, in lexicographic order:
+        ind = [si for pos in range(nid)]
+        ind_max = [imax for pos in range(nid)]
+        ind[0], ind_max[0] = bounds(0, ind)
+        p = 0
+        while True:
+            if ind[p] > ind_max[p]:
+                # all the values at position p have been considered
+                p -= 1
+                if p < 0:
+                    break
+                ind[p] += 1
+            elif p == nid - 1:
                 yield tuple(ind)
-            ret = 1
-            for pos in range(self.nid-1,-1,-1):
-                if ind[pos] != imax:
-                    ind[pos] += ret
-                    ret = 0
-                elif ret == 1:
-                    if pos == 0:
-                        ind[pos] = imax + 1 # end point reached
-                    else:
-                        ind[pos] = si
-                        ret = 1
+                ind[p] += 1
+            else:
+                p += 1
+                ind[p], ind_max[p] = bounds(p, ind)
+
+    def non_redundant_index_count(self):
+        r"""
+        Number of indices generated by :meth:`non_redundant_index_generator`,
+        computed without running the generator. 
+        
+        EXAMPLES:
+        
+        Counts on a 4-dimensional manifold::
+        
+            sage: m = Manifold(4, 'M')
+            sage: c_xyzt = m.chart('x y z t')
+            sage: CompFullySym(m.default_frame(), 4).non_redundant_index_count()
+            35
+            sage: CompFullyAntiSym(m.default_frame(), 4).non_redundant_index_count()
+            1
+            sage: c = CompWithSym(m.default_frame(), 4, sym=(0,1), antisym=(2,3))
+            sage: c.non_redundant_index_count()
+            60
+            sage: c.non_redundant_index_count() == len(list(c.non_redundant_index_generator()))
+            True
+
+        """
+        from sage.rings.arith import binomial
+        n = self.manifold.dim
+        nb_free = self.nid
+        res = Integer(1)
+        for isym in self.sym:
+            res *= binomial(n + len(isym) - 1, len(isym))
+            nb_free -= len(isym)
+        for isym in self.antisym:
+            res *= binomial(n, len(isym))
+            nb_free -= len(isym)
+        return res * n**nb_free
 
     def symmetrize(self, pos=None):
         r"""
@@ -2361,7 +2655,6 @@ class CompWithSym(Components):
             True
 
         """
-        from sage.groups.perm_gps.permgroup_named import SymmetricGroup
         if pos is None:
             pos = range(self.nid)
         else:
@@ -2437,29 +2730,8 @@ class CompWithSym(Components):
         #
         # Symmetrization
         #
-        n_sym = len(pos) # number of indices involved in the symmetry
-        sym_group = SymmetricGroup(n_sym)
         for ind in result.non_redundant_index_generator():
-            sum = 0 
-            #!# try/except to deal with the change list() --> domain() which
-            #   occurred in Sage 5.10:
-            try:
-                for perm in sym_group.list():
-                    # action of the permutation on [0,1,...,n_sym-1]:
-                    perm_action = map(lambda x: x-1, perm.domain())
-                    ind_perm = list(ind)
-                    for k in range(n_sym):
-                        ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                    sum += self[[ind_perm]]
-            except AttributeError:
-                for perm in sym_group.list():
-                    # action of the permutation on [0,1,...,n_sym-1]:
-                    perm_action = map(lambda x: x-1, perm.list())
-                    ind_perm = list(ind)
-                    for k in range(n_sym):
-                        ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                    sum += self[[ind_perm]]
-            result[[ind]] = sum / sym_group.order()
+            result[[ind]] = self._permutation_average(ind, pos)
         return result
 
 
@@ -2571,7 +2843,6 @@ class CompWithSym(Components):
             1/2*z^2 - 7/2*y
 
         """
-        from sage.groups.perm_gps.permgroup_named import SymmetricGroup
         if pos is None:
             pos = range(self.nid)
         else:
@@ -2649,35 +2920,8 @@ class CompWithSym(Components):
         #
         # Antisymmetrization
         #
-        n_sym = len(pos) # number of indices involved in the antisymmetry
-        sym_group = SymmetricGroup(n_sym)
         for ind in result.non_redundant_index_generator():
-            sum = 0 
-            #!# try/except to deal with the change list() --> domain() which
-            #   occurred in Sage 5.10:
-            try:
-                for perm in sym_group.list():
-                    # action of the permutation on [0,1,...,n_sym-1]:
-                    perm_action = map(lambda x: x-1, perm.domain())
-                    ind_perm = list(ind)
-                    for k in range(n_sym):
-                        ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                    if perm.sign() == 1:
-                        sum += self[[ind_perm]]
-                    else:
-                        sum -= self[[ind_perm]]
-            except AttributeError:
-                for perm in sym_group.list():
-                    # action of the permutation on [0,1,...,n_sym-1]:
-                    perm_action = map(lambda x: x-1, perm.list())
-                    ind_perm = list(ind)
-                    for k in range(n_sym):
-                        ind_perm[pos[perm_action[k]]] = ind[pos[k]]
-                    if perm.sign() == 1:
-                        sum += self[[ind_perm]]
-                    else:
-                        sum -= self[[ind_perm]]
-            result[[ind]] = sum / sym_group.order()
+            result[[ind]] = self._permutation_average(ind, pos, antisym=True)
         return result
 
     def tensor_field(self, tensor_type, name=None, latex_name=None):
@@ -2838,6 +3082,10 @@ class CompFullySym(CompWithSym):
         else: 
             # Case where indices is a set of indices
             ind = self._ordered_indices(indices)[1]  # [0]=sign is not used
+            if isinstance(value, (ScalarField, FunctionChart)):
+                # possibly deferred simplification (cf. 
+                # Chart.defer_simplification):
+                value._simplify_deferred()
             if value == 0:
                 # if the component has been set previously it is deleted, 
                 # otherwise nothing is done: 
@@ -3029,6 +3277,207 @@ class CompFullyAntiSym(CompWithSym):
         return result
 
             
+#******************************************************************************
+
+class CompRiemannSym(CompWithSym):
+    r"""
+    Class for storing 4-indices components with respect to a given vector 
+    frame on a differentiable manifold over `\RR`, having the symmetries of 
+    the fully covariant Riemann curvature tensor of a metric: 
+    
+    .. MATH::
+    
+        T_{abcd} = - T_{bacd} = - T_{abdc} = T_{cdab}
+        
+    Only the components with `a<b`, `c<d` and `(a,b)\leq(c,d)` 
+    (lexicographic order) are stored, i.e. `m(m+1)/2` components, with 
+    `m = n(n-1)/2`, `n` being the manifold's dimension (21 components for 
+    `n=4`, instead of 36 for a mere antisymmetry in `(a,b)` and `(c,d)`).
+    
+    INPUT:
+    
+    - ``frame`` -- vector frame with respect to which the components are 
+      defined
+      
+    EXAMPLES:
+    
+    Components on a 4-dimensional manifold::
+    
+        sage: m = Manifold(4, 'M')
+        sage: c_txyz.<t,x,y,z> = m.chart('t x y z')
+        sage: r = CompRiemannSym(m.default_frame()) ; r
+        4-indices components w.r.t. the coordinate frame (M, (d/dt,d/dx,d/dy,d/dz)), with the symmetries of the Riemann tensor
+        sage: r[0,1,0,1], r[2,3,0,1] = t, x*y
+        sage: r[0,1,2,3], r[1,0,2,3], r[0,1,3,2], r[3,2,1,0]
+        (x*y, -x*y, -x*y, x*y)
+        sage: r[1,0,1,0]
+        t
+        sage: sorted(r._comp.keys())  # only the independent components are stored
+        [(0, 1, 0, 1), (0, 1, 2, 3)]
+        sage: r.non_redundant_index_count()
+        21
+        sage: len(list(r.non_redundant_index_generator()))
+        21
+        
+    The operations that do not preserve the pair symmetry return generic 
+    components::
+    
+        sage: r.swap_adjacent_indices(0,1,2)
+        4-indices components w.r.t. the coordinate frame (M, (d/dt,d/dx,d/dy,d/dz)), with antisymmetry on the index positions (0, 1), with antisymmetry on the index positions (2, 3)
+        sage: s = r + r ; s
+        4-indices components w.r.t. the coordinate frame (M, (d/dt,d/dx,d/dy,d/dz)), with the symmetries of the Riemann tensor
+        sage: s[2,3,0,1]
+        2*x*y
+        
+    The tensor products take into account the pair symmetry, whatever the 
+    position of ``r``::
+    
+        sage: c = Components(m.default_frame(), 1)
+        sage: c[0] = 2
+        sage: p = c * r
+        sage: p[0,2,3,0,1], p[0,0,1,2,3]
+        (2*x*y, 2*x*y)
+        sage: q = r * c
+        sage: q[2,3,0,1,0], q[0,1,2,3,0]
+        (2*x*y, 2*x*y)
+        sage: (r * r)[2,3,0,1,0,1,0,1]
+        t*x*y
+
+    """
+    def __init__(self, frame):
+        CompWithSym.__init__(self, frame, 4, antisym=[(0,1), (2,3)])
+
+    def _repr_(self):
+        r"""
+        Special Sage function for the string representation of the object.
+        """
+        return "4-indices components w.r.t. the " + str(self.frame) + \
+               ", with the symmetries of the Riemann tensor"
+
+    def _new_instance(self):
+        r"""
+        Creates a :class:`CompRiemannSym` instance w.r.t. the same vector 
+        frame.
+        
+        """
+        return CompRiemannSym(self.frame)
+
+    def _ordered_indices(self, indices):
+        r"""
+        Given a set of indices, returns the set of indices of the stored 
+        component, as well as some antisymmetry indicator. 
+        
+        See :meth:`CompWithSym._ordered_indices` for details; the two pairs
+        of indices are in addition exchanged if the second pair precedes the 
+        first one. 
+        
+        """
+        sign, ind = CompWithSym._ordered_indices(self, indices)
+        if sign != 0 and ind[2:] < ind[:2]:
+            ind = ind[2:] + ind[:2]
+        return (sign, ind)
+
+    def non_redundant_index_generator(self):
+        r"""
+        Generator of the indices `(a,b,c,d)` of the independent components, 
+        i.e. with `a<b`, `c<d` and `(a,b)\leq(c,d)`. 
+        
+        """
+        for ind in CompWithSym.non_redundant_index_generator(self):
+            if ind[:2] <= ind[2:]:
+                yield ind
+
+    def non_redundant_index_count(self):
+        r"""
+        Number of indices generated by :meth:`non_redundant_index_generator`,
+        computed without running the generator. 
+        
+        """
+        from sage.rings.arith import binomial
+        m = binomial(self.manifold.dim, 2)
+        return m*(m+1)/2
+
+    def _comp_with_sym(self):
+        r"""
+        Return the same components as an instance of :class:`CompWithSym`,
+        antisymmetric with respect to the index positions (0,1) and (2,3), 
+        the pair symmetry being taken into account only in the values.  
+        
+        """
+        result = CompWithSym(self.frame, 4, antisym=self.antisym)
+        for ind, val in self._comp.items():
+            result._comp[ind] = val
+            swap_ind = ind[2:] + ind[:2]
+            if swap_ind != ind:
+                result._comp[swap_ind] = val.copy()
+        return result
+
+    def swap_adjacent_indices(self, pos1, pos2, pos3):
+        r"""
+        Swap two adjacent sets of indices (see 
+        :meth:`CompWithSym.swap_adjacent_indices`).
+        
+        """
+        return self._comp_with_sym().swap_adjacent_indices(pos1, pos2, pos3)
+
+    def __add__(self, other):
+        r"""
+        Component addition. 
+        
+        INPUT:
+        
+        - ``other`` -- components of the same number of indices and defined
+          on the same frame as ``self``
+        
+        OUTPUT:
+        
+        - components resulting from the addition of ``self`` and ``other``
+        
+        """
+        if isinstance(other, CompRiemannSym):
+            return CompWithSym.__add__(self, other)
+        if other == 0:
+            return +self
+        return self._comp_with_sym() + other
+
+    def __mul__(self, other):
+        r"""
+        Component tensor product (see :meth:`CompWithSym.__mul__`).
+        
+        """
+        return self._comp_with_sym() * other
+
+    def self_contract(self, pos1, pos2):
+        r""" 
+        Index contraction (see :meth:`CompWithSym.self_contract`).
+        
+        """
+        return self._comp_with_sym().self_contract(pos1, pos2)
+
+    def mtrace(self, lpos1, lpos2):
+        r"""
+        Multiple index contraction (see :meth:`Components.mtrace`).
+        
+        """
+        return self._comp_with_sym().mtrace(lpos1, lpos2)
+
+    def symmetrize(self, pos=None):
+        r"""
+        Symmetrization over the given index positions (see 
+        :meth:`CompWithSym.symmetrize`).
+        
+        """
+        return self._comp_with_sym().symmetrize(pos)
+
+    def antisymmetrize(self, pos=None):
+        r"""
+        Antisymmetrization over the given index positions (see 
+        :meth:`CompWithSym.antisymmetrize`).
+        
+        """
+        return self._comp_with_sym().antisymmetrize(pos)
+
+            
 #******************************************************************************
 
 class KroneckerDelta(CompFullySym):
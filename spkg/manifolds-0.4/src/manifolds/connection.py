@@ -24,7 +24,7 @@ AUTHORS:
 
 from sage.structure.sage_object import SageObject
 from domain import Domain
-from component import Components, CompWithSym, CompFullySym
+from component import Components, CompWithSym, CompFullySym, CompRiemannSym
 from tensorfield import TensorField
 from diffform import DiffForm, OneForm
 
@@ -159,17 +159,43 @@ class AffConnection(SageObject):
         self._connection_forms = {}
         self._torsion_forms = {}
         self._curvature_forms = {}
+        # frames in which the torsion and Riemann tensors have been computed:
+        self._derived_frames = {}
 
-    def _del_derived(self):
+    def _del_derived(self, frame=None):
         r"""
         Delete the derived quantities
+        
+        INPUT:
+        
+        - ``frame`` -- (default: None) vector frame in which the connection 
+          coefficients have been modified, those in other frames being 
+          unchanged; if None, the connection is considered as modified in 
+          all frames. Only the quantities computed from the coefficients in 
+          ``frame`` are then deleted.  
+        
         """
-        self._torsion = None
-        self._riemann = None
-        self._ricci = None
-        self._connection_forms.clear()
-        self._torsion_forms.clear()
-        self._curvature_forms.clear()
+        from utilities import notify_dependents
+        if frame is None or frame is self._derived_frames.get('torsion'):
+            self._torsion = None
+            self._torsion_forms.clear()
+            self._derived_frames.pop('torsion', None)
+        if frame is None or frame is self._derived_frames.get('riemann') or \
+                            frame is self._derived_frames.get('ricci'):
+            if frame is None or frame is self._derived_frames.get('riemann'):
+                self._riemann = None
+                self._curvature_forms.clear()
+                self._derived_frames.pop('riemann', None)
+            self._ricci = None
+            self._derived_frames.pop('ricci', None)
+            # the objects depending on the curvature are informed:
+            notify_dependents(self)
+        if frame is None:
+            self._connection_forms.clear()
+        else:
+            for fr in self._connection_forms.keys():
+                if fr is frame or fr not in self.coefficients:
+                    del self._connection_forms[fr]
 
     def _new_coef(self, frame): 
         r"""
@@ -325,7 +351,9 @@ class AffConnection(SageObject):
                                  " has not been defined on the " + 
                                  str(self.domain))
             self.coefficients[frame] = self._new_coef(frame)
-        self._del_derived() # deletes the derived quantities
+        # deletes the derived quantities computed from the coefficients in
+        # frame:
+        self._del_derived(frame)
         return self.coefficients[frame]
 
 
@@ -530,13 +558,15 @@ class AffConnection(SageObject):
             manif = self.manifold
             dom = self.domain
             if frame is None:
-                if dom.def_frame in self.coefficients:
+                if dom.def_frame in self.coefficients or \
+                                                    self.coefficients == {}:
                     frame = dom.def_frame
                 else: # a random frame is picked
                     frame = self.coefficients.items()[0][0]
             gam = self.coef(frame)
             sc = frame.structure_coef()
             self._torsion = TensorField(dom, 1, 2, antisym=(1,2))   
+            self._derived_frames['torsion'] = frame
             res = self._torsion.set_comp(frame)
             for k in manif.irange():
                 for i in manif.irange():
@@ -600,12 +630,14 @@ class AffConnection(SageObject):
             manif = self.manifold
             dom = self.domain
             if frame is None:
-                if dom.def_frame in self.coefficients:
+                if dom.def_frame in self.coefficients or \
+                                                    self.coefficients == {}:
                     frame = dom.def_frame
                 else: # a random frame is picked
                     frame = self.coefficients.items()[0][0]
             ev = frame
             gam = self.coef(frame)
+            self._derived_frames['riemann'] = frame
             sc = ev.structure_coef()
             gam_gam = gam.contract(1, gam, 0)
             gam_sc = gam.contract(2, sc, 0)
@@ -1078,14 +1110,752 @@ class LeviCivitaConnection(AffConnection):
         """
         AffConnection._init_derived(self)
         self._ricci_scalar = None
-
-    def _del_derived(self):
+        self._riemann_down = None # fully covariant Riemann tensor
+        self._first_kind = {} # Christoffel symbols of the first kind
+        # quantities computed before the modification of some metric 
+        # components, to be updated incrementally (dictionary indexed by the 
+        # coordinate frames):
+        self._outdated = {}
+
+    def _del_derived(self, frame=None):
         r"""
         Delete the derived quantities
         """
-        AffConnection._del_derived(self)
+        AffConnection._del_derived(self, frame)
+        if self._riemann is None:
+            self._riemann_down = None
+        if self._ricci is None:
+            self._ricci_scalar = None
+        if frame is None:
+            self._outdated.clear()
+
+    def _source_modified(self, source, frame):
+        r"""
+        Delete the quantities computed from the components of the metric 
+        ``source`` in the vector frame ``frame`` (in all frames if ``frame``
+        is None). 
+        
+        This method is called by the metric when it is modified (see 
+        :func:`~sage.geometry.manifolds.utilities.add_dependent`).
+
+        If the modified metric components in ``frame`` have been recorded 
+        (see :meth:`Metric.__setitem__`), the Christoffel symbols (of both
+        kinds) and the curvature tensors in ``frame`` are kept aside, to be 
+        updated incrementally at the next computation. 
+        
+        """
+        from vectorframe import CoordFrame
+        from utilities import add_dependent
+        if frame is None:
+            self.coefficients.clear()
+            self._first_kind.clear()
+            self._outdated.clear()
+        else:
+            gam1 = self._first_kind.pop(frame, None)
+            if isinstance(frame, CoordFrame) and \
+               frame in source._modified_comp and \
+               (frame in self.coefficients or frame in self._outdated):
+                outdated = self._outdated.setdefault(frame, {})
+                if gam1 is not None:
+                    outdated['first_kind'] = gam1
+                if frame in self.coefficients:
+                    outdated['coef'] = self.coefficients[frame]
+                    if self._riemann is not None and \
+                       self._derived_frames.get('riemann') is frame:
+                        outdated['riemann'] = self._riemann.components[frame]
+                        outdated.pop('changed_coef', None)
+                        if self._ricci is not None and \
+                           frame in self._ricci.components:
+                            outdated['ricci'] = self._ricci.components[frame]
+                            outdated.pop('changed_riemann', None)
+                # the connection keeps track of the metric modifications 
+                # until the update:
+                add_dependent(source, self, frame)
+            else:
+                self._outdated.pop(frame, None)
+            # The Christoffel symbols in frame and the connection 
+            # coefficients in non-coordinate frames (computed from the 
+            # Christoffel symbols) are deleted: 
+            for fr in self.coefficients.keys():
+                if fr is frame or not isinstance(fr, CoordFrame):
+                    del self.coefficients[fr]
+        self._del_derived(frame)
+        # the Ricci scalar involves the inverse metric:
         self._ricci_scalar = None
 
+    def _update_christoffel(self, frame, gam_old, modified):
+        r"""
+        Update the Christoffel symbols in the coordinate frame ``frame`` 
+        after the modification of some metric components.
+        
+        Only the Christoffel symbols `\Gamma^i_{\ \, jk}` that depend on 
+        the modified components `g_{ab}` are recomputed, namely those with 
+        `(j,k)=(a,b)` and those for which the row `i` of the inverse metric 
+        may have changed, i.e. `i` belongs to the same block as `a` and `b` 
+        in the pattern of nonzero metric components. 
+        
+        INPUT:
+        
+        - ``frame`` -- coordinate frame 
+        - ``gam_old`` -- Christoffel symbols in ``frame`` before the 
+          modification
+        - ``modified`` -- set of non-redundant pairs of indices `(a,b)` of 
+          the modified metric components
+          
+        OUTPUT:
+        
+        - tuple ``(gam, changed)``, where ``gam`` are the updated Christoffel
+          symbols and ``changed`` the set of non-redundant indices of the 
+          recomputed ones
+        
+        """
+        from utilities import index_blocks
+        manif = self.manifold
+        gg = self.metric.comp(frame)
+        # Rows of the inverse metric that may have been modified:
+        pairs = [ind for ind in gg._comp if ind[0] != ind[1]]
+        pairs.extend(modified)
+        rows = set()
+        for block in index_blocks(manif.irange(), pairs):
+            for a, b in modified:
+                if a in block:
+                    rows.update(block)
+                    break
+        # The Christoffel symbols of the first kind computed before the 
+        # modification are updated:
+        outdated = self._outdated.get(frame, {})
+        if frame not in self._first_kind and 'first_kind' in outdated:
+            self._first_kind[frame] = self._update_first_kind(frame, 
+                                            outdated.pop('first_kind'), 
+                                            modified)
+        gam = gam_old.copy()
+        changed = set(ind for ind in gam.non_redundant_index_generator()
+                      if ind[0] in rows or ind[1:] in modified)
+        self._raise_first_kind(frame, gam, changed)
+        return gam, changed
+
+    def _christoffel_first_kind(self, frame):
+        r"""
+        Return the Christoffel symbols of the first kind in a coordinate 
+        frame. 
+        
+        The Christoffel symbols of the first kind are 
+        
+        .. MATH::
+        
+            \Gamma_{sjk} = \frac{1}{2} \left( \partial_j g_{sk} 
+                + \partial_k g_{js} - \partial_s g_{jk} \right)
+                
+        They are computed once for each `(s, j\leq k)`, from the nonzero 
+        partial derivatives of the nonzero metric components only, and are 
+        stored until the metric is modified; after the modification of a 
+        single component, only the symbols involving it are recomputed (see 
+        :meth:`_update_first_kind`). 
+        
+        INPUT:
+        
+        - ``frame`` -- coordinate frame
+        
+        OUTPUT:
+        
+        - the Christoffel symbols of the first kind, as an instance of 
+          :class:`~sage.geometry.manifolds.component.CompWithSym` with 3 
+          indices ordered as `(s,j,k)`
+          
+        EXAMPLE:
+        
+        Christoffel symbols of the first kind of the Euclidean metric in 
+        polar coordinates::
+        
+            sage: m = Manifold(2, 'R^2', start_index=1)
+            sage: c_pol.<r,ph> = m.chart(r'r:(0,+oo) ph:(0,2*pi):\phi')
+            sage: g = Metric(m, 'g')
+            sage: g[1,1], g[2,2] = 1, r^2
+            sage: nab = g.connection()
+            sage: nab._christoffel_first_kind(c_pol.frame)[:]
+            [[[0, 0], [0, -r]], [[0, r], [r, 0]]]
+
+        """
+        if frame not in self._first_kind:
+            gam1 = CompWithSym(frame, 3, sym=(1,2))
+            self._compute_first_kind(frame, gam1, 
+                                     gam1.non_redundant_index_generator())
+            self._first_kind[frame] = gam1
+        return self._first_kind[frame]
+
+    def _compute_first_kind(self, frame, gam1, indices):
+        r"""
+        Compute some Christoffel symbols of the first kind in a coordinate 
+        frame (see :meth:`_christoffel_first_kind`).
+        
+        Only the partial derivatives of the nonzero metric components that 
+        are involved in the requested symbols are computed. 
+        
+        INPUT:
+        
+        - ``frame`` -- coordinate frame
+        - ``gam1`` -- components where the Christoffel symbols of the first 
+          kind are stored
+        - ``indices`` -- iterable of the non-redundant indices `(s,j,k)`, 
+          with `j\leq k`, of the symbols to be computed
+        
+        """
+        chart = frame.chart
+        gg = self.metric.comp(frame)
+        # Nonzero partial derivatives of the nonzero metric components, 
+        # computed on demand:
+        dg = {}
+        def deriv(a, b, c):
+            if a > b:
+                a, b = b, a
+            if (a,b,c) not in dg:
+                dgab = None
+                if (a,b) in gg._comp:
+                    dgab = gg[a,b, chart].diff(c)
+                    if dgab.is_zero():
+                        dgab = None
+                dg[(a,b,c)] = dgab
+            return dg[(a,b,c)]
+        diagonal = self.metric.is_diagonal(frame)
+        for s, j, k in indices:
+            if diagonal and s != j and s != k and j != k:
+                # vanishing symbol for a diagonal metric
+                gam1[s,j,k, chart] = 0
+                continue
+            rsum = 0
+            dgab = deriv(s, k, j)
+            if dgab is not None:
+                rsum += dgab
+            dgab = deriv(j, s, k)
+            if dgab is not None:
+                rsum += dgab
+            dgab = deriv(j, k, s)
+            if dgab is not None:
+                rsum -= dgab
+            gam1[s,j,k, chart] = rsum / 2
+
+    def _update_first_kind(self, frame, gam1_old, modified):
+        r"""
+        Update the Christoffel symbols of the first kind in the coordinate 
+        frame ``frame`` after the modification of some metric components.
+        
+        Only the symbols `\Gamma_{sjk}` that involve a modified component 
+        `g_{ab}`, i.e. those with `\{s,k\}`, `\{j,s\}` or `(j,k)` equal 
+        to `(a,b)`, are recomputed. 
+        
+        INPUT:
+        
+        - ``frame`` -- coordinate frame 
+        - ``gam1_old`` -- Christoffel symbols of the first kind in ``frame`` 
+          before the modification
+        - ``modified`` -- set of non-redundant pairs of indices `(a,b)` of 
+          the modified metric components
+        
+        OUTPUT:
+        
+        - the updated Christoffel symbols of the first kind
+        
+        """
+        gam1 = gam1_old.copy()
+        indices = [(s,j,k) for s, j, k in gam1.non_redundant_index_generator()
+                   if (min(s,k), max(s,k)) in modified or 
+                      (min(j,s), max(j,s)) in modified or (j,k) in modified]
+        self._compute_first_kind(frame, gam1, indices)
+        return gam1
+
+    def _nonzero_inverse(self, frame):
+        r"""
+        Return, for each index `i`, the list of indices `s` such that the 
+        component `g^{is}` of the inverse metric in ``frame`` is nonzero.
+        
+        """
+        manif = self.manifold
+        ginv = self.metric.inverse().comp(frame)
+        nonzero_inv = {}
+        for i in manif.irange():
+            nonzero_inv[i] = [s for s in manif.irange() 
+                              if (min(i,s), max(i,s)) in ginv._comp]
+        return nonzero_inv
+
+    def _raise_first_kind(self, frame, gam, indices):
+        r"""
+        Compute some Christoffel symbols of the second kind in a coordinate 
+        frame, by raising the first index of the Christoffel symbols of the 
+        first kind: 
+        
+        .. MATH::
+        
+            \Gamma^i_{\ \, jk} = g^{is} \Gamma_{sjk}
+            
+        the sum being performed on the nonzero terms only. 
+        
+        INPUT:
+        
+        - ``frame`` -- coordinate frame
+        - ``gam`` -- components where the Christoffel symbols are stored
+        - ``indices`` -- iterable of the non-redundant indices `(i,j,k)`, 
+          with `j\leq k`, of the Christoffel symbols to be computed
+        
+        """
+        chart = frame.chart
+        gam1 = self._christoffel_first_kind(frame)
+        ginv = self.metric.inverse().comp(frame)
+        nonzero_inv = self._nonzero_inverse(frame)
+        # The computation is performed at the FunctionChart level:
+        for i, j, k in indices:
+            rsum = 0
+            for s in nonzero_inv[i]:
+                if (s,j,k) in gam1._comp:
+                    rsum += ginv[i,s, chart] * gam1[s,j,k, chart]
+            gam[i,j,k, chart] = rsum
+
+    def _update_riemann(self, frame, riem_old, changed_coef):
+        r"""
+        Update the components of the Riemann tensor in the coordinate frame
+        ``frame`` after the modification of some Christoffel symbols. 
+        
+        Only the components 
+        
+        .. MATH::
+        
+            R^i_{\ \, jkl} = \partial_k \Gamma^i_{\ \, jl} 
+                - \partial_l \Gamma^i_{\ \, jk} 
+                + \Gamma^i_{\ \, km} \Gamma^m_{\ \, jl}
+                - \Gamma^i_{\ \, lm} \Gamma^m_{\ \, jk}
+        
+        that involve some modified Christoffel symbol are recomputed. 
+        
+        INPUT:
+        
+        - ``frame`` -- coordinate frame 
+        - ``riem_old`` -- components of the Riemann tensor in ``frame`` 
+          before the modification
+        - ``changed_coef`` -- set of non-redundant indices `(i,j,k)`, with
+          `j\leq k`, of the modified Christoffel symbols 
+          
+        OUTPUT:
+        
+        - tuple ``(riem, changed)``, where ``riem`` is the updated Riemann 
+          tensor and ``changed`` the set of indices `(i,j,k,l)`, with `k<l`,
+          of the recomputed components
+        
+        """
+        manif = self.manifold
+        ev = frame
+        gam = self.coefficients[frame]
+        # (i,k) such that Gamma^i_{km} has been modified for some m:
+        first_pairs = set()
+        # (j,l) such that Gamma^m_{jl} has been modified for some m:
+        last_pairs = set()
+        for i, j, k in changed_coef:
+            first_pairs.add((i,j))
+            first_pairs.add((i,k))
+            last_pairs.add((j,k))
+        riem = TensorField(self.domain, 1, 3, antisym=(2,3))
+        res = riem_old.copy()
+        riem.components[frame] = res
+        changed = set()
+        for i in manif.irange():
+            for j in manif.irange():
+                for k in manif.irange():
+                    jk = (min(j,k), max(j,k))
+                    for l in manif.irange(start=k+1):
+                        jl = (min(j,l), max(j,l))
+                        if (i,) + jl in changed_coef or \
+                           (i,) + jk in changed_coef or \
+                           (i,k) in first_pairs or (i,l) in first_pairs or \
+                           jl in last_pairs or jk in last_pairs:
+                            rsum = ev[k](gam[[i,j,l]]) - ev[l](gam[[i,j,k]])
+                            for m in manif.irange():
+                                rsum += gam[[i,k,m]]*gam[[m,j,l]] - \
+                                        gam[[i,l,m]]*gam[[m,j,k]]
+                            res[i,j,k,l] = rsum
+                            changed.add((i,j,k,l))
+        return riem, changed
+
+    def _riemann_coord(self, frame):
+        r"""
+        Compute the Riemann tensor in a coordinate frame, taking into account
+        all the symmetries of the fully covariant Riemann tensor. 
+        
+        The independent components of the fully covariant Riemann tensor are 
+        first computed from the Christoffel symbols of the first kind 
+        `\Gamma_{abc} = g_{ad} \Gamma^d_{\ \, bc}`:
+        
+        .. MATH::
+        
+            R_{abcd} = \partial_c \Gamma_{abd} - \partial_d \Gamma_{abc}
+                + \Gamma_{fad} \Gamma^f_{\ \, bc} 
+                - \Gamma_{fac} \Gamma^f_{\ \, bd} 
+                
+        Only the components with `a<b`, `c<d` and `(a,b)\leq(c,d)` are 
+        computed (pair symmetry), those with four distinct indices 
+        `a<c<d<b` being moreover obtained from the first Bianchi identity 
+        `R_{abcd} = R_{adcb} - R_{acdb}` (20 components to be computed for 
+        `n=4`, instead of 96 for the type-(1,3) tensor). For a diagonal 
+        metric (see 
+        :meth:`~sage.geometry.manifolds.metric.Metric.block_structure`), the 
+        components with four distinct indices vanish and are skipped, and the
+        sums are restricted to the nonzero terms. The components are stored in 
+        :attr:`_riemann_down`, as an instance of 
+        :class:`~sage.geometry.manifolds.component.CompRiemannSym`. The 
+        first index is then raised with the nonzero components of the 
+        inverse metric. 
+        
+        INPUT:
+        
+        - ``frame`` -- coordinate frame
+        
+        OUTPUT:
+        
+        - the Riemann tensor, as a tensor field of type (1,3)
+        
+        """
+        manif = self.manifold
+        chart = frame.chart
+        gam = self.coef(frame)
+        gam1 = self._christoffel_first_kind(frame)
+        ginv = self.metric.inverse().comp(frame)
+        # Independent components of the fully covariant Riemann tensor:
+        riem_down = CompRiemannSym(frame)
+        diagonal = self.metric.is_diagonal(frame)
+        bianchi = []
+        for ind in riem_down.non_redundant_index_generator():
+            a, b, c, d = ind
+            if diagonal and len(set(ind)) == 4:
+                continue  # vanishing component for a diagonal metric
+            if a < c and d < b:
+                # a < c < d < b: component given by the Bianchi identity
+                bianchi.append(ind)
+                continue
+            rsum = gam1[a,b,d, chart].diff(c) - gam1[a,b,c, chart].diff(d)
+            if diagonal and (a,b) != (c,d):
+                # for a diagonal metric, the nonzero terms of the sum have 
+                # f in {a,b,c,d}:
+                frange = sorted(set(ind))
+            else:
+                frange = manif.irange()
+            for f in frange:
+                rsum += gam1[f,a,d, chart] * gam[f,b,c, chart] - \
+                        gam1[f,a,c, chart] * gam[f,b,d, chart]
+            riem_down[a,b,c,d, chart] = rsum
+        for a, b, c, d in bianchi:
+            riem_down[a,b,c,d, chart] = riem_down[a,d,c,b, chart] - \
+                                        riem_down[a,c,d,b, chart]
+        self._riemann_down = riem_down.tensor_field((0,4))
+        # Raising of the first index:
+        nonzero_inv = self._nonzero_inverse(frame)
+        riem = TensorField(self.domain, 1, 3, antisym=(2,3))
+        res = riem.set_comp(frame)
+        for i in manif.irange():
+            for j in manif.irange():
+                for k in manif.irange():
+                    for l in manif.irange(start=k+1):
+                        rsum = 0
+                        for a in nonzero_inv[i]:
+                            rsum += ginv[i,a, chart] * riem_down[a,j,k,l, chart]
+                        res[i,j,k,l, chart] = rsum
+        return riem
+
+    def _ricci_coord(self, frame):
+        r"""
+        Compute the components of the Ricci tensor in a coordinate frame 
+        directly from the Christoffel symbols, without computing the Riemann 
+        tensor:
+        
+        .. MATH::
+        
+            R_{ij} = \partial_k \Gamma^k_{\ \, ij} - \partial_j \Gamma^k_{\ \, ki}
+                + \Gamma^k_{\ \, kl} \Gamma^l_{\ \, ij} 
+                - \Gamma^k_{\ \, jl} \Gamma^l_{\ \, ik}
+                
+        the contracted Christoffel symbols `\Gamma^k_{\ \, kl}` being 
+        computed once for all. 
+        
+        INPUT:
+        
+        - ``frame`` -- coordinate frame
+        
+        OUTPUT:
+        
+        - the components of the Ricci tensor in ``frame``, as an instance of 
+          :class:`~sage.geometry.manifolds.component.CompFullySym`
+        
+        """
+        manif = self.manifold
+        chart = frame.chart
+        gam = self.coef(frame)
+        # Contracted Christoffel symbols Gamma^k_{kl}:
+        gam_contr = {}
+        for l in manif.irange():
+            rsum = 0
+            for k in manif.irange():
+                rsum += gam[k,k,l, chart]
+            gam_contr[l] = rsum
+        cric = CompFullySym(frame, 2)
+        for ind in cric.non_redundant_index_generator():
+            i, j = ind
+            rsum = - gam_contr[i].diff(j)
+            for k in manif.irange():
+                rsum += gam[k,i,j, chart].diff(k) + \
+                        gam_contr[k] * gam[k,i,j, chart]
+                for l in manif.irange():
+                    rsum -= gam[k,j,l, chart] * gam[l,i,k, chart]
+            cric[i,j, chart] = rsum
+        return cric
+
+    def _structure_coef_coframe(self, frame):
+        r"""
+        Return the structure coefficients of a vector frame, computed from the
+        exterior derivatives of the 1-forms of the dual coframe. 
+        
+        The structure coefficients `C^k_{\ \, ij}` of the frame `(e_i)` are 
+        defined by `[e_i, e_j] = C^k_{\ \, ij} e_k`; they are related to the 
+        exterior derivatives of the coframe 1-forms `(e^k)` by 
+        
+        .. MATH::
+        
+            \mathrm{d} e^k = - \frac{1}{2} C^k_{\ \, ij} e^i\wedge e^j
+            
+        This requires only `n` exterior derivatives, instead of the 
+        `n(n-1)/2` Lie derivatives involved in 
+        :meth:`~sage.geometry.manifolds.vectorframe.VectorFrame.structure_coef`.
+        The result is stored in the frame. 
+        
+        INPUT:
+        
+        - ``frame`` -- vector frame
+        
+        OUTPUT:
+        
+        - the structure coefficients, as an instance of 
+          :class:`~sage.geometry.manifolds.component.CompWithSym` with 3 
+          indices ordered as `(k,i,j)`
+        
+        """
+        if frame._structure_coef is None:
+            si = self.manifold.sindex
+            sc = CompWithSym(frame, 3, antisym=(1,2))
+            for k in self.manifold.irange():
+                dek = frame.coframe.form[k-si].exterior_der().comp(frame)
+                for ind, val in dek._comp.items():
+                    sc[[(k,) + ind]] = - val
+            frame._structure_coef = sc
+        return frame._structure_coef
+
+    def _nonconstant_metric_comp(self, frame):
+        r"""
+        Return the list of the indices `(a,b)`, with `a\leq b`, of the metric 
+        components `g_{ab}` in ``frame`` that are not constant. 
+        
+        The list is empty for an orthonormal frame or a null tetrad. 
+        
+        """
+        manif = self.manifold
+        chart = frame.domain.def_chart
+        gg = self.metric.comp(frame)
+        nonconstant = []
+        for ind, gab in gg._comp.items():
+            fab = gab.function_chart(chart)
+            for c in manif.irange():
+                if not fab.diff(c).is_zero():
+                    nonconstant.append(ind)
+                    break
+        return nonconstant
+
+    def _cartan_coef(self, frame):
+        r"""
+        Compute the connection coefficients in a non-coordinate frame from 
+        the metric components and the structure coefficients of the frame.
+        
+        The connection coefficients with the first index lowered, 
+        `\Gamma_{abc} = g_{ad} \Gamma^d_{\ \, bc} = \langle e_a, \nabla_{e_c} 
+        e_b \rangle`, are given by Koszul formula:
+        
+        .. MATH::
+        
+            \Gamma_{abc} = \frac{1}{2} \left( e_c(g_{ab}) + e_b(g_{ac}) 
+                - e_a(g_{bc}) + C_{acb} - C_{bca} - C_{cba} \right)
+                
+        where `C_{abc} = g_{ad} C^d_{\ \, bc}`, the structure coefficients 
+        `C^d_{\ \, bc}` being computed from the exterior derivatives of the 
+        coframe 1-forms (see :meth:`_structure_coef_coframe`). The 
+        derivatives of the metric components are computed for the 
+        non-constant components only; they all vanish in an orthonormal 
+        frame. The first index is then raised with the nonzero components of
+        the inverse metric. 
+        
+        INPUT:
+        
+        - ``frame`` -- vector frame
+        
+        OUTPUT:
+        
+        - the connection coefficients in ``frame``, as an instance of 
+          :class:`~sage.geometry.manifolds.component.Components`
+        
+        """
+        manif = self.manifold
+        chart = frame.domain.def_chart
+        gg = self.metric.comp(frame)
+        ginv = self.metric.inverse().comp(frame)
+        sc = self._structure_coef_coframe(frame)
+        nonzero_g = {}
+        for i in manif.irange():
+            nonzero_g[i] = [s for s in manif.irange() 
+                            if (min(i,s), max(i,s)) in gg._comp]
+        # Structure coefficients with the first index lowered: 
+        sc_down = CompWithSym(frame, 3, antisym=(1,2))
+        for i in manif.irange():
+            for j in manif.irange():
+                for k in manif.irange(start=j+1):
+                    rsum = 0
+                    for s in nonzero_g[i]:
+                        if (s,j,k) in sc._comp:
+                            rsum += gg[i,s, chart] * sc[s,j,k, chart]
+                    sc_down[i,j,k, chart] = rsum
+        # Nonzero derivatives e_c(g_{ab}) of the non-constant metric 
+        # components:
+        dg = {}
+        for a, b in self._nonconstant_metric_comp(frame):
+            for c in manif.irange():
+                dgab = frame[c](gg[[a,b]]).function_chart(chart)
+                if not dgab.is_zero():
+                    dg[(a,b,c)] = dgab
+        # Connection coefficients with the first index lowered: 
+        gam1 = Components(frame, 3)
+        for a in manif.irange():
+            for b in manif.irange():
+                for c in manif.irange():
+                    rsum = sc_down[a,c,b, chart] - sc_down[b,c,a, chart] - \
+                           sc_down[c,b,a, chart]
+                    dgab = dg.get((min(a,b), max(a,b), c))
+                    if dgab is not None:
+                        rsum += dgab
+                    dgab = dg.get((min(a,c), max(a,c), b))
+                    if dgab is not None:
+                        rsum += dgab
+                    dgab = dg.get((min(b,c), max(b,c), a))
+                    if dgab is not None:
+                        rsum -= dgab
+                    gam1[a,b,c, chart] = rsum / 2
+        # Raising of the first index: 
+        nonzero_inv = self._nonzero_inverse(frame)
+        gam = Components(frame, 3)
+        for i in manif.irange():
+            for j in manif.irange():
+                for k in manif.irange():
+                    rsum = 0
+                    for s in nonzero_inv[i]:
+                        if (s,j,k) in gam1._comp:
+                            rsum += ginv[i,s, chart] * gam1[s,j,k, chart]
+                    gam[i,j,k, chart] = rsum
+        return gam
+
+    def _riemann_cartan(self, frame):
+        r"""
+        Compute the Riemann tensor in a non-coordinate frame from Cartan's 
+        second structure equation
+        
+        .. MATH::
+        
+            \Omega^a_{\ \, b} = \mathrm{d} \omega^a_{\ \, b} 
+                + \omega^a_{\ \, c} \wedge \omega^c_{\ \, b}
+        
+        where the `\omega^a_{\ \, b} = \Gamma^a_{\ \, bc} e^c` are the 
+        connection 1-forms (cf. :meth:`connection_form`) and the 
+        `\Omega^a_{\ \, b}` are the curvature 2-forms (cf. 
+        :meth:`curvature_form`), whose components are the Riemann tensor 
+        components: `R^a_{\ \, bcd} = \Omega^a_{\ \, b}(e_c, e_d)`. 
+        The exterior derivatives `\mathrm{d} \omega^a_{\ \, b}` are computed by 
+        :meth:`~sage.geometry.manifolds.diffform.DiffForm.exterior_der` and 
+        the exterior products at the component level, on the nonzero 
+        connection coefficients only. 
+        
+        If all the metric components are constant in ``frame`` (orthonormal 
+        frame or null tetrad), the 1-forms `\omega_{ab} = g_{ac} 
+        \omega^c_{\ \, b}` are antisymmetric and 
+        `\Omega_{ab} = \mathrm{d} \omega_{ab} + \omega_{ac} \wedge 
+        \omega^c_{\ \, b}` is computed for `a<b` only. Its components are 
+        those of the fully covariant Riemann tensor, which are stored in 
+        :attr:`_riemann_down` before the first index is raised. 
+        
+        INPUT:
+        
+        - ``frame`` -- vector frame
+        
+        OUTPUT:
+        
+        - the Riemann tensor, as a tensor field of type (1,3)
+        
+        """
+        manif = self.manifold
+        chart = frame.domain.def_chart
+        gam = self.coef(frame)
+        constant_metric = (self._nonconstant_metric_comp(frame) == [])
+        if constant_metric:
+            gg = self.metric.comp(frame)
+            nonzero_g = {}
+            for i in manif.irange():
+                nonzero_g[i] = [s for s in manif.irange() 
+                                if (min(i,s), max(i,s)) in gg._comp]
+            # Components of the 1-forms omega_{ab} (antisymmetric in (a,b)):
+            omega = CompWithSym(frame, 3, antisym=(0,1))
+            for a in manif.irange():
+                for b in manif.irange(start=a+1):
+                    for k in manif.irange():
+                        rsum = 0
+                        for s in nonzero_g[a]:
+                            rsum += gg[a,s, chart] * gam[s,b,k, chart]
+                        omega[a,b,k, chart] = rsum
+            pairs = [(a,b) for a in manif.irange() 
+                     for b in manif.irange(start=a+1)]
+        else:
+            omega = gam
+            pairs = [(a,b) for a in manif.irange() for b in manif.irange()]
+        # Curvature 2-forms from Cartan's second structure equation:
+        curv = {}
+        for a, b in pairs:
+            om = OneForm(frame.domain)
+            com = om.set_comp(frame)
+            for k in manif.irange():
+                com[k, chart] = omega[a,b,k, chart]
+            cform = om.exterior_der().comp(frame)
+            for k in manif.irange():
+                for l in manif.irange(start=k+1):
+                    if constant_metric and (k,l) < (a,b):
+                        continue  # not required, thanks to the pair symmetry
+                    rsum = cform[k,l, chart]
+                    for c in manif.irange():
+                        rsum += omega[a,c,k, chart] * gam[c,b,l, chart] - \
+                                omega[a,c,l, chart] * gam[c,b,k, chart]
+                    cform[k,l, chart] = rsum
+            curv[(a,b)] = cform
+        riem = TensorField(self.domain, 1, 3, antisym=(2,3))
+        res = riem.set_comp(frame)
+        if constant_metric:
+            riem_down = CompRiemannSym(frame)
+            for a, b, c, d in riem_down.non_redundant_index_generator():
+                riem_down[a,b,c,d, chart] = curv[(a,b)][c,d, chart]
+            self._riemann_down = riem_down.tensor_field((0,4))
+            # Raising of the first index:
+            ginv = self.metric.inverse().comp(frame)
+            nonzero_inv = self._nonzero_inverse(frame)
+            for i in manif.irange():
+                for j in manif.irange():
+                    for k in manif.irange():
+                        for l in manif.irange(start=k+1):
+                            rsum = 0
+                            for a in nonzero_inv[i]:
+                                rsum += ginv[i,a, chart] * \
+                                        riem_down[a,j,k,l, chart]
+                            res[i,j,k,l, chart] = rsum
+        else:
+            for a, b in pairs:
+                for ind, val in curv[(a,b)]._comp.items():
+                    res[[(a,b) + ind]] = val
+        return riem
+
     def coef(self, frame=None):
         r"""
         Return the connection coefficients relative to the given frame.
@@ -1101,7 +1871,8 @@ class LeviCivitaConnection(AffConnection):
         If the connection coefficients are not known already, they are computed
 
          * as Christoffel symbols if the frame `(e_i)` is a coordinate frame
-         * frome the above formula otherwise 
+         * from Koszul formula, involving the structure coefficients of the 
+           frame, otherwise (see :meth:`_cartan_coef`)
                 
         INPUT:
         
@@ -1164,6 +1935,7 @@ class LeviCivitaConnection(AffConnection):
 
         """
         from vectorframe import CoordFrame
+        from utilities import add_dependent
         if frame is None: 
             frame = self.domain.def_frame
         if frame not in self.coefficients:
@@ -1172,24 +1944,32 @@ class LeviCivitaConnection(AffConnection):
             dom = self.domain
             if isinstance(frame, CoordFrame):
                 # Christoffel symbols
-                chart = frame.chart
-                gam = CompWithSym(frame, 3, sym=(1,2))
-                gg = self.metric.comp(frame)
-                ginv = self.metric.inverse().comp(frame)
-                for ind in gam.non_redundant_index_generator():
-                    i, j, k = ind
-                    # The computation is performed at the FunctionChart level:
-                    rsum = 0
-                    for s in manif.irange():
-                        rsum += ginv[i,s, chart] * ( 
-                                            gg[s,k, chart].diff(j)
-                                          + gg[j,s, chart].diff(k)
-                                          - gg[j,k, chart].diff(s) )
-                    gam[i,j,k, chart] = rsum / 2
+                modified = self.metric._modified_comp.pop(frame, None)
+                outdated = self._outdated.get(frame)
+                if modified and outdated is not None and 'coef' in outdated:
+                    # incremental update after the modification of some 
+                    # metric components:
+                    gam, changed = self._update_christoffel(frame, 
+                                                    outdated.pop('coef'), 
+                                                    modified)
                     self.coefficients[frame] = gam
+                    outdated['changed_coef'] = \
+                                outdated.get('changed_coef', set()) | changed
+                    add_dependent(self.metric, self, frame)
+                    return gam
+                # computation from scratch:
+                self._outdated.pop(frame, None)
+                gam = CompWithSym(frame, 3, sym=(1,2))
+                self._raise_first_kind(frame, gam, 
+                                       gam.non_redundant_index_generator())
+                self.coefficients[frame] = gam
+                # the Christoffel symbols depend on the metric components in 
+                # frame:
+                add_dependent(self.metric, self, frame)
             else:
-                # Computation from the formula defining the connection coef.
-                return AffConnection.coef(self, frame)
+                # Koszul formula with the structure coefficients of the frame
+                self.coefficients[frame] = self._cartan_coef(frame)
+                add_dependent(self.metric, self)
         return self.coefficients[frame]
 
     def torsion(self, frame=None):
@@ -1227,7 +2007,11 @@ class LeviCivitaConnection(AffConnection):
         Return the Riemann curvature tensor associated with the metric.
 
         This method redefines :meth:`AffConnection.riemann` to set some name
-        and the latex_name to the output.
+        and the latex_name to the output, and to take into account the 
+        symmetries of the Riemann tensor of a metric in coordinate frames 
+        (see :meth:`_riemann_coord`). In other frames, the Riemann tensor is 
+        computed from Cartan's second structure equation (see 
+        :meth:`_riemann_cartan`).
         
         The Riemann curvature tensor is the tensor field `R` of type (1,3) 
         defined by
@@ -1256,9 +2040,86 @@ class LeviCivitaConnection(AffConnection):
         - the Riemann curvature tensor `R`, as an instance of 
           :class:`TensorField`
           
+        EXAMPLE:
+        
+        Riemann tensor of the standard metric on the 2-sphere::
+        
+            sage: m = Manifold(2, 'S^2', start_index=1)
+            sage: c_spher.<th,ph> = m.chart(r'th:[0,pi]:\theta ph:[0,2*pi):\phi')
+            sage: g = Metric(m, 'g')
+            sage: g[1,1], g[2,2] = 1, sin(th)^2
+            sage: nab = g.connection()
+            sage: riem = nab.riemann() ; riem
+            tensor field 'Riem(g)' of type (1,3) on the 2-dimensional manifold 'S^2'
+            sage: riem[1,2,1,2], riem[2,1,1,2]
+            (sin(th)^2, -1)
+            
+        The fully covariant Riemann tensor, from which `R` has been 
+        computed, has a single independent component::
+        
+            sage: nab._riemann_down.comp()
+            4-indices components w.r.t. the coordinate frame (S^2, (d/dth,d/dph)), with the symmetries of the Riemann tensor
+            sage: nab._riemann_down.comp()._comp.keys()
+            [(1, 2, 1, 2)]
+            sage: nab._riemann_down[1,2,1,2], nab._riemann_down[2,1,2,1]
+            (sin(th)^2, sin(th)^2)
+
+        Riemann tensor in the orthonormal frame associated with the 
+        coordinates `(\theta,\phi)`, computed from the curvature 2-forms::
+        
+            sage: ch_basis = AutomorphismField(m)
+            sage: ch_basis[1,1], ch_basis[2,2] = 1, 1/sin(th)
+            sage: e = c_spher.frame.new_frame(ch_basis, 'e')
+            sage: h = Metric(m, 'h')
+            sage: h[1,1], h[2,2] = 1, sin(th)^2
+            sage: nab = h.connection()
+            sage: nab.coef(e)[:]
+            [[[0, 0], [0, -cos(th)/sin(th)]], [[0, cos(th)/sin(th)], [0, 0]]]
+            sage: riem_e = nab.riemann(e)
+            sage: riem_e.comp(e)[1,2,1,2], riem_e.comp(e)[2,1,1,2]
+            (1, -1)
+            sage: nab._riemann_down.comp(e)._comp.keys()
+            [(1, 2, 1, 2)]
+            sage: riem_e == riem
+            True
+
         """
+        from vectorframe import CoordFrame
         if self._riemann is None:
-            AffConnection.riemann(self, frame)
+            dom = self.domain
+            if frame is None and dom.def_frame in self._outdated:
+                frame = dom.def_frame
+            outdated = self._outdated.get(frame)
+            if outdated is not None and 'riemann' in outdated:
+                self.coef(frame)  # possibly incremental update
+                if 'changed_coef' in outdated:
+                    # incremental update of the Riemann tensor:
+                    self._riemann, changed = self._update_riemann(frame, 
+                                                    outdated.pop('riemann'), 
+                                                    outdated.pop('changed_coef'))
+                    self._derived_frames['riemann'] = frame
+                    outdated['changed_riemann'] = \
+                             outdated.get('changed_riemann', set()) | changed
+            if self._riemann is None:
+                if frame is None:
+                    if dom.def_frame in self.coefficients or \
+                                                    self.coefficients == {}:
+                        frame = dom.def_frame
+                    else: # a random frame is picked
+                        frame = self.coefficients.items()[0][0]
+                if isinstance(frame, CoordFrame):
+                    self._riemann = self._riemann_coord(frame)
+                    self._derived_frames['riemann'] = frame
+                else:
+                    self._riemann = self._riemann_cartan(frame)
+                    self._derived_frames['riemann'] = frame
+                frame = self._derived_frames['riemann']
+                outdated = self._outdated.get(frame)
+                if outdated is not None:
+                    # the previous curvature can no longer be updated:
+                    for key in ['riemann', 'changed_coef', 'ricci', 
+                                'changed_riemann']:
+                        outdated.pop(key, None)
             if name is None:
                 self._riemann.name = "Riem(" + self.metric.name + ")"
             else:
@@ -1278,6 +2139,10 @@ class LeviCivitaConnection(AffConnection):
         
         This method redefines :meth:`AffConnection.ricci` to take into account
         the symmetry of the Ricci tensor for a Levi-Civita connection. 
+        Moreover, if the Riemann tensor has not been computed yet, the Ricci 
+        tensor is computed directly from the Christoffel symbols in a 
+        coordinate frame (see :meth:`_ricci_coord`), without computing the 
+        Riemann tensor. 
 
         The Ricci tensor is the tensor field `Ric` of type (0,2) 
         defined from the Riemann curvature tensor `R` by 
@@ -1340,29 +2205,69 @@ class LeviCivitaConnection(AffConnection):
             field of symmetric bilinear forms 'Ric(g)' on the 4-dimensional manifold 'M'
             sage: ric == 0
             True
+            
+        The Riemann tensor has not been computed::
+        
+            sage: nab._riemann is None
+            True
 
         """
+        from vectorframe import CoordFrame
         if self._ricci is None:
             manif = self.manifold
             dom = self.domain
-            riem = self.riemann(frame)
-            if frame is None:
-                if dom.def_frame in riem.components:
+            if frame is None and self._riemann is None:
+                if dom.def_frame in self._outdated or \
+                   dom.def_frame in self.coefficients or \
+                   self.coefficients == {}:
                     frame = dom.def_frame
                 else: # a random frame is picked
-                    frame = riem.components.items()[0][0]
-            criem = riem.components[frame]
-            cric = CompFullySym(frame, 2)
-            si = manif.sindex
-            for i in manif.irange():
-                # symmetry of the Ricci tensor taken into account by j>=i: 
-                for j in manif.irange(start=i):  
-                    rsum = criem[[si,i,si,j]].copy()
-                    for k in manif.irange(start=si+1):
-                        rsum += criem[[k,i,k,j]]
-                    cric[i,j] = rsum
+                    frame = self.coefficients.items()[0][0]
+            if self._riemann is None and isinstance(frame, CoordFrame) and \
+               'ricci' not in self._outdated.get(frame, {}):
+                # direct computation from the Christoffel symbols, without 
+                # computing the Riemann tensor:
+                cric = self._ricci_coord(frame)
+            else:
+                riem = self.riemann(frame)
+                if frame is None:
+                    if dom.def_frame in riem.components:
+                        frame = dom.def_frame
+                    else: # a random frame is picked
+                        frame = riem.components.items()[0][0]
+                criem = riem.components[frame]
+                outdated = self._outdated.pop(frame, {})
+                if 'ricci' in outdated and 'changed_riemann' in outdated:
+                    # incremental update: only the components that involve 
+                    # some modified component of the Riemann tensor are 
+                    # recomputed
+                    changed = outdated['changed_riemann']
+                    cric = outdated['ricci'].copy()
+                    to_be_computed = set()
+                    for i in manif.irange():
+                        for j in manif.irange(start=i):
+                            for k in manif.irange():
+                                if (k,i,min(k,j),max(k,j)) in changed or \
+                                   (k,j,min(k,i),max(k,i)) in changed:
+                                    to_be_computed.add((i,j))
+                                    break
+                else:
+                    cric = CompFullySym(frame, 2)
+                    to_be_computed = None
+                si = manif.sindex
+                for i in manif.irange():
+                    # symmetry of the Ricci tensor taken into account by j>=i: 
+                    for j in manif.irange(start=i):  
+                        if to_be_computed is not None and \
+                                                (i,j) not in to_be_computed:
+                            continue
+                        rsum = criem[[si,i,si,j]].copy()
+                        for k in manif.irange(start=si+1):
+                            rsum += criem[[k,i,k,j]]
+                        cric[i,j] = rsum
             self._ricci = cric.tensor_field((0,2))
             self._ricci.domain = self.domain
+            self._derived_frames['ricci'] = frame
             if name is None:
                 self._ricci.name = "Ric(" + self.metric.name + ")"
             else:
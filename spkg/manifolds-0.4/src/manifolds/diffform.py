@@ -377,13 +377,17 @@ class DiffForm(TensorField):
         """
         TensorField._init_derived(self)  
         self._exterior_derivative = None
+        # frame in which the exterior derivative has been computed: 
+        self._exterior_derivative_frame = None
 
-    def _del_derived(self):
+    def _del_derived(self, frame=None):
         r"""
         Delete the derived quantities
         """
-        TensorField._del_derived(self)
-        self._exterior_derivative = None
+        TensorField._del_derived(self, frame)
+        if frame is None or frame is self._exterior_derivative_frame:
+            self._exterior_derivative = None
+            self._exterior_derivative_frame = None
 
     def degree(self):
         r"""
@@ -463,6 +467,7 @@ class DiffForm(TensorField):
             self._exterior_derivative = DiffForm(self.domain, self.rank+1, 
                                                  rname, rlname)
             self._exterior_derivative.components[frame] = dc
+            self._exterior_derivative_frame = frame
         return self._exterior_derivative
  
  
@@ -596,6 +601,19 @@ class DiffForm(TensorField):
         
         - the `(n-p)`-form `*A` 
         
+        The computation is performed in the domain's default frame, with 
+        respect to which the volume form is defined: the indices of `A` are 
+        raised on the non-redundant components (increasing indices 
+        `k_1<\cdots<k_p`) only, each of them giving the single component of 
+        `*A` with the complementary increasing indices `i_1<\cdots<i_{n-p}`: 
+        
+        .. MATH::
+        
+            *A_{i_1\ldots i_{n-p}} = \pm \sqrt{|g|} \, A^{k_1\ldots k_p}
+            
+        the sign being that of the permutation 
+        `(k_1,\ldots,k_p,i_1,\ldots,i_{n-p})`. 
+        
         EXAMPLES:
         
         Hodge star of a 1-form in the Euclidean space `R^3`::
@@ -726,18 +744,79 @@ class DiffForm(TensorField):
             True
 
         """
-        from sage.functions.other import factorial
+        from itertools import combinations, product
+        from scalarfield import ScalarField
+        from vectorframe import CoordFrame
         from utilities import format_unop_txt, format_unop_latex
+        def perm_sign(seq):
+            # sign of the permutation sorting seq (parity of the number of 
+            # inversions)
+            sign = 1
+            for i in range(len(seq)):
+                for j in range(i+1, len(seq)):
+                    if seq[i] > seq[j]:
+                        sign = -sign
+            return sign
+        manif = self.manifold
+        dom = self.domain
+        n = manif.dim
         p = self.rank
-        eps = metric.volume_form(p)
+        # The volume form is defined with respect to the default frame:
+        frame = dom.def_frame
+        if isinstance(frame, CoordFrame):
+            chart = frame.chart
+        else:
+            chart = dom.def_chart
+        sqrt_det = metric.sqrt_abs_det(frame).function_chart(chart)
         if p == 0:
-            resu = self * eps
+            resu = DiffForm(dom, n)
+            ind = tuple(manif.irange())
+            resu.set_comp(frame)[ind + (chart,)] = \
+                                        sqrt_det * self.function_chart(chart)
         else:
-            resu = self.contract(0, eps, 0)
-            for j in range(1, p):
-                resu = resu.self_contract(0, p-j)
-            if p > 1:
-                resu = resu / factorial(p)
+            acomp = self.comp(frame)
+            ginv = metric.inverse().comp(frame)
+            nonzero_inv = {}
+            for i in manif.irange():
+                nonzero_inv[i] = [s for s in manif.irange() 
+                                  if (min(i,s), max(i,s)) in ginv._comp]
+            if p == n:
+                resu = chart.zero_function
+            else:
+                if p == n-1:
+                    resu = OneForm(dom)
+                else:
+                    resu = DiffForm(dom, n-p)
+                rcomp = resu.set_comp(frame)
+            for kk in combinations(manif.irange(), p):
+                # Raising of the indices, the sum being performed on the 
+                # non-redundant components of self and the nonzero 
+                # components of the inverse metric:
+                # A^{k_1...k_p} = g^{k_1 l_1}...g^{k_p l_p} A_{l_1...l_p}
+                aup = chart.zero_function
+                for ll in product(*[nonzero_inv[k] for k in kk]):
+                    lsorted = tuple(sorted(ll))
+                    if lsorted not in acomp._comp:
+                        continue # zero or repeated indices
+                    term = perm_sign(ll) * acomp[lsorted + (chart,)]
+                    for k, l in zip(kk, ll):
+                        term *= ginv[k, l, chart]
+                    aup += term
+                if aup.is_zero():
+                    continue
+                # The complementary indices (i_1,...,i_{n-p}) of 
+                # (k_1,...,k_p) give the only nonzero component 
+                # *A_{i_1...i_{n-p}} = A^{k_1...k_p} eps_{k_1...k_p i_1...i_{n-p}}
+                ii = tuple([i for i in manif.irange() if i not in kk])
+                val = perm_sign(kk + ii) * sqrt_det * aup
+                if p == n:
+                    resu = val
+                else:
+                    rcomp[ii + (chart,)] = val
+            if p == n:
+                scal = ScalarField(dom)
+                scal.add_expr(resu.express, chart=chart)
+                resu = scal
         # Name and LaTeX name of the result:
         resu.name = format_unop_txt('*', self.name)
         resu.latex_name = format_unop_latex(r'\star ', self.latex_name)
@@ -1094,7 +1094,7 @@ class Diffeomorphism(DiffMapping):
         for i in range(n1):
             x = inv_functions[i]
             try:
-                inv_functions[i] = simplify_chain(x)
+                inv_functions[i] = simplify_chain(x, chart2._simplif_profile)
             except AttributeError:
                 pass
         if self.name is None:
@@ -86,6 +86,7 @@ State of various data members after the above operations::
 from sage.structure.parent import Parent
 from sage.categories.sets_cat import Sets
 from point import Point
+from utilities import Registry
 
 class Domain(Parent):
     r"""
@@ -178,13 +179,26 @@ class Domain(Parent):
         self.subdomains = set([self]) # domains contained in self
         self.intersections = {} # dict. of intersections with other domains
         self.unions = {} # dict. of unions with other domains
-        self.atlas = []  # list of charts defined on subdomains of self
+        # list of charts defined on subdomains of self:
+        self.atlas = Registry()
         self.def_chart = None  # default chart
         self.coord_changes = {} # dictionary of transition maps 
-        self.frames = []  # list of vector frames defined on subdomains of self
+        # list of vector frames defined on subdomains of self:
+        self.frames = Registry()
         self.def_frame = None  # default frame
         self.frame_changes = {} # dictionary of changes of frames
-        self.coframes = []  # list of coframes defined on subdomains of self
+        # list of coframes defined on subdomains of self:
+        self.coframes = Registry()
+        # Changes of coordinates (resp. frames) obtained by composition, 
+        # with the tuple of the keys of the defined changes they have been
+        # composed from (cf. self._set_change()):
+        self._composed_coord_changes = {}
+        self._composed_frame_changes = {}
+        # Adjacency indices of the graphs formed by the charts (resp. frames) 
+        # connected by the changes of coordinates (resp. frames); they are 
+        # rebuilt by self._change_graph() when the set of changes is modified: 
+        self._coord_graph = (frozenset(), {})
+        self._frame_graph = (frozenset(), {})
         # The zero scalar field is constructed:
         if self.name != 'field R':  
             #!# to avoid circular import of RealLine
@@ -352,11 +366,13 @@ class Domain(Parent):
         res.subdomains.update(self.subdomains)
         for sd in self.subdomains:
             sd.superdomains.add(res)
-        res.atlas = list(self.atlas)
+        res.atlas = Registry(self.atlas)
         res.coord_changes = dict(self.coord_changes)
-        res.frames = list(self.frames)
+        res._composed_coord_changes = dict(self._composed_coord_changes)
+        res.frames = Registry(self.frames)
         res.frame_changes = dict(self.frame_changes)
-        res.coframes = list(self.coframes)
+        res._composed_frame_changes = dict(self._composed_frame_changes)
+        res.coframes = Registry(self.coframes)
         res.def_chart = self.def_chart
         res.def_frame = self.def_frame
         return res
@@ -546,17 +562,13 @@ class Domain(Parent):
             res.subdomains.update(other.subdomains)
             for sd in other.subdomains:
                 sd.superdomains.add(res)
-            for chart in other.atlas:
-                if chart not in res.atlas:
-                    res.atlas.append(chart)
+            res.atlas.extend(other.atlas)
             res.coord_changes.update(other.coord_changes)
-            for frame in other.frames:
-                if frame not in res.frames:
-                    res.frames.append(frame)
+            res._composed_coord_changes.update(other._composed_coord_changes)
+            res.frames.extend(other.frames)
             res.frame_changes.update(other.frame_changes)
-            for coframe in other.coframes:
-                if coframe not in res.coframes:
-                    res.coframes.append(coframe)
+            res._composed_frame_changes.update(other._composed_frame_changes)
+            res.coframes.extend(other.coframes)
             self.unions[other.name] = res
             other.unions[self.name] = res
             return res
@@ -593,8 +605,8 @@ class Domain(Parent):
         """
         if point.parent().is_subdomain(self):
             return True
-        for chart in self.atlas:
-            if chart in point.coordinates:
+        for chart in point.coordinates:
+            if chart in self.atlas:
                 if chart.valid_coordinates( *(point.coordinates[chart]) ):
                     return True
         for chart in point.coordinates:
@@ -742,13 +754,235 @@ class Domain(Parent):
             sage: M.coord_change(c_xy, c_uv)
             coordinate change from chart (M, (x, y)) to chart (M, (u, v))
 
+        If no change of coordinates from chart 1 to chart 2 has been 
+        defined, but the two charts are connected by a sequence of 
+        coordinate changes, the latter are composed along the cheapest path 
+        (see :meth:`coord_change_path`) and the resulting coordinate change 
+        is stored for future use, until one of the composed coordinate 
+        changes is redefined. 
+        
+        Composition of coordinate changes::
+        
+            sage: c_UV.<U,V> = M.chart('U V')
+            sage: CoordChange(c_uv, c_UV, u^2, v)
+            coordinate change from chart (M, (u, v)) to chart (M, (U, V))
+            sage: M.coord_change_path(c_xy, c_UV)
+            [chart (M, (x, y)), chart (M, (u, v)), chart (M, (U, V))]
+            sage: ch = M.coord_change(c_xy, c_UV) ; ch
+            coordinate change from chart (M, (x, y)) to chart (M, (U, V))
+            sage: ch(x,y)
+            (x^2 + 2*x*y + y^2, x - y)
+            sage: M.coord_change(c_xy, c_UV) is ch
+            True
+            
+        The composed coordinate change is dropped if one of the coordinate 
+        changes it has been composed from is redefined::
+        
+            sage: CoordChange(c_uv, c_UV, u^3, v)
+            coordinate change from chart (M, (u, v)) to chart (M, (U, V))
+            sage: M.coord_change(c_xy, c_UV)(x,y)
+            (x^3 + 3*x^2*y + 3*x*y^2 + y^3, x - y)
+
         """
         if (chart1, chart2) not in self.coord_changes:
-            raise TypeError("The change of coordinates from " + str(chart1) + 
-                            " to " + str(chart2) + " has not been " + 
-                            "defined on the " + str(self))
+            path = self.coord_change_path(chart1, chart2)
+            if path is None:
+                raise TypeError("The change of coordinates from " + 
+                                str(chart1) + " to " + str(chart2) + 
+                                " has not been defined on the " + str(self))
+            self._compose_coord_changes(path)
         return self.coord_changes[(chart1, chart2)]
 
+    def _change_graph(self, changes, graph_attr):
+        r"""
+        Return the adjacency dictionary of the graph whose vertices are
+        charts (resp. frames) and whose edges are the changes of 
+        coordinates (resp. frames) stored in the dictionary ``changes``. 
+        
+        The adjacency dictionary is stored in the attribute ``graph_attr`` 
+        of ``self``, together with the set of changes it has been built 
+        from; it is updated only when this set has been modified. 
+        
+        """
+        (edges, adjacency) = getattr(self, graph_attr)
+        if edges != changes.viewkeys():
+            adjacency = {}
+            for (start, end) in changes:
+                if start is not end:
+                    adjacency.setdefault(start, []).append(end)
+            setattr(self, graph_attr, (frozenset(changes), adjacency))
+        return adjacency
+
+    def _set_change(self, changes_attr, key, change):
+        r"""
+        Store a change of coordinates or of frames that has been explicitly 
+        defined in ``self`` and its superdomains. 
+        
+        The changes obtained by composition (see :meth:`coord_change` and 
+        :meth:`frame_change`) that involve a previous definition of the 
+        change are deleted. 
+        
+        INPUT:
+        
+        - ``changes_attr`` -- either ``'coord_changes'`` or 
+          ``'frame_changes'``
+        - ``key`` -- pair of charts (resp. frames) ``(start, end)``
+        - ``change`` -- the change of coordinates (resp. frames)
+        
+        """
+        for sdom in self.superdomains:
+            changes = getattr(sdom, changes_attr)
+            composed = getattr(sdom, '_composed_' + changes_attr)
+            composed.pop(key, None)
+            for ckey, base_keys in composed.items():
+                if key in base_keys:
+                    del composed[ckey]
+                    changes.pop(ckey, None)
+            changes[key] = change
+
+    def _composed_from(self, changes_attr, path):
+        r"""
+        Return the tuple of the keys of the explicitly defined changes of 
+        coordinates or of frames involved in the composition of the changes
+        along ``path``. 
+        """
+        composed = getattr(self, '_composed_' + changes_attr)
+        base_keys = []
+        for i in range(len(path)-1):
+            key = (path[i], path[i+1])
+            base_keys.extend(composed.get(key, (key,)))
+        return tuple(base_keys)
+
+    def _cheapest_path(self, changes, graph_attr, start, ends, cost):
+        r"""
+        Find the cheapest path from ``start`` to one of the vertices 
+        ``ends`` in the graph of changes stored in ``changes`` (Dijkstra 
+        algorithm). 
+        
+        INPUT:
+        
+        - ``changes`` -- dictionary of changes (of coordinates or frames) 
+          with keys of the form (start, end)
+        - ``graph_attr`` -- name of the attribute where the adjacency 
+          dictionary of ``changes`` is stored
+        - ``start`` -- the starting vertex
+        - ``ends`` -- list of the possible final vertices
+        - ``cost`` -- function returning the cost of a change from 
+          ``changes``
+          
+        OUTPUT:
+        
+        - list of vertices, starting with ``start`` and ending with 
+          one of the vertices ``ends``, or None if no path exists
+          
+        """
+        import heapq
+        if start in ends:
+            return [start]
+        adjacency = self._change_graph(changes, graph_attr)
+        if start not in adjacency:
+            return None
+        heap = [(0, 0, start, [start])]
+        counter = 1  # tie-breaker, to avoid comparing vertices
+        visited = set()
+        while heap:
+            (dist, _, vertex, path) = heapq.heappop(heap)
+            if vertex in ends:
+                return path
+            if vertex in visited:
+                continue
+            visited.add(vertex)
+            for other in adjacency.get(vertex, []):
+                if other not in visited:
+                    heapq.heappush(heap, (dist + cost(changes[(vertex, 
+                                    other)]), counter, other, path + [other]))
+                    counter += 1
+        return None
+        
+    def coord_change_path(self, chart1, chart2):
+        r"""
+        Find the cheapest sequence of coordinate changes connecting two 
+        charts. 
+        
+        The cost of a coordinate change is the size of its coordinate
+        expressions, so that the paths involving the simplest transition 
+        maps are privileged. 
+        
+        INPUT:
+        
+        - ``chart1`` -- starting chart
+        - ``chart2`` -- final chart, or list of charts; in the latter case, 
+          the path leads to the chart of the list that is the cheapest to 
+          reach
+        
+        OUTPUT:
+        
+        - list of charts, starting with ``chart1`` and ending with 
+          ``chart2``, such that the change of coordinates between two 
+          successive charts is known, or None if no such list exists
+          
+        EXAMPLES::
+        
+            sage: M = Manifold(2, 'M')
+            sage: c_xy.<x,y> = M.chart('x y')
+            sage: c_uv.<u,v> = M.chart('u v')
+            sage: c_UV.<U,V> = M.chart('U V')
+            sage: CoordChange(c_xy, c_uv, x+y, x-y)
+            coordinate change from chart (M, (x, y)) to chart (M, (u, v))
+            sage: CoordChange(c_uv, c_UV, u^2, v)
+            coordinate change from chart (M, (u, v)) to chart (M, (U, V))
+            sage: M.coord_change_path(c_xy, c_UV)
+            [chart (M, (x, y)), chart (M, (u, v)), chart (M, (U, V))]
+            sage: M.coord_change_path(c_UV, c_xy) is None
+            True
+
+        """
+        def cost(change):
+            return sum(len(str(func.express)) 
+                       for func in change.transf.functions)
+        if not isinstance(chart2, (list, tuple)):
+            chart2 = [chart2]
+        return self._cheapest_path(self.coord_changes, '_coord_graph', 
+                                   chart1, chart2, cost)
+
+    def _compose_coord_changes(self, path):
+        r"""
+        Construct the change of coordinates from ``path[0]`` to 
+        ``path[-1]`` by composing the changes of coordinates between the 
+        successive charts of the list ``path``. 
+        
+        The result is stored in the dictionary :attr:`coord_changes` of 
+        ``self`` and of its superdomains, until one of the composed changes 
+        is redefined (see :meth:`_set_change`). 
+        
+        """
+        from chart import CoordChange
+        chart1 = path[0]
+        chart2 = path[-1]
+        coords = chart1.xx
+        for i in range(len(path)-1):
+            change = self.coord_changes[(path[i], path[i+1])]
+            coords = change.transf(*coords)
+        res = CoordChange(chart1, chart2, *coords)
+        # The construction of res may have stored it, together with the 
+        # induced changes of frame, as explicitly defined changes; they are
+        # declared as composed ones:
+        base_keys = self._composed_from('coord_changes', path)
+        frame_base_keys = []
+        for (ch1, ch2) in base_keys:
+            frame_base_keys.extend([(ch1.frame, ch2.frame), 
+                                    (ch2.frame, ch1.frame)])
+        frame_base_keys = tuple(frame_base_keys)
+        for sdom in self.superdomains:
+            if sdom.coord_changes.get((chart1, chart2), res) is res:
+                sdom.coord_changes[(chart1, chart2)] = res
+                sdom._composed_coord_changes[(chart1, chart2)] = base_keys
+                if chart1.domain == chart2.domain:
+                    for fkey in [(chart1.frame, chart2.frame), 
+                                 (chart2.frame, chart1.frame)]:
+                        sdom._composed_frame_changes[fkey] = frame_base_keys
+        return res
+
 
     def default_frame(self):
         r"""
@@ -844,13 +1078,111 @@ class Domain(Parent):
             sage: M.frame_change(c_uv.frame, c_xy.frame) ==  M.frame_change(c_xy.frame, c_uv.frame).inverse()
             True            
 
+        If no change of frame from frame 1 to frame 2 has been defined, but
+        the two frames are connected by a sequence of frame changes, the 
+        latter are composed along the cheapest path (see 
+        :meth:`frame_change_path`) and the result is stored for future use 
+        (see :meth:`frame_change_path` for an example). 
+
         """
         if (frame1, frame2) not in self.frame_changes:
-            raise TypeError("The change of frame from '" + repr(frame1) + 
-                            "' to '" + repr(frame2) + "' has not been " + 
-                            "defined on the " + repr(self))
+            path = self.frame_change_path(frame1, frame2)
+            if path is None:
+                raise TypeError("The change of frame from '" + repr(frame1) + 
+                                "' to '" + repr(frame2) + "' has not been " + 
+                                "defined on the " + repr(self))
+            self._compose_frame_changes(path)
         return self.frame_changes[(frame1, frame2)]
 
+    def frame_change_path(self, frame1, frame2):
+        r"""
+        Find the cheapest sequence of frame changes connecting two vector 
+        frames. 
+        
+        The cost of a frame change is the number of nonzero components of 
+        the corresponding automorphism field. 
+        
+        INPUT:
+        
+        - ``frame1`` -- starting vector frame
+        - ``frame2`` -- final vector frame, or list of vector frames; in the
+          latter case, the path leads to the frame of the list that is the 
+          cheapest to reach
+        
+        OUTPUT:
+        
+        - list of vector frames, starting with ``frame1`` and ending with 
+          ``frame2``, such that the change of frame between two successive 
+          frames is known, or None if no such list exists
+          
+        EXAMPLES::
+        
+            sage: M = Manifold(2, 'M')
+            sage: c_xy.<x,y> = M.chart('x y')
+            sage: e = M.default_frame()
+            sage: a = M.automorphism_field()
+            sage: a[0,0], a[1,1] = 2, 3
+            sage: f = e.new_frame(a, 'f')
+            sage: b = M.automorphism_field()
+            sage: b[0,1], b[1,0] = 1, 1
+            sage: h = f.new_frame(b, 'h')
+            sage: M.frame_change_path(e, h)
+            [coordinate frame (M, (d/dx,d/dy)), vector frame (M, (f_0,f_1)), vector frame (M, (h_0,h_1))]
+            sage: M.frame_change(e, h)[:]
+            [0 2]
+            [3 0]
+            
+        """
+        def cost(change):
+            for comp in change.components.itervalues():
+                return len(comp._comp)
+            return 0
+        if not isinstance(frame2, (list, tuple)):
+            frame2 = [frame2]
+        return self._cheapest_path(self.frame_changes, '_frame_graph', 
+                                   frame1, frame2, cost)
+
+    def _compose_frame_changes(self, path):
+        r"""
+        Construct the change of frame from ``path[0]`` to ``path[-1]`` by 
+        composing the changes of frame between the successive frames of the 
+        list ``path``. 
+        
+        If `(e_i)`, `(n_i)` and `(m_i)` are three frames, with `n_i=P(e_i)` 
+        and `m_i=Q(n_i)`, then `m_i = (Q\circ P)(e_i)` and the matrix of 
+        `Q\circ P` in the frame `(e_i)` (or `(m_i)`) is the product of the 
+        matrix of `P` in the frame `(e_i)` by that of `Q` in the frame 
+        `(n_i)`. The result is stored in the dictionary 
+        :attr:`frame_changes` of ``self`` and of its superdomains, until 
+        one of the composed changes is redefined (see :meth:`_set_change`). 
+        
+        """
+        from rank2field import AutomorphismField
+        n = self.manifold.dim
+        si = self.manifold.sindex
+        frame1 = path[0]
+        frame2 = path[-1]
+        # matrix of the composed change of frame in the frame frame1: 
+        comp = self.frame_changes[(frame1, path[1])].comp(frame1)
+        mat = [[comp[[k+si, j+si]] for j in range(n)] for k in range(n)]
+        for i in range(1, len(path)-1):
+            frame = path[i]
+            comp = self.frame_changes[(frame, path[i+1])].comp(frame)
+            mat = [[sum(mat[k][l] * comp[[l+si, j+si]] for l in range(n)) 
+                                       for j in range(n)] for k in range(n)]
+        res = AutomorphismField(self)
+        for frame in (frame1, frame2):
+            comp = res.add_comp(frame)
+            for k in range(n):
+                for j in range(n):
+                    comp[[k+si, j+si]] = mat[k][j]
+        base_keys = self._composed_from('frame_changes', path)
+        for sdom in self.superdomains:
+            if (frame1, frame2) not in sdom.frame_changes:
+                sdom.frame_changes[(frame1, frame2)] = res
+                sdom._composed_frame_changes[(frame1, frame2)] = base_keys
+        return res
+
 
     def scalar_field(self, coord_expression=None, chart=None, name=None, 
                      latex_name=None):
@@ -244,6 +244,9 @@ class Manifold(OpenDomain):
         OpenDomain.__init__(self, self, name, latex_name)
         self.sindex = start_index
         self.domains = {self.name: self}
+        # Default simplification profile for the charts (cf. 
+        # set_simplification_profile()):
+        self._simplif_profile = 'full'
         
     def _repr_(self):
         r"""
@@ -271,6 +274,36 @@ class Manifold(OpenDomain):
         return self.dim
 
 
+    def set_simplification_profile(self, profile):
+        r"""
+        Set the simplification profile for the coordinate expressions on all
+        the charts defined on the manifold, including those to be defined 
+        later. 
+        
+        See :meth:`Chart.set_simplification_profile` for details.
+        
+        INPUT:
+        
+        - ``profile`` -- name of the simplification profile (e.g. ``'full'``,
+          ``'auto'``, ``'trig'``, ``'rational-only'`` or ``'none'``)
+          
+        EXAMPLE::
+        
+            sage: m = Manifold(4, 'M')
+            sage: m.set_simplification_profile('rational-only')
+            sage: X.<t,x,y,z> = m.chart('t x y z')
+            sage: FunctionChart(X, x^2 - t^2) / FunctionChart(X, x - t)
+            t + x
+        
+        """
+        from utilities import simplification_profiles
+        if profile not in simplification_profiles():
+            raise ValueError("Unknown simplification profile: " + 
+                             str(profile))
+        self._simplif_profile = profile
+        for chart in self.atlas:
+            chart._simplif_profile = profile
+
     def irange(self, start=None):
         r"""
         Single index generator.
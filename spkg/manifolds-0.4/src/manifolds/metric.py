@@ -167,24 +167,238 @@ class Metric(SymBilinFormField):
         self._determinants = {} # determinants in various frames
         self._sqrt_abs_dets = {} # sqrt(abs(det g)) in various frames
         self._vol_forms = [] # volume form and associated tensors
-
-    def _del_derived(self):
+        # block structures of the components in various frames:
+        self._block_structures = {}
+        # curvature invariants (dictionary indexed by their names):
+        self._curv_invariants = {}
+        # Riemann tensor acting on bivectors (cf. _riemann_bivectors):
+        self._riem_bivectors = None
+        # non-redundant indices of the components modified since the last 
+        # computation of the Christoffel symbols (dictionary indexed by the 
+        # frames):
+        self._modified_comp = {}
+
+    def _del_derived(self, frame=None):
         r"""
         Delete the derived quantities
+        
+        INPUT:
+        
+        - ``frame`` -- (default: None) vector frame in which the components 
+          have been modified, those in other frames being unchanged; if None, 
+          the metric is considered as modified in all frames. 
+          
+        The Levi-Civita connection is not deleted: being declared as 
+        depending on the metric (see 
+        :func:`~sage.geometry.manifolds.utilities.add_dependent`), it is 
+        notified by the mother class and deletes only the Christoffel 
+        symbols (and the curvature) computed from the modified components. 
+        
+        EXAMPLE:
+        
+        Only the determinant in the frame where the components are modified 
+        is deleted::
+        
+            sage: M = Manifold(2, 'M')
+            sage: X.<x,y> = M.chart('x y')
+            sage: Y.<u,v> = M.chart('u v')
+            sage: g = Metric(M, 'g')
+            sage: g[0,0], g[1,1] = 1, x^2
+            sage: g.add_comp(Y.frame)[0,0] = 1
+            sage: g.add_comp(Y.frame)[1,1] = u^2
+            sage: dX = g.determinant(X.frame) ; dY = g.determinant(Y.frame)
+            sage: g.add_comp(Y.frame)[1,1] = u^2 + 1
+            sage: g.determinant(X.frame) is dX
+            True
+            sage: g.determinant(Y.frame) is dY
+            False
+            sage: g.determinant(Y.frame).expr(Y)
+            u^2 + 1
+            
+        The components of the inverse metric in a frame where the metric 
+        has no components of its own are deleted, since they may have been 
+        computed from the modified components::
+        
+            sage: N = Manifold(2, 'N')
+            sage: X.<x,y> = N.chart('x y')
+            sage: Y.<u,v> = N.chart('u v')
+            sage: trans = X.transition_map(Y, (x+y, x-y))
+            sage: trans.set_inverse((u+v)/2, (u-v)/2)
+            sage: h = Metric(N, 'h')
+            sage: h[0,0], h[1,1] = 1, 1
+            sage: h.inverse().comp(Y.frame)[0,0, Y]
+            2
+            sage: h.add_comp(X.frame)[0,0] = 4
+            sage: Y.frame in h.inverse().components
+            False
+            sage: h.inverse().comp(Y.frame)[0,0, Y]
+            5/4
+        
+        """
+        # First the derived quantities from the mother class are deleted 
+        # (this includes the notification of the connection):
+        SymBilinFormField._del_derived(self, frame)
+        if frame is None:
+            # The inverse metric is cleared: 
+            self._inverse.components.clear()
+            self._inverse._del_derived()
+            # The dictionary of determinants over the various frames is 
+            # cleared:
+            self._determinants.clear()
+            self._sqrt_abs_dets.clear()
+            self._block_structures.clear()
+        else:
+            # Only the quantities computed from the components in frame are
+            # deleted:
+            # the inverse components in the frames where self has no 
+            # components have been obtained by change of frame, possibly 
+            # from those in frame, and are deleted as well:
+            outdated = [ifr for ifr in self._inverse.components
+                        if ifr == frame or ifr not in self.components]
+            for ifr in outdated:
+                del self._inverse.components[ifr]
+            if outdated == [frame]:
+                self._inverse._del_derived(frame)
+            elif outdated:
+                self._inverse._del_derived()
+            if frame in self._determinants:
+                del self._determinants[frame]
+            if frame in self._sqrt_abs_dets:
+                del self._sqrt_abs_dets[frame]
+            self._block_structures.pop(frame, None)
+        # The Weyl tensor and the curvature invariants are reset:
+        self._weyl = None
+        self._curv_invariants.clear()
+        self._riem_bivectors = None
+        # The volume form and the associated tensors are deleted if they 
+        # might have been computed from the modified components:
+        if frame is None or frame is self.domain.def_frame:
+            del self._vol_forms[:]
+
+    def _source_modified(self, source, frame):
+        r"""
+        Delete the derived quantities that depend on the Riemann curvature
+        tensor of the Levi-Civita connection ``source``, which has been 
+        modified (see :func:`~sage.geometry.manifolds.utilities.add_dependent`). 
+        
         """
-        # First the derived quantities from the mother class are deleted:
-        SymBilinFormField._del_derived(self)
-        # The inverse metric is cleared: 
-        self._inverse.components.clear()
-        self._inverse._del_derived()
-        # The connection and Weyl tensor are reset to None:
-        self._connection = None
         self._weyl = None
-        # The dictionary of determinants over the various frames is cleared:
-        self._determinants.clear()
-        self._sqrt_abs_dets.clear()
-        # The volume form and the associated tensors is deleted:
-        del self._vol_forms[:]
+        self._curv_invariants.clear()
+        self._riem_bivectors = None
+
+    def set_comp(self, frame=None):
+        r"""
+        Return the components in a given frame for assignment.
+        
+        See :meth:`TensorField.set_comp` for details. Since the components 
+        are then modified without any control, the record of the modified 
+        components (see :meth:`__setitem__`) is cleared. 
+        
+        """
+        self._modified_comp.clear()
+        return SymBilinFormField.set_comp(self, frame)
+
+    def add_comp(self, frame=None):
+        r"""
+        Return the components in a given frame for assignment, keeping the
+        components in other frames. 
+        
+        See :meth:`TensorField.add_comp` for details. Since the components 
+        are then modified without any control, the record of the modified 
+        components in ``frame`` (see :meth:`__setitem__`) is cleared. 
+        
+        """
+        if frame is None: frame = self.domain.def_frame
+        self._modified_comp.pop(frame, None)
+        return SymBilinFormField.add_comp(self, frame)
+
+    def __setitem__(self, indices, value):
+        r"""
+        Set the component w.r.t. the domain default frame corresponding 
+        to the given indices.
+        
+        When a single component is modified, its indices are recorded, so 
+        that the Christoffel symbols and the curvature tensors of the 
+        Levi-Civita connection are updated only for the entries that depend 
+        on it, instead of being computed from scratch. 
+
+        INPUT:
+        
+        - ``indices`` -- list of indices, possibly ending with the chart in 
+          which ``value`` is expressed
+        - ``value`` -- value of the component
+        
+        EXAMPLE:
+        
+        Perturbation of a component of a metric on a 2-dimensional 
+        manifold::
+        
+            sage: M = Manifold(2, 'M', start_index=1)
+            sage: X.<r,th> = M.chart(r'r:(0,+oo) th:(0,pi):\theta')
+            sage: g = Metric(M, 'g')
+            sage: g[1,1], g[2,2] = 1, r^2
+            sage: nab = g.connection()
+            sage: nab.coef()[:]
+            [[[0, 0], [0, -r]], [[0, 1/r], [1/r, 0]]]
+            sage: g[2,2] = 2*r^2
+            sage: g._modified_comp
+            {coordinate frame (M, (d/dr,d/dth)): set([(2, 2)])}
+            
+        Only the Christoffel symbols `\Gamma^2_{\ \, ij}` and 
+        `\Gamma^1_{\ \, 22}` are recomputed::
+        
+            sage: nab.coef()[:]
+            [[[0, 0], [0, -2*r]], [[0, 1/r], [1/r, 0]]]
+            sage: g._modified_comp
+            {}
+            sage: g.ricci_scalar().expr()
+            0
+
+        """
+        frame = self.domain.def_frame
+        ind = self._single_index(indices)
+        if ind is None or frame not in self.components:
+            # the modification is not tracked:
+            SymBilinFormField.__setitem__(self, indices, value)
+            return
+        self.components[frame][indices] = value
+        # the components in other frames are deleted, as in set_comp:
+        other_frames = set(self.components.keys())
+        other_frames.update(self._inverse.components.keys())
+        other_frames.update(self._determinants.keys())
+        other_frames.discard(frame)
+        self.del_other_comp(frame)
+        for fr in other_frames:
+            self._modified_comp.pop(fr, None)
+            self._del_derived(fr)
+        # the modification in frame is recorded before the derived quantities 
+        # are notified: 
+        self._modified_comp.setdefault(frame, set()).add(ind)
+        self._del_derived(frame)
+
+    def _single_index(self, indices):
+        r"""
+        Return the non-redundant pair of indices ``(i,j)``, with `i\leq j`, 
+        if ``indices`` refers to a single component, or None otherwise 
+        (slice, list of values...). 
+        
+        """
+        from chart import Chart
+        if isinstance(indices, list):
+            if indices and isinstance(indices[0], (list, tuple)):
+                indices = indices[0]
+            indices = tuple(indices)
+        if not isinstance(indices, tuple):
+            return None
+        if indices and isinstance(indices[-1], Chart):
+            indices = indices[:-1]
+        if len(indices) != 2:
+            return None
+        try:
+            i, j = int(indices[0]), int(indices[1])
+        except TypeError:   # case of a slice
+            return None
+        return (min(i,j), max(i,j))
 
     def signature(self):
         r"""
@@ -226,12 +440,92 @@ class Metric(SymBilinFormField):
         if symbiform.manifold != self.manifold:
             raise TypeError("The manifold of the symmetric bilinear form " + 
                             "differs from that of the metric.")
+        self._del_derived()  # for the objects that depend on self
         self.domain = symbiform.domain
         self._init_derived()
         self.components.clear()
         for frame in symbiform.components:
             self.components[frame] = symbiform.components[frame].copy()
         
+    def block_structure(self, frame=None):
+        r"""
+        Return the block structure of the metric components in a given frame.
+        
+        The blocks are determined from the pattern of the nonzero components 
+        `g_{ij}`: two indices `i` and `j` belong to the same block if they are
+        connected by a chain of nonzero off-diagonal components. The 
+        inverse metric, the determinant, the Christoffel symbols and the 
+        Riemann tensor are computed block by block, or from closed formulas 
+        for a diagonal metric (all blocks of size 1). 
+        
+        INPUT:
+        
+        - ``frame`` -- (default: None) vector frame with respect to which the
+          components `g_{ij}` are considered; if None, the domain's default 
+          frame is used. If a chart is provided, the associated coordinate 
+          frame is used
+          
+        OUTPUT:
+        
+        - list of the blocks, each block being a sorted list of indices
+        
+        EXAMPLES:
+        
+        The Kerr metric in Boyer-Lindquist coordinates is block-diagonal, 
+        with a `(t,\phi)` block::
+        
+            sage: M = Manifold(4, 'M')
+            sage: X.<t,r,th,ph> = M.chart(r't r:(0,+oo) th:(0,pi):\theta ph:(0,2*pi):\phi')
+            sage: var('m a')
+            (m, a)
+            sage: rho2 = r^2 + (a*cos(th))^2
+            sage: Delta = r^2 -2*m*r + a^2
+            sage: g = LorentzMetric(M, 'g')
+            sage: g[0,0] = -(1-2*m*r/rho2)
+            sage: g[0,3] = -2*a*m*r*sin(th)^2/rho2
+            sage: g[1,1], g[2,2] = rho2/Delta, rho2
+            sage: g[3,3] = (r^2+a^2+2*m*r*(a*sin(th))^2/rho2)*sin(th)^2
+            sage: g.block_structure()
+            [[0, 3], [1], [2]]
+            sage: g.is_diagonal()
+            False
+            
+        Without the off-diagonal component, the metric becomes diagonal::
+        
+            sage: g[0,3] = 0
+            sage: g.block_structure()
+            [[0], [1], [2], [3]]
+            sage: g.is_diagonal()
+            True
+
+        """
+        from utilities import index_blocks
+        if frame is None:
+            frame = self.domain.def_frame
+        if frame in self.domain.atlas:
+            # frame is actually a chart and is changed to the associated 
+            # coordinate frame:
+            frame = frame.frame
+        if frame not in self._block_structures:
+            gg = self.comp(frame)
+            pairs = [ind for ind in gg._comp if ind[0] != ind[1]]
+            self._block_structures[frame] = index_blocks(
+                                              self.manifold.irange(), pairs)
+        return self._block_structures[frame]
+
+    def is_diagonal(self, frame=None):
+        r"""
+        Return True if the metric components in the given frame are diagonal
+        and False otherwise. 
+        
+        See :meth:`block_structure` for details. 
+        
+        """
+        for block in self.block_structure(frame):
+            if len(block) > 1:
+                return False
+        return True
+
     def inverse(self):
         r"""
         Return the inverse metric.
@@ -266,31 +560,41 @@ class Metric(SymBilinFormField):
         from sage.matrix.constructor import matrix
         from component import CompFullySym
         from vectorframe import CoordFrame
-        from utilities import simplify_chain
+        from utilities import simple_inverse, simplify_chain
         # Is the inverse metric up to date ?
         for frame in self.components:
             if frame not in self._inverse.components:
                 # the computation is necessary
-                manif = self.manifold
                 dom = self.domain
                 if isinstance(frame, CoordFrame):
                     chart = frame.chart
                 else:
                     chart = dom.def_chart
-                si = manif.sindex
-                nsi = manif.dim + si
+                gg = self.comp(frame)
                 try:    
-                    gmat = matrix(
-                              [[self.comp(frame)[i, j, chart].express 
-                              for j in range(si, nsi)] for i in range(si, nsi)])
+                    gexpr = dict([(ind, gg[ind[0], ind[1], chart].express)
+                                  for ind in gg._comp])
                 except (KeyError, ValueError):
                     continue
-                gmat_inv = gmat.inverse()
+                simplif = lambda x: simplify_chain(x, chart._simplif_profile)
+                # Each block of the metric components is inverted separately
+                # (for a diagonal metric, g^{ii} = 1/g_{ii}), the blocks 
+                # being provided to simple_inverse, with indices starting 
+                # from 0:
+                si = self.manifold.sindex
+                irange = list(self.manifold.irange())
+                mat = matrix([[gexpr.get((min(i,j), max(i,j)), 0) 
+                               for j in irange] for i in irange])
+                blocks = [[i-si for i in block] 
+                          for block in self.block_structure(frame)]
+                mat_inv = simple_inverse(mat, simplif, blocks=blocks)
                 cinv = CompFullySym(frame, 2)
-                for i in range(si, nsi):
-                    for j in range(i, nsi):   # symmetry taken into account
-                        cinv[i, j, chart] = simplify_chain(
-                                                        gmat_inv[i-si,j-si])
+                for block in blocks:
+                    nb = len(block)
+                    for p in range(nb):
+                        for q in range(p, nb):   # symmetry taken into account
+                            i = block[p] ; j = block[q]
+                            cinv[i+si, j+si, chart] = mat_inv[i,j]
                 self._inverse.components[frame] = cinv
         return self._inverse
         
@@ -614,6 +918,7 @@ class Metric(SymBilinFormField):
 
         """
         from rank2field import IdentityMap
+        from utilities import add_dependent
         if self._weyl is None:
             n = self.manifold.dim
             if n < 3:
@@ -621,6 +926,7 @@ class Metric(SymBilinFormField):
                                  "manifold of dimension n <= 2.")
             delta = IdentityMap(self.domain)
             riem = self.riemann()
+            add_dependent(self.connection(), self) # for the Riemann tensor
             ric = self.ricci()
             rscal = self.ricci_scalar()
             # First index of the Ricci tensor raised with the metric
@@ -640,7 +946,571 @@ class Metric(SymBilinFormField):
             else:
                 self._weyl.latex_name = latex_name
         return self._weyl
+
+    def _riemann_type_down(self, tens, frame, chart):
+        r"""
+        Return the independent components in ``frame`` of a tensor field of 
+        type (1,3) having the symmetries of the Riemann tensor (Riemann or 
+        Weyl tensor), with the first index lowered:
+        `T_{abcd} = g_{ae} T^e_{\ \, bcd}`, the sum being performed on the 
+        nonzero metric components only. 
+        
+        """
+        from component import CompRiemannSym
+        manif = self.manifold
+        gg = self.comp(frame)
+        ct = tens.comp(frame)
+        nonzero_g = {}
+        for i in manif.irange():
+            nonzero_g[i] = [s for s in manif.irange() 
+                            if (min(i,s), max(i,s)) in gg._comp]
+        cdown = CompRiemannSym(frame)
+        for a, b, c, d in cdown.non_redundant_index_generator():
+            rsum = 0
+            for e in nonzero_g[a]:
+                rsum += gg[a,e, chart] * ct[e,b,c,d, chart]
+            cdown[a,b,c,d, chart] = rsum
+        return cdown
+
+    def _bivector_inverse(self, frame, chart):
+        r"""
+        Return the inverse metric acting on bivectors. 
+        
+        A 4-index tensor `T_{abcd}` antisymmetric in `(a,b)` and in `(c,d)` 
+        is regarded as a matrix `T_{AB}`, the indices `A=(a,b)` and 
+        `B=(c,d)` running on the `n(n-1)/2` pairs with `a<b` and `c<d`. 
+        Raising the indices of such a tensor amounts to a product by the 
+        symmetric matrix 
+        
+        .. MATH::
+        
+            G^{AB} = g^{ac} g^{bd} - g^{ad} g^{bc}
+            
+        OUTPUT:
+        
+        - list of the pairs `(a,b)`, `a<b`, labelling the bivectors
+        - dictionary of the nonzero components of `G`: for each integer `A`, 
+          list of the pairs `(B, G^{AB})`
+        
+        """
+        manif = self.manifold
+        ginv = self.inverse().comp(frame)
+        pairs = [(a,b) for a in manif.irange() 
+                 for b in manif.irange(start=a+1)]
+        gbiv = {}
+        for ia, (a,b) in enumerate(pairs):
+            gbiv[ia] = []
+            for ib, (c,d) in enumerate(pairs):
+                rsum = chart.zero_function
+                if (min(a,c), max(a,c)) in ginv._comp and \
+                   (min(b,d), max(b,d)) in ginv._comp:
+                    rsum += ginv[a,c, chart] * ginv[b,d, chart]
+                if (min(a,d), max(a,d)) in ginv._comp and \
+                   (min(b,c), max(b,c)) in ginv._comp:
+                    rsum -= ginv[a,d, chart] * ginv[b,c, chart]
+                if not rsum.is_zero():
+                    gbiv[ia].append((ib, rsum))
+        return pairs, gbiv
+
+    def _bivector_raise(self, cdown, pairs, gbiv, chart):
+        r"""
+        Raise the indices of a tensor having the symmetries of the Riemann 
+        tensor, regarded as a symmetric matrix `T_{AB}` acting on bivectors 
+        (see :meth:`_bivector_inverse`). 
+        
+        OUTPUT:
+        
+        - dictionaries of the nonzero values of `T_{AB}`, 
+          `T^A_{\ \, B} = G^{AC} T_{CB}` and `T^{AB} = T^A_{\ \, C} G^{CB}`, 
+          indexed by the pairs of integers `(A,B)`; `T^{AB}` being 
+          symmetric, it is computed for `A\leq B` only
+          
+        """
+        npairs = len(pairs)
+        tdown = {}
+        for ia, (a,b) in enumerate(pairs):
+            for ib, (c,d) in enumerate(pairs):
+                val = cdown[a,b,c,d, chart]
+                if not val.is_zero():
+                    tdown[(ia,ib)] = val
+        tmixed = {}
+        for ia in range(npairs):
+            for ib in range(npairs):
+                rsum = chart.zero_function
+                for ic, gval in gbiv[ia]:
+                    if (ic,ib) in tdown:
+                        rsum += gval * tdown[(ic,ib)]
+                if not rsum.is_zero():
+                    tmixed[(ia,ib)] = rsum
+        tup = {}
+        for ia in range(npairs):
+            for ib in range(ia, npairs):
+                rsum = chart.zero_function
+                for ic, gval in gbiv[ib]:
+                    if (ia,ic) in tmixed:
+                        rsum += tmixed[(ia,ic)] * gval
+                if not rsum.is_zero():
+                    tup[(ia,ib)] = rsum
+        return tdown, tmixed, tup
+
+    def _bivector_square(self, tdown, tup, chart):
+        r"""
+        Return the full contraction `T_{abcd} T^{abcd} = 4 T_{AB} T^{AB}` of 
+        a tensor having the symmetries of the Riemann tensor, from the 
+        output of :meth:`_bivector_raise`, the sum being performed on 
+        `A\leq B` only, with multiplicity 2 for `A<B`.
+        
+        """
+        rsum1 = chart.zero_function
+        rsum2 = chart.zero_function
+        for (ia,ib), val in tup.items():
+            if (ia,ib) in tdown:
+                if ia == ib:
+                    rsum1 += tdown[(ia,ib)] * val
+                else:
+                    rsum2 += tdown[(ia,ib)] * val
+        return 4*rsum1 + 8*rsum2
+
+    def _invariant_field(self, resu, chart):
+        r"""
+        Return the scalar field having the coordinate expression ``resu`` in 
+        ``chart``. 
+        
+        """
+        from scalarfield import ScalarField
+        field = ScalarField(self.domain)
+        field.add_expr(resu.express, chart=chart)
+        return field
+
+    def _riemann_bivectors(self, frame=None):
+        r"""
+        Return the fully covariant Riemann tensor regarded as a symmetric 
+        matrix acting on bivectors, as well as its versions with some indices 
+        raised (see :meth:`_bivector_raise`). 
+        
+        The computation is performed in the frame in which the Riemann 
+        tensor has been computed, from the independent components of the 
+        fully covariant Riemann tensor stored by the Levi-Civita connection 
+        if available. The result is stored until the metric is modified.
+        
+        OUTPUT:
+        
+        - dictionary with keys 'frame', 'chart', 'pairs', 'gbiv', 'down', 
+          'mixed' and 'up'
+          
+        """
+        from vectorframe import CoordFrame
+        from utilities import add_dependent
+        if self._riem_bivectors is None:
+            nab = self.connection()
+            riem = self.riemann(frame)
+            add_dependent(nab, self) # for the Riemann tensor
+            frame = nab._derived_frames['riemann']
+            if isinstance(frame, CoordFrame):
+                chart = frame.chart
+            else:
+                chart = self.domain.def_chart
+            rdown = nab._riemann_down
+            if rdown is not None and frame in rdown.components:
+                cdown = rdown.components[frame]
+            else:
+                cdown = self._riemann_type_down(riem, frame, chart)
+            pairs, gbiv = self._bivector_inverse(frame, chart)
+            tdown, tmixed, tup = self._bivector_raise(cdown, pairs, gbiv, 
+                                                      chart)
+            self._riem_bivectors = {'frame': frame, 'chart': chart, 
+                                    'pairs': pairs, 'gbiv': gbiv, 
+                                    'down': tdown, 'mixed': tmixed, 
+                                    'up': tup}
+        return self._riem_bivectors
+
+    def kretschmann(self, frame=None, name=None, latex_name=None):
+        r"""
+        Return the Kretschmann scalar associated with the metric.
+        
+        The Kretschmann scalar is the full contraction of the Riemann 
+        tensor with itself: 
+        
+        .. MATH::
+        
+            K = R_{abcd} R^{abcd}
             
+        It is computed from the independent components of the fully 
+        covariant Riemann tensor, regarded as a symmetric matrix acting on 
+        bivectors (pairs of indices `(a,b)` with `a<b`), which reduces the 
+        sums to `n(n-1)(n(n-1)+2)/8` terms with precomputed multiplicities 
+        (21 terms for `n=4`, instead of 256). 
+        
+        INPUT:
+        
+        - ``frame`` -- (default: None) vector frame in which the Riemann 
+          tensor must be computed, if it has not been computed yet
+        - ``name`` -- (default: None) name given to the Kretschmann scalar; 
+          if none, it is set to "K(g)", where "g" is the metric's name
+        - ``latex_name`` -- (default: None) LaTeX symbol to denote the 
+          Kretschmann scalar; if none, it is set to "K(g)", where "g" is 
+          the metric's name
+          
+        OUTPUT:
+        
+        - the Kretschmann scalar `K`, as an instance of :class:`ScalarField`
+        
+        EXAMPLES:
+        
+        Kretschmann scalar of the Schwarzschild metric::
+        
+            sage: M = Manifold(4, 'M')
+            sage: X.<t,r,th,ph> = M.chart(r't r:(0,+oo) th:(0,pi):\theta ph:(0,2*pi):\phi')
+            sage: m = var('m')
+            sage: g = LorentzMetric(M, 'g')
+            sage: g[0,0], g[1,1] = -(1-2*m/r), 1/(1-2*m/r)
+            sage: g[2,2], g[3,3] = r^2, (r*sin(th))^2
+            sage: K = g.kretschmann() ; K
+            scalar field 'K(g)' on the 4-dimensional manifold 'M'
+            sage: K.expr()
+            48*m^2/r^6
+            
+        The Kretschmann scalar of the 2-sphere of radius `a`::
+        
+            sage: S = Manifold(2, 'S^2', start_index=1)
+            sage: c_spher.<th,ph> = S.chart(r'th:[0,pi]:\theta ph:[0,2*pi):\phi')
+            sage: a = var('a')
+            sage: h = Metric(S, 'h')
+            sage: h[1,1], h[2,2] = a^2, a^2*sin(th)^2
+            sage: h.kretschmann().expr()
+            4/a^4
+
+        """
+        if 'kretschmann' not in self._curv_invariants:
+            biv = self._riemann_bivectors(frame)
+            chart = biv['chart']
+            resu = self._bivector_square(biv['down'], biv['up'], chart)
+            self._curv_invariants['kretschmann'] = \
+                                    self._invariant_field(resu, chart)
+        resu = self._curv_invariants['kretschmann']
+        if name is None:
+            resu.name = "K(" + self.name + ")"
+        else:
+            resu.name = name
+        if latex_name is None:
+            resu.latex_name = r"K\left(" + self.latex_name + r"\right)"
+        else:
+            resu.latex_name = latex_name
+        return resu
+
+    def chern_pontryagin(self, frame=None, name=None, latex_name=None):
+        r"""
+        Return the Chern-Pontryagin scalar associated with the metric of a 
+        4-dimensional manifold. 
+        
+        The Chern-Pontryagin scalar is the full contraction of the Riemann 
+        tensor with its (left) dual: 
+        
+        .. MATH::
+        
+            P = {}^*R_{abcd} R^{abcd} 
+            \quad\mbox{with}\quad
+            {}^*R_{abcd} = \frac{1}{2} \epsilon_{abef} R^{ef}_{\ \ \ cd}
+            
+        `\epsilon` being the volume form associated with the metric and 
+        the orientation of the frame in which the Riemann tensor is 
+        computed. It is also the full contraction of the Weyl tensor with 
+        its dual. In terms of bivectors (cf. :meth:`kretschmann`), `\epsilon` 
+        maps each pair `(a,b)` to the complementary pair only, so that 
+        the sums involve at most 36 terms. 
+        
+        INPUT:
+        
+        - ``frame`` -- (default: None) vector frame in which the Riemann 
+          tensor must be computed, if it has not been computed yet
+        - ``name`` -- (default: None) name given to the Chern-Pontryagin 
+          scalar; if none, it is set to "P(g)", where "g" is the metric's 
+          name
+        - ``latex_name`` -- (default: None) LaTeX symbol to denote the 
+          Chern-Pontryagin scalar; if none, it is set to "P(g)", where "g" 
+          is the metric's name
+          
+        OUTPUT:
+        
+        - the Chern-Pontryagin scalar `P`, as an instance of 
+          :class:`ScalarField`
+        
+        EXAMPLE:
+        
+        The Chern-Pontryagin scalar vanishes for the Schwarzschild metric, 
+        as for any static metric::
+        
+            sage: M = Manifold(4, 'M')
+            sage: X.<t,r,th,ph> = M.chart(r't r:(0,+oo) th:(0,pi):\theta ph:(0,2*pi):\phi')
+            sage: m = var('m')
+            sage: g = LorentzMetric(M, 'g')
+            sage: g[0,0], g[1,1] = -(1-2*m/r), 1/(1-2*m/r)
+            sage: g[2,2], g[3,3] = r^2, (r*sin(th))^2
+            sage: g.chern_pontryagin()
+            scalar field 'P(g)' on the 4-dimensional manifold 'M'
+            sage: g.chern_pontryagin() == 0
+            True
+            
+        For the Kerr metric in Boyer-Lindquist coordinates, the 
+        Chern-Pontryagin scalar does not vanish; it agrees with the 
+        brute-force contraction of 
+        `\frac{1}{2} \epsilon_{abef} R^{ef}_{\ \ \ cd}` with `R^{abcd}`::
+        
+            sage: M = Manifold(4, 'M')
+            sage: X.<t,r,th,ph> = M.chart(r't r:(0,+oo) th:(0,pi):\theta ph:(0,2*pi):\phi')
+            sage: m, a = var('m a')
+            sage: rho2 = r^2 + (a*cos(th))^2
+            sage: Delta = r^2 - 2*m*r + a^2
+            sage: g = LorentzMetric(M, 'g')
+            sage: g[0,0] = -(1 - 2*m*r/rho2)
+            sage: g[0,3] = -2*a*m*r*sin(th)^2/rho2
+            sage: g[1,1], g[2,2] = rho2/Delta, rho2
+            sage: g[3,3] = (r^2 + a^2 + 2*m*r*(a*sin(th))^2/rho2)*sin(th)^2
+            sage: P = g.chern_pontryagin()  # long time
+            sage: P == 0  # long time
+            False
+            sage: eps = g.volume_form()  # long time
+            sage: R2 = g.riemann().up(g, 1)  # long time; components R^{ab}_{cd}
+            sage: R4 = g.riemann().up(g)  # long time; components R^{abcd}
+            sage: P0 = sum(eps[p[0],p[1],p[2],p[3]] * R2[p[2],p[3],c,d] *  # long time
+            ....:          R4[p[0],p[1],c,d] for p in Permutations(range(4))
+            ....:          for c in M.irange() for d in M.irange()) / 2
+            sage: (P.expr() - P0).simplify_full()  # long time
+            0
+        
+        """
+        from sage.combinat.permutation import Permutation
+        if self.manifold.dim != 4:
+            raise ValueError("The Chern-Pontryagin scalar is defined only " + 
+                             "for a manifold of dimension 4.")
+        if 'chern_pontryagin' not in self._curv_invariants:
+            biv = self._riemann_bivectors(frame)
+            chart = biv['chart']
+            pairs = biv['pairs']
+            tmixed = biv['mixed']
+            tup = biv['up']
+            si = self.manifold.sindex
+            # Complementary pair of each pair and sign of the permutation 
+            # (a,b,e,f) of (0,1,2,3):
+            dual = {}
+            for ia, (a,b) in enumerate(pairs):
+                e, f = [i for i in self.manifold.irange() if i not in (a,b)]
+                perm = Permutation([a-si+1, b-si+1, e-si+1, f-si+1])
+                dual[ia] = (pairs.index((e,f)), perm.sign())
+            rsum = chart.zero_function
+            for (ia,ib), val in tup.items():
+                ie, sign = dual[ia]
+                if (ie,ib) in tmixed:
+                    rsum += sign * tmixed[(ie,ib)] * val
+                if ia != ib:
+                    # symmetric term (B,A): 
+                    ie, sign = dual[ib]
+                    if (ie,ia) in tmixed:
+                        rsum += sign * tmixed[(ie,ia)] * val
+            sqrt_det = self.sqrt_abs_det(biv['frame']).function_chart(chart)
+            resu = 4 * sqrt_det * rsum
+            self._curv_invariants['chern_pontryagin'] = \
+                                    self._invariant_field(resu, chart)
+        resu = self._curv_invariants['chern_pontryagin']
+        if name is None:
+            resu.name = "P(" + self.name + ")"
+        else:
+            resu.name = name
+        if latex_name is None:
+            resu.latex_name = r"P\left(" + self.latex_name + r"\right)"
+        else:
+            resu.latex_name = latex_name
+        return resu
+
+    def weyl_square(self, frame=None, name=None, latex_name=None):
+        r"""
+        Return the full contraction of the Weyl conformal tensor with itself.
+        
+        If the Weyl tensor has already been computed (see :meth:`weyl`), 
+        `C_{abcd} C^{abcd}` is computed from its independent components 
+        regarded as a symmetric matrix acting on bivectors (cf. 
+        :meth:`kretschmann`). Otherwise, it is obtained without computing 
+        the Weyl tensor from the Kretschmann scalar `K`, the Ricci tensor 
+        and the Ricci scalar `r`:
+        
+        .. MATH::
+        
+            C_{abcd} C^{abcd} = K - \frac{4}{n-2} R_{ab} R^{ab} 
+                + \frac{2}{(n-1)(n-2)} r^2
+                
+        INPUT:
+        
+        - ``frame`` -- (default: None) vector frame in which the Riemann 
+          tensor must be computed, if it has not been computed yet
+        - ``name`` -- (default: None) name given to the result; if none, it 
+          is set to "C2(g)", where "g" is the metric's name
+        - ``latex_name`` -- (default: None) LaTeX symbol to denote the 
+          result; if none, it is set to "C^2(g)", where "g" is the metric's 
+          name
+          
+        OUTPUT:
+        
+        - the scalar `C_{abcd} C^{abcd}`, as an instance of 
+          :class:`ScalarField`
+        
+        EXAMPLES:
+        
+        For the Schwarzschild metric, which is Ricci-flat, `C_{abcd} C^{abcd}` 
+        coincides with the Kretschmann scalar::
+        
+            sage: M = Manifold(4, 'M')
+            sage: X.<t,r,th,ph> = M.chart(r't r:(0,+oo) th:(0,pi):\theta ph:(0,2*pi):\phi')
+            sage: m = var('m')
+            sage: g = LorentzMetric(M, 'g')
+            sage: g[0,0], g[1,1] = -(1-2*m/r), 1/(1-2*m/r)
+            sage: g[2,2], g[3,3] = r^2, (r*sin(th))^2
+            sage: g.weyl_square() ; g.weyl_square().expr()
+            scalar field 'C2(g)' on the 4-dimensional manifold 'M'
+            48*m^2/r^6
+            
+        The Weyl tensor of a conformally flat metric vanishes::
+        
+            sage: M = Manifold(4, 'M')
+            sage: X.<t,x,y,z> = M.chart('t x y z')
+            sage: f = function('f', t)
+            sage: g = LorentzMetric(M, 'g')
+            sage: g[0,0], g[1,1], g[2,2], g[3,3] = -f^2, f^2, f^2, f^2
+            sage: g.weyl_square().expr()
+            0
+            sage: g.kretschmann() == 0
+            False
+            
+        """
+        n = self.manifold.dim
+        if n < 3:
+            raise ValueError("The Weyl tensor is not defined for a " + 
+                             "manifold of dimension n <= 2.")
+        if 'weyl_square' not in self._curv_invariants:
+            biv = self._riemann_bivectors(frame)
+            frame = biv['frame']
+            chart = biv['chart']
+            if self._weyl is not None:
+                # The Weyl tensor has been computed already:
+                cdown = self._riemann_type_down(self._weyl, frame, chart)
+                tdown, tmixed, tup = self._bivector_raise(cdown, biv['pairs'],
+                                                          biv['gbiv'], chart)
+                resu = self._bivector_square(tdown, tup, chart)
+            else:
+                manif = self.manifold
+                kretsch = self._bivector_square(biv['down'], biv['up'], 
+                                                chart)
+                ginv = self.inverse().comp(frame)
+                cric = self.ricci(frame).comp(frame)
+                nonzero_inv = {}
+                for i in manif.irange():
+                    nonzero_inv[i] = [s for s in manif.irange() 
+                                      if (min(i,s), max(i,s)) in ginv._comp]
+                # R_{ab} R^{ab}, the symmetry of R^{ab} being taken into 
+                # account:
+                ric2 = chart.zero_function
+                for a in manif.irange():
+                    for b in manif.irange(start=a):
+                        ricup = chart.zero_function
+                        for c in nonzero_inv[a]:
+                            for d in nonzero_inv[b]:
+                                ricup += ginv[a,c, chart] * ginv[b,d, chart] \
+                                         * cric[c,d, chart]
+                        if a == b:
+                            ric2 += cric[a,b, chart] * ricup
+                        else:
+                            ric2 += 2 * cric[a,b, chart] * ricup
+                rscal = self.ricci_scalar().function_chart(chart)
+                resu = kretsch - 4*ric2/(n-2) + 2*rscal*rscal/((n-1)*(n-2))
+            self._curv_invariants['weyl_square'] = \
+                                    self._invariant_field(resu, chart)
+        resu = self._curv_invariants['weyl_square']
+        if name is None:
+            resu.name = "C2(" + self.name + ")"
+        else:
+            resu.name = name
+        if latex_name is None:
+            resu.latex_name = r"C^2\left(" + self.latex_name + r"\right)"
+        else:
+            resu.latex_name = latex_name
+        return resu
+
+    def curvature_invariants(self, frame=None, at=None, chart=None):
+        r"""
+        Return the standard curvature invariants of the metric, possibly 
+        evaluated numerically at a point or on a grid of points. 
+        
+        The invariants are the Kretschmann scalar (see :meth:`kretschmann`), 
+        the square of the Weyl tensor if `n\geq 3` (see :meth:`weyl_square`)
+        and the Chern-Pontryagin scalar if `n=4` (see 
+        :meth:`chern_pontryagin`). They are computed once and stored until 
+        the metric is modified. 
+        
+        INPUT:
+        
+        - ``frame`` -- (default: None) vector frame in which the Riemann 
+          tensor must be computed, if it has not been computed yet
+        - ``at`` -- (default: None) if a point (instance of 
+          :class:`~sage.geometry.manifolds.point.Point`), the invariants are 
+          evaluated numerically at this point; if a list or tuple of NumPy 
+          arrays of coordinate values, the invariants are evaluated on the 
+          corresponding grid (see 
+          :meth:`~sage.geometry.manifolds.scalarfield.ScalarField.evaluate_on_grid`);
+          if None, the invariants are returned as scalar fields
+        - ``chart`` -- (default: None) chart in which the coordinates of the 
+          grid are given; if None, the domain's default chart is used 
+          (unused if ``at`` is not a grid)
+          
+        OUTPUT:
+        
+        - dictionary of the invariants, with keys 'kretschmann', 
+          'weyl_square' and 'chern_pontryagin', the values being scalar 
+          fields, numbers or NumPy masked arrays, depending on ``at``
+        
+        EXAMPLES:
+        
+        Curvature invariants of the Schwarzschild metric with `m=1`::
+        
+            sage: M = Manifold(4, 'M')
+            sage: X.<t,r,th,ph> = M.chart(r't r:(0,+oo) th:(0,pi):\theta ph:(0,2*pi):\phi')
+            sage: g = LorentzMetric(M, 'g')
+            sage: g[0,0], g[1,1] = -(1-2/r), 1/(1-2/r)
+            sage: g[2,2], g[3,3] = r^2, (r*sin(th))^2
+            sage: inv = g.curvature_invariants()
+            sage: sorted(inv.keys())
+            ['chern_pontryagin', 'kretschmann', 'weyl_square']
+            sage: inv['kretschmann'].expr()
+            48/r^6
+            
+        Numerical values at a point::
+        
+            sage: p = Point(M, (0, 2, pi/2, 0))
+            sage: g.curvature_invariants(at=p)['kretschmann']
+            0.750000000000000
+            
+        Values on a grid of points::
+        
+            sage: import numpy
+            sage: rr = numpy.array([1., 2., 4.])
+            sage: g.curvature_invariants(at=(0., rr, 1., 0.))['kretschmann'].data
+            array([  4.80000000e+01,   7.50000000e-01,   1.17187500e-02])
+
+        """
+        from sage.misc.functional import numerical_approx
+        from point import Point
+        n = self.manifold.dim
+        invariants = {'kretschmann': self.kretschmann(frame)}
+        if n >= 3:
+            invariants['weyl_square'] = self.weyl_square(frame)
+        if n == 4:
+            invariants['chern_pontryagin'] = self.chern_pontryagin(frame)
+        if at is None:
+            return invariants
+        if isinstance(at, Point):
+            return dict([(key, numerical_approx(val(at))) 
+                         for key, val in invariants.items()])
+        return dict([(key, val.evaluate_on_grid(chart, *at)) 
+                     for key, val in invariants.items()])
+
     def determinant(self, frame=None):
         r"""
         Determinant of the metric components in the specified frame.
@@ -714,10 +1584,20 @@ class Metric(SymBilinFormField):
             resu = ScalarField(dom)
             gg = self.comp(frame)
             i1 = manif.sindex
+            blocks = self.block_structure(frame)
             for chart in gg[[i1, i1]].express:
-                gm = matrix( [[ gg[i, j, chart].express 
-                            for j in manif.irange()] for i in manif.irange()] )
-                detgm = simplify_chain(simple_determinant(gm))
+                simplif = lambda x: simplify_chain(x, chart._simplif_profile)
+                # product of the determinants of the blocks:
+                detgm = 1
+                for block in blocks:
+                    if len(block) == 1:
+                        i = block[0]
+                        detgm *= gg[i, i, chart].express
+                    else:
+                        gm = matrix( [[ gg[i, j, chart].express 
+                                        for j in block] for i in block] )
+                        detgm *= simple_determinant(gm, simplif)
+                detgm = simplify_chain(detgm, chart._simplif_profile)
                 resu.add_expr(detgm, chart=chart)
             self._determinants[frame] = resu
         return self._determinants[frame]
@@ -808,7 +1688,7 @@ class Metric(SymBilinFormField):
             resu = ScalarField(dom)
             for chart in detg.express:
                 x = self._indic_signat * detg.express[chart].express # |g|
-                x = simplify_chain(sqrt(x))
+                x = simplify_chain(sqrt(x), chart._simplif_profile)
                 resu.add_expr(x, chart=chart)
             self._sqrt_abs_dets[frame] = resu
         return self._sqrt_abs_dets[frame]
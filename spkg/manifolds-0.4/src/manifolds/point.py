@@ -234,6 +234,16 @@ class Point(Element):
             (a^3 - 3*a^2*b + 3*a*b^2 - b^3, a^3 + 3*a^2*b + 3*a*b^2 + b^3)
             sage: p.coordinates
             {chart (M, (u, v)): (a - b, a + b), chart (M, (w, z)): (a^3 - 3*a^2*b + 3*a*b^2 - b^3, a^3 + 3*a^2*b + 3*a*b^2 + b^3)}
+
+        If there is no direct change of coordinates from the charts in which
+        the coordinates are known, the changes of coordinates are composed::
+        
+            sage: p.set_coord((a, b), c_xy)
+            sage: p.coord(c_wz)  # via the chart c_uv
+            (a^3 - 3*a^2*b + 3*a*b^2 - b^3, a^3 + 3*a^2*b + 3*a*b^2 + b^3)
+            sage: M.coord_change(c_xy, c_wz)  # composed change, stored for future use
+            coordinate change from chart (M, (x, y)) to chart (M, (w, z))
+            
         """
         atlas = self.manifold.atlas
         if chart is None:
@@ -273,8 +283,19 @@ class Point(Element):
                                 break
                         if old_chart is not None:
                             break
+                if old_chart is None:
+                    # Search for a sequence of changes of coordinates:
+                    best_path = None
+                    for ochart in self.coordinates:
+                        path = dom.coord_change_path(ochart, chart)
+                        if path is not None and (best_path is None or 
+                                                 len(path) < len(best_path)):
+                            best_path = path
+                    if best_path is not None:
+                        old_chart = best_path[0]
+                        s_old_chart = old_chart
             if old_chart is not None:
-                chcoord = dom.coord_changes[(s_old_chart, chart)]
+                chcoord = dom.coord_change(s_old_chart, chart)
                 self.coordinates[chart] = \
                                     chcoord(*self.coordinates[old_chart])
             else:
@@ -349,15 +349,31 @@ class AutomorphismField(EndomorphismField):
         description += " on the " + str(self.domain)
         return description
         
-    def _del_derived(self):
+    def _del_derived(self, frame=None):
         r"""
         Delete the derived quantities
         
         """
         # First delete the derived quantities pertaining to the mother class:
-        EndomorphismField._del_derived(self)
-        # Then deletes the inverse automorphism:
-        self._inverse = None
+        EndomorphismField._del_derived(self, frame)
+        # Then deletes the inverse automorphism, or only its components in 
+        # the modified frame (they have been computed from the components 
+        # of self in the same frame) and in the frames where self has no 
+        # components (they have been obtained by change of frame, possibly 
+        # from those in the modified frame):
+        if frame is None:
+            self._inverse = None
+        elif self._inverse is not None:
+            outdated = [ifr for ifr in self._inverse.components
+                        if ifr == frame or ifr not in self.components]
+            for ifr in outdated:
+                del self._inverse.components[ifr]
+            if outdated == [frame]:
+                self._inverse._del_derived(frame)
+            elif outdated:
+                self._inverse._del_derived()
+            if self._inverse.components == {}:
+                self._inverse = None
         
     def _new_instance(self):
         r"""
@@ -370,11 +386,29 @@ class AutomorphismField(EndomorphismField):
         r"""
         Return the inverse automorphism.
         
+        The matrix of components in each frame is inverted block by block 
+        (see :func:`~sage.geometry.manifolds.utilities.simple_inverse`). The
+        result is stored for each frame independently, so that only the 
+        components in the frames where ``self`` is modified are recomputed. 
+        
+        EXAMPLE:
+        
+        Inverse of an automorphism field on a 3-dimensional manifold::
+        
+            sage: m = Manifold(3, 'M', start_index=1)
+            sage: c_xyz.<x,y,z> = m.chart('x y z')
+            sage: a = AutomorphismField(m, 'a')
+            sage: a[1,1], a[1,3], a[2,2], a[3,1], a[3,3] = x, y, 2, -y, x
+            sage: ia = a.inverse() ; ia
+            field of tangent-space automorphisms 'inv-a' on the 3-dimensional manifold 'M'
+            sage: ia[1,1], ia[1,3], ia[2,2], ia[3,1]
+            (x/(x^2 + y^2), -y/(x^2 + y^2), 1/2, y/(x^2 + y^2))
+        
         """
         from sage.matrix.constructor import matrix
         from component import Components
         from vectorframe import CoordFrame
-        from utilities import simplify_chain
+        from utilities import simple_inverse, simplify_chain
         if self._inverse is None:
             if self.name is None:
                 inv_name = None
@@ -384,27 +418,31 @@ class AutomorphismField(EndomorphismField):
                 inv_latex_name = None
             else:
                 inv_latex_name = self.latex_name + r'^{-1}'
-            manif = self.manifold
-            dom = self.domain
-            si = manif.sindex ; nsi = manif.dim + si
-            self._inverse = AutomorphismField(dom, inv_name, inv_latex_name)
-            for frame in self.components:
-                if isinstance(frame, CoordFrame):
-                    chart = frame.chart
-                else:
-                    chart = dom.def_chart  #!# to be improved
-                try:    
-                    mat_self = matrix(
-                              [[self.comp(frame)[i, j, chart].express 
-                              for j in range(si, nsi)] for i in range(si, nsi)])
-                except (KeyError, ValueError):
-                    continue
-                mat_inv = mat_self.inverse()
-                cinv = Components(frame, 2)
-                for i in range(si, nsi):
-                    for j in range(si, nsi):   
-                        cinv[i, j, chart] = simplify_chain(mat_inv[i-si,j-si])
-                self._inverse.components[frame] = cinv
+            self._inverse = AutomorphismField(self.domain, inv_name, 
+                                              inv_latex_name)
+        manif = self.manifold
+        dom = self.domain
+        si = manif.sindex ; nsi = manif.dim + si
+        for frame in self.components:
+            if frame in self._inverse.components:
+                continue  # the inverse in this frame is up to date
+            if isinstance(frame, CoordFrame):
+                chart = frame.chart
+            else:
+                chart = dom.def_chart  #!# to be improved
+            try:    
+                mat_self = matrix(
+                          [[self.comp(frame)[i, j, chart].express 
+                          for j in range(si, nsi)] for i in range(si, nsi)])
+            except (KeyError, ValueError):
+                continue
+            mat_inv = simple_inverse(mat_self, 
+                        lambda x: simplify_chain(x, chart._simplif_profile))
+            cinv = Components(frame, 2)
+            for i in range(si, nsi):
+                for j in range(si, nsi):   
+                    cinv[i, j, chart] = mat_inv[i-si,j-si]
+            self._inverse.components[frame] = cinv
         return self._inverse
 
 
@@ -510,12 +548,12 @@ class IdentityMap(AutomorphismField):
         description += " in the tangent spaces of the " + str(self.domain)
         return description
         
-    def _del_derived(self):
+    def _del_derived(self, frame=None):
         r"""
         Delete the derived quantities
         
         """
-        EndomorphismField._del_derived(self)
+        EndomorphismField._del_derived(self, frame)
         
     def _new_comp(self, frame): 
         r"""
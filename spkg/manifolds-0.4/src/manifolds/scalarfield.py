@@ -389,13 +389,24 @@ class ScalarField(DiffMapping, DiffForm):
     # The function _del_derived is mandatory because ScalarField has two mother
     # classes:
     
-    def _del_derived(self):
+    def _del_derived(self, frame=None):
         r"""
         Delete the derived quantities.
+        
+        The argument ``frame`` is not used, since a scalar field has no 
+        components in vector frames. 
         """
         DiffMapping._del_derived(self) # derived quantities of the 1st mother class
         DiffForm._del_derived(self) # derived quantities of the 2nd mother class
 
+    def _simplify_deferred(self):
+        r"""
+        Perform the simplifications of the coordinate expressions that have 
+        been deferred (see :meth:`Chart.defer_simplification`).
+        """
+        for funct in self.express.itervalues():
+            funct._simplify_deferred()
+
     def copy(self):
         r"""
         Return an exact copy of ``self``.
@@ -520,6 +531,21 @@ class ScalarField(DiffMapping, DiffForm):
             sage: f.function_chart(o2)
             -T^2 + X^2
 
+        The changes of coordinates are composed if there is no direct change 
+        between the known charts and the required one::
+        
+            sage: m = Manifold(2, 'M')
+            sage: c_xy.<x,y> = m.chart('x y')
+            sage: c_uv.<u,v> = m.chart('u v')
+            sage: c_UV.<U,V> = m.chart('U V')
+            sage: CoordChange(c_UV, c_uv, U+V, U-V)
+            coordinate change from chart (M, (U, V)) to chart (M, (u, v))
+            sage: CoordChange(c_uv, c_xy, 2*u, v)
+            coordinate change from chart (M, (u, v)) to chart (M, (x, y))
+            sage: f = ScalarField(m, x*y)
+            sage: f.function_chart(c_UV)
+            2*U^2 - 2*V^2
+
         """
         if chart is None:
             chart = self.domain.def_chart
@@ -547,9 +573,15 @@ class ScalarField(DiffMapping, DiffForm):
                         from_chart = known_chart
                         break
                 if from_chart is None:
-                    raise ValueError("No starting chart could be found to " + 
-                           "compute the expression in the " + str(chart))
-            change = self.domain.coord_changes[(chart, from_chart)]
+                    # Search for a sequence of changes of coordinates:
+                    path = self.domain.coord_change_path(chart, 
+                                                         self.express.keys())
+                    if path is None:
+                        raise ValueError("No starting chart could be found " + 
+                               "to compute the expression in the " + 
+                               str(chart))
+                    from_chart = path[-1]
+            change = self.domain.coord_change(chart, from_chart)
             # old coordinates expressed in terms of the new ones:
             coords = [ change.transf.functions[i].express 
                        for i in range(self.manifold.dim) ]
@@ -749,6 +781,91 @@ class ScalarField(DiffMapping, DiffForm):
         return result
 
 
+    def evaluate_on_grid(self, chart, *arrays):
+        r"""
+        Evaluate the scalar field on a grid of points given by NumPy arrays
+        of coordinate values. 
+        
+        The coordinate expression of the scalar field in the chart is 
+        compiled once and evaluated in a vectorized way on the whole grid, 
+        which is much faster than evaluating the scalar field point by 
+        point. 
+        
+        INPUT:
+        
+        - ``chart`` -- chart in which the coordinates are given; if None, the 
+          domain's default chart is used
+        - ``*arrays`` -- one array (or number) per coordinate of ``chart``; 
+          the arrays are broadcast against each other (in the NumPy sense) 
+          to form the grid, so that for instance the output of 
+          ``numpy.meshgrid`` can be passed directly
+          
+        OUTPUT:
+        
+        - NumPy masked array (see ``numpy.ma``) with the shape of the grid, 
+          containing the values of the scalar field; the points at which the 
+          coordinate values are not admissible in the chart domain (see 
+          :meth:`~sage.geometry.manifolds.chart.Chart.valid_coordinates`) are
+          masked. 
+        
+        EXAMPLES:
+        
+        Scalar field on a 2-dimensional manifold evaluated on a grid::
+        
+            sage: m = Manifold(2, 'M')
+            sage: c_xy.<x,y> = m.chart('x y:[0,+oo)')
+            sage: f = ScalarField(m, x^2+y)
+            sage: import numpy
+            sage: xx, yy = numpy.meshgrid([0., 1., 2.], [-1., 1.])
+            sage: res = f.evaluate_on_grid(c_xy, xx, yy)
+            sage: res.mask  # the points with y<0 are masked
+            array([[ True,  True,  True],
+                   [False, False, False]], dtype=bool)
+            sage: res[1]
+            masked_array(data = [1.0 2.0 5.0],
+                         mask = [False False False],
+                   fill_value = 1e+20)
+            <BLANKLINE>
+            
+        Comparison with the pointwise evaluation::
+        
+            sage: p = Point(m, (2, 1))
+            sage: float(f.evaluate_on_grid(c_xy, 2., 1.)) == f(p)
+            True
+            
+        The expression is computed via a change of coordinates if necessary::
+        
+            sage: c_uv.<u,v> = m.chart('u v')
+            sage: CoordChange(c_uv, c_xy, u+v, u-v)
+            coordinate change from chart (M, (u, v)) to chart (M, (x, y))
+            sage: f.evaluate_on_grid(c_uv, numpy.array([1., 2.]), 0.).data
+            array([ 2.,  6.])
+
+        """
+        import numpy
+        from utilities import numpy_function
+        if chart is None:
+            chart = self.domain.def_chart
+        if len(arrays) != self.manifold.dim:
+            raise TypeError(str(self.manifold.dim) + 
+                            " arrays of coordinates must be provided.")
+        arrays = numpy.broadcast_arrays(*[numpy.asarray(a, dtype=float) 
+                                          for a in arrays])
+        valid = chart.valid_coordinates_on_grid(*arrays)
+        expression = self.function_chart(chart).express
+        func = numpy_function(expression, chart.xx)
+        if func is None:
+            raise ValueError("The coordinate expression " + str(expression) + 
+                             " cannot be evaluated numerically.")
+        # The invalid points may lie outside the domain of definition of
+        # the expression, hence the silencing of floating-point warnings: 
+        with numpy.errstate(all='ignore'):
+            values = numpy.asarray(func(*arrays), dtype=float)
+        # a constant expression yields a single value:
+        values = values + numpy.zeros(valid.shape)
+        return numpy.ma.masked_array(values, mask=numpy.logical_not(valid))
+
+
     def pick_a_chart(self):
         r"""
         Return a chart for which the scalar field has an expression. 
@@ -907,6 +1024,19 @@ class ScalarField(DiffMapping, DiffForm):
                         if (chart2, chart1) in coord_changes:
                             other.function_chart(chart1, from_chart=chart2)
                             resu.append(chart1)
+        #
+        # 3/ Search for a common chart via a sequence of changes of 
+        #    coordinates
+        #    ------------------------------------------------------
+        if resu == []:
+            for chart1 in known_expr1:
+                if chart1 not in dom2.atlas:
+                    continue
+                path = dom2.coord_change_path(chart1, known_expr2.keys())
+                if path is not None:
+                    other.function_chart(chart1, from_chart=path[-1])
+                    resu.append(chart1)
+                    break
         if resu == []:
             return None
         else:
@@ -1463,12 +1593,12 @@ class ScalarField(DiffMapping, DiffForm):
         from vectorfield import VectorField
         if not isinstance(vector, VectorField):
             raise TypeError("The argument must be a vector field.")
-        if id(vector) not in self._lie_derivatives:
+        res = self._get_lie_der(vector)
+        if res is None:
             # A new computation must be performed
             res = vector(self)
-            self._lie_derivatives[id(vector)] = (vector, res)
-            vector._lie_der_along_self[id(self)] = self
-        return self._lie_derivatives[id(vector)][1]         
+            self._set_lie_der(vector, res)
+        return res
 
 #******************************************************************************
 
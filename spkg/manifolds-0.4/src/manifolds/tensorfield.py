@@ -324,10 +324,78 @@ EXAMPLES:
 #                  http://www.gnu.org/licenses/
 #******************************************************************************
 
+import weakref
+from collections import OrderedDict
 from sage.structure.sage_object import SageObject
 from sage.rings.integer import Integer
 from domain import Domain
-from component import Components, CompWithSym, CompFullySym, CompFullyAntiSym
+from component import Components, CompWithSym, CompFullySym, CompFullyAntiSym, \
+                      CompRiemannSym
+
+# Maximum number of Lie derivatives stored by each tensor field (see 
+# set_lie_der_cache_size()):
+_lie_der_cache_maxsize = 32
+
+def set_lie_der_cache_size(maxsize):
+    r"""
+    Set the maximum number of Lie derivatives that each tensor field keeps 
+    in memory. 
+    
+    When this number is reached, the least recently used Lie derivative is 
+    discarded (it will be recomputed if required again). 
+    
+    INPUT:
+    
+    - ``maxsize`` -- positive integer
+    
+    EXAMPLES::
+    
+        sage: from sage.geometry.manifolds.tensorfield import set_lie_der_cache_size
+        sage: set_lie_der_cache_size(2)
+        sage: m = Manifold(2, 'M')
+        sage: c_xy.<x,y> = m.chart('x y')
+        sage: f = ScalarField(m, x*y)
+        sage: vv = [VectorField(m) for i in range(3)]
+        sage: for i in range(3):
+        ....:     vv[i][:] = (x^i, 0)
+        ....:     h = f.lie_der(vv[i])
+        sage: len(f._lie_derivatives)
+        2
+        sage: set_lie_der_cache_size(32)  # back to the default
+        
+    """
+    global _lie_der_cache_maxsize
+    if maxsize < 1:
+        raise ValueError("The cache size must be a positive integer.")
+    _lie_der_cache_maxsize = maxsize
+
+def _lie_der_remover(tensor_ref, vid):
+    r"""
+    Return the callback that removes from the cache of Lie derivatives of 
+    the tensor field referred to by ``tensor_ref`` the entry relative to 
+    the vector field of id ``vid``, when the latter is destroyed. 
+    """
+    def remove(vector_ref):
+        tensor = tensor_ref()
+        if tensor is not None:
+            entry = tensor._lie_derivatives.get(vid)
+            if entry is not None and entry[0] is vector_ref:
+                del tensor._lie_derivatives[vid]
+    return remove
+
+def _lie_der_along_remover(vector_ref, tid):
+    r"""
+    Return the callback that removes from the registry of the vector field 
+    referred to by ``vector_ref`` the weak reference to the tensor field of 
+    id ``tid`` (cf. ``VectorField._lie_der_along_self``), when the latter is
+    destroyed. 
+    """
+    def remove(tensor_ref):
+        vector = vector_ref()
+        if vector is not None:
+            if vector._lie_der_along_self.get(tid) is tensor_ref:
+                del vector._lie_der_along_self[tid]
+    return remove
 
 class TensorField(SageObject):
     r"""
@@ -836,16 +904,73 @@ class TensorField(SageObject):
         r"""
         Initialize the derived quantities
         """
-        self._lie_derivatives = {} # collection of Lie derivatives of self
+        # collection of Lie derivatives of self, in the order of their last 
+        # use; the keys are the ids of the vector fields and the values are
+        # pairs (weak reference to the vector field, Lie derivative):
+        self._lie_derivatives = OrderedDict() 
 
-    def _del_derived(self):
+    def _del_derived(self, frame=None):
         r"""
         Delete the derived quantities
+        
+        INPUT:
+        
+        - ``frame`` -- (default: None) vector frame in which the components 
+          have been modified, those in other frames being unchanged; if None, 
+          the tensor field is considered as modified in all frames. Only the
+          quantities relying on the components in ``frame`` are then deleted.
+
         """
+        from utilities import notify_dependents
         # First deletes any reference to self in the vectors' dictionary:
-        for vid, val in self._lie_derivatives.items():
-            del val[0]._lie_der_along_self[id(self)]
+        for vector_ref, res in self._lie_derivatives.itervalues():
+            vector = vector_ref()
+            if vector is not None:
+                vector._lie_der_along_self.pop(id(self), None)
         self._lie_derivatives.clear()
+        # The objects depending on self are informed of the modification:
+        notify_dependents(self, frame)
+
+    def _get_lie_der(self, vector):
+        r"""
+        Return the Lie derivative of ``self`` with respect to ``vector`` if 
+        it is stored in :attr:`_lie_derivatives`, None otherwise. 
+        """
+        vid = id(vector)
+        entry = self._lie_derivatives.get(vid)
+        if entry is None:
+            return None
+        del self._lie_derivatives[vid]
+        if entry[0]() is not vector:
+            # stale entry, relative to a vector field that has been 
+            # destroyed and whose id has been reused:
+            return None
+        self._lie_derivatives[vid] = entry  # entry marked as the last used
+        return entry[1]
+
+    def _set_lie_der(self, vector, res):
+        r"""
+        Store ``res`` as the Lie derivative of ``self`` with respect to 
+        ``vector``. 
+        
+        Only weak references to ``vector`` and ``self`` are kept, so that 
+        the storage does not prevent them from being garbage-collected; 
+        they are removed when the referred object is destroyed. The
+        least recently used Lie derivatives are discarded to keep the 
+        number of stored Lie derivatives below the limit set by 
+        :func:`set_lie_der_cache_size`. 
+        """
+        vid = id(vector)
+        self_ref = weakref.ref(self, 
+                    _lie_der_along_remover(weakref.ref(vector), id(self)))
+        vector_ref = weakref.ref(vector, _lie_der_remover(self_ref, vid))
+        self._lie_derivatives[vid] = (vector_ref, res)
+        vector._lie_der_along_self[id(self)] = self_ref
+        while len(self._lie_derivatives) > _lie_der_cache_maxsize:
+            old_ref = self._lie_derivatives.popitem(last=False)[1][0]
+            old_vector = old_ref()
+            if old_vector is not None:
+                old_vector._lie_der_along_self.pop(id(self), None)
 
     def copy(self):
         r"""
@@ -994,6 +1119,17 @@ class TensorField(SageObject):
             sage: t_f == p_mat.inverse() * t_e * p_mat
             True
 
+        If there is no direct change of frame from the frames in which the 
+        components are known, the changes of frame are composed::
+        
+            sage: b = AutomorphismField(m)
+            sage: b[:] = [[0,1],[1,0]]
+            sage: h = f.new_frame(b, 'h')
+            sage: w = VectorField(m)
+            sage: w[0], w[1] = (1,2)   # components known in the frame e only
+            sage: w.comp(h)[:] == v.comp(h)[:]  # for v, the change f -> h is used
+            True
+
         From the Cartesian components to the spherical one for a vector on 
         `\RR^3`::
         
@@ -1044,7 +1180,7 @@ class TensorField(SageObject):
             vy*cos(ph) - vx*sin(ph)
 
         """
-        from scalarfield import ScalarField
+        from scalarfield import ScalarField, ZeroScalarField
         if frame is None: 
             frame = self.domain.def_frame
         if frame not in self.components:
@@ -1056,6 +1192,10 @@ class TensorField(SageObject):
                 if frame in known_frame.subframes:
                     new_comp = self._new_comp(frame)
                     old_comp = self.components[known_frame]
+                    if isinstance(old_comp, CompRiemannSym):
+                        # all the components with the antisymmetries of 
+                        # new_comp are required:
+                        old_comp = old_comp._comp_with_sym()
                     sdom = frame.domain
                     chart = sdom.def_chart
                     for ind in old_comp._comp:
@@ -1085,6 +1225,16 @@ class TensorField(SageObject):
                             # of self in it must be set:
                             self.comp(from_frame)
                             break # quit the loop on known_frame
+                if from_frame is None:
+                    # Search for a sequence of changes of frame, which are
+                    # then composed: 
+                    path = manif.frame_change_path(frame, 
+                                                   self.components.keys())
+                    if path is not None and \
+                          manif.frame_change_path(path[-1], frame) is not None:
+                        from_frame = path[-1]
+                        manif.frame_change(frame, from_frame)
+                        manif.frame_change(from_frame, frame)
                 if from_frame is None:
                     raise ValueError("No frame could be found for computing " + 
                                      "the components in the " + str(frame))
@@ -1111,18 +1261,64 @@ class TensorField(SageObject):
             old_comp = self.components[from_frame]
             new_comp = self._new_comp(frame)
             rank = self.rank
-            # loop on the new components:
+            # The tensor change-of-basis formula is applied one index at a 
+            # time, each step involving only the nonzero terms. 
+            # For each index position, coef_list[pos][k] is the list of the 
+            # pairs (i, a) of the nonzero change-of-basis matrix elements  
+            # relating the new index value i to the old index value k: 
+            coef_con = {}   # contravariant indices: ppinv[[i,k]]
+            coef_cov = {}   # covariant indices: pp[[k,i]]
+            for k in manif.irange():
+                coef_con[k] = []
+                coef_cov[k] = []
+            for i, k in manif.index_generator(2):
+                if n_con > 0:
+                    a = ppinv[[i, k]]
+                    if not isinstance(a, ZeroScalarField):
+                        coef_con[k].append((i, a))
+                if n_cov > 0:
+                    a = pp[[k, i]]
+                    if not isinstance(a, ZeroScalarField):
+                        coef_cov[k].append((i, a))
+            coef_list = [coef_con for pos in range(n_con)] + \
+                        [coef_cov for pos in range(n_con, rank)]
+            # Nonzero old components (including those deduced by symmetry):
+            part_comp = {}
+            for ind_old in manif.index_generator(rank):
+                t = old_comp[[ind_old]]
+                if not isinstance(t, ZeroScalarField):
+                    part_comp[ind_old] = t
+            # Transformation of the first rank-1 indices; the components 
+            # part_comp have then their first pos+1 indices in the new frame:
+            for pos in range(rank-1):
+                new_part = {}
+                for ind, t in part_comp.iteritems():
+                    for i, a in coef_list[pos][ind[pos]]:
+                        ind_new = ind[:pos] + (i,) + ind[pos+1:]
+                        if ind_new in new_part:
+                            new_part[ind_new] += a*t
+                        else:
+                            new_part[ind_new] = a*t
+                part_comp = {}
+                for ind, t in new_part.iteritems():
+                    if not isinstance(t, ZeroScalarField):
+                        part_comp[ind] = t
+            # Transformation of the last index, for the non-redundant 
+            # components only:
+            last = rank - 1
+            coef_last = {}  # new index value -> list of (old value, coef)
+            for k in manif.irange():
+                for i, a in coef_list[last][k]:
+                    if i in coef_last:
+                        coef_last[i].append((k, a))
+                    else:
+                        coef_last[i] = [(k, a)]
             for ind_new in new_comp.non_redundant_index_generator(): 
-                # Summation on the old components multiplied by the proper 
-                # change-of-basis matrix elements (tensor formula): 
                 res = 0 
-                for ind_old in manif.index_generator(rank): 
-                    t = old_comp[[ind_old]]
-                    for i in range(n_con): # loop on contravariant indices
-                        t *= ppinv[[ind_new[i], ind_old[i]]]
-                    for i in range(n_con,rank):  # loop on covariant indices
-                        t *= pp[[ind_old[i], ind_new[i]]]
-                    res += t
+                for k, a in coef_last.get(ind_new[last], []):
+                    ind = ind_new[:last] + (k,)
+                    if ind in part_comp:
+                        res += a*part_comp[ind]
                 new_comp[ind_new] = res
             self.components[frame] = new_comp
             # end of case where the computation was necessary
@@ -1292,7 +1488,8 @@ class TensorField(SageObject):
                 raise ValueError("The " + str(frame) + " has not been " +
                                  "defined on the " + str(self.manifold))
             self.components[frame] = self._new_comp(frame)
-        self._del_derived() # deletes the derived quantities
+        # deletes the derived quantities relying on the components in frame:
+        self._del_derived(frame) 
         return self.components[frame]
 
 
@@ -2740,7 +2937,9 @@ class TensorField(SageObject):
         The Lie derivative is stored in the dictionary 
         :attr:`_lie_derivatives`, so that there is no need to 
         recompute it at the next call if neither ``self`` nor ``vector``
-        have been modified meanwhile. 
+        have been modified meanwhile. Only weak references to ``vector`` are
+        kept and the number of stored Lie derivatives is bounded (see 
+        :func:`set_lie_der_cache_size`). 
         
         INPUT:
         
@@ -2794,12 +2993,22 @@ class TensorField(SageObject):
             sage: om.lie_der(v) == v.contract(0,om.exterior_der(),0) + (om(v)).exterior_der()
             True
         
+        The Lie derivative is recomputed if the vector field is modified::
+        
+            sage: lv = om.lie_der(v)
+            sage: om.lie_der(v) is lv
+            True
+            sage: v[:] = (y, x)
+            sage: om.lie_der(v) is lv
+            False
+        
         """
         from vectorfield import VectorField
         if not isinstance(vector, VectorField):
             raise TypeError("The argument must be a vector field.")
         manif = self.manifold
-        if id(vector) not in self._lie_derivatives:
+        res = self._get_lie_der(vector)
+        if res is None:
             # A new computation must be performed
             #
             # 1/ Search for a common coordinate frame:
@@ -2839,9 +3048,8 @@ class TensorField(SageObject):
             #
             # 3/ Final result (the tensor)
             res = resc.tensor_field(self.tensor_type)
-            self._lie_derivatives[id(vector)] = (vector, res)
-            vector._lie_der_along_self[id(self)] = self
-        return self._lie_derivatives[id(vector)][1]
+            self._set_lie_der(vector, res)
+        return res
         
 #******************************************************************************
     
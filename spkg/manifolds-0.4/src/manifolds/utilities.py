@@ -21,6 +21,7 @@ AUTHORS:
 #                  http://www.gnu.org/licenses/
 #******************************************************************************
 
+from collections import OrderedDict
 from sage.structure.sage_object import SageObject
 
 def is_atomic(expression):
@@ -248,41 +249,600 @@ class FormattedExpansion(SageObject):
         return self.latex
 
 
+class Registry(list):
+    r"""
+    List of distinct objects (charts, vector frames, ...) with a constant-time
+    membership test. 
+    
+    The objects must be hashable. The list keeps the order in which the 
+    objects have been added; adding an object that is already in the list 
+    has no effect. 
+
+    EXAMPLES::
+    
+        sage: from sage.geometry.manifolds.utilities import Registry
+        sage: r = Registry([3, 1])
+        sage: r.append(2) ; r.append(3)
+        sage: r
+        [3, 1, 2]
+        sage: 2 in r
+        True
+        sage: r.remove(2) ; 2 in r
+        False
+        
+    All the list methods that modify the list keep the membership test 
+    consistent (a duplicate object resulting from an item or slice 
+    assignment is removed, the first occurrence being kept)::
+    
+        sage: r.insert(0, 5) ; r
+        [5, 3, 1]
+        sage: r.pop() ; 1 in r
+        1
+        False
+        sage: r[0] = 7 ; 5 in r, 7 in r
+        (False, True)
+        sage: r[1:] = [4, 7, 6] ; r
+        [7, 4, 6]
+        sage: del r[0] ; 7 in r
+        False
+        sage: r += [4, 8] ; r
+        [4, 6, 8]
+        
+    """
+    def __init__(self, items=()):
+        list.__init__(self)
+        self._members = set()
+        self.extend(items)
+
+    def __reduce__(self):
+        r"""
+        For pickling (the set of members is reconstructed upon unpickling). 
+        """
+        return (self.__class__, (list(self),))
+
+    def __contains__(self, item):
+        return item in self._members
+
+    def append(self, item):
+        if item not in self._members:
+            list.append(self, item)
+            self._members.add(item)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def remove(self, item):
+        list.remove(self, item)
+        self._members.discard(item)
+
+    def insert(self, index, item):
+        if item not in self._members:
+            list.insert(self, index, item)
+            self._members.add(item)
+
+    def pop(self, index=-1):
+        item = list.pop(self, index)
+        self._members.discard(item)
+        return item
+
+    def _reset(self, items):
+        r"""
+        Replace the content of ``self`` by the distinct objects of 
+        ``items``. 
+        """
+        list.__delitem__(self, slice(None))
+        self._members = set()
+        self.extend(items)
+
+    def __setitem__(self, index, value):
+        items = list(self)
+        items[index] = value   # index may be a slice
+        self._reset(items)
+
+    def __delitem__(self, index):
+        list.__delitem__(self, index)
+        self._members = set(self)
+
+    def __setslice__(self, i, j, items):
+        # called instead of __setitem__ for simple slices in Python 2
+        self.__setitem__(slice(i, j), items)
+
+    def __delslice__(self, i, j):
+        # called instead of __delitem__ for simple slices in Python 2
+        self.__delitem__(slice(i, j))
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def __imul__(self, n):
+        # the objects being distinct, the only possible effect is to empty 
+        # the list: 
+        if n <= 0:
+            self._reset(())
+        return self
+
+
+def add_dependent(source, dependent, frame=None):
+    r"""
+    Declare that ``dependent`` holds some quantities computed from 
+    ``source``. 
+    
+    When ``source`` is modified, it calls :func:`notify_dependents`, which 
+    invokes the method ``_source_modified(source, frame)`` of 
+    ``dependent``; the latter is then in charge of deleting the quantities
+    that are no longer valid. Only a weak reference to ``dependent`` is 
+    kept. 
+    
+    INPUT:
+    
+    - ``source`` -- object on which ``dependent`` depends
+    - ``dependent`` -- object implementing the method ``_source_modified``
+    - ``frame`` -- (default: None) vector frame in which the components of
+      ``source`` have been used; if None, ``dependent`` is notified of any
+      modification of ``source``, otherwise only of the modifications 
+      affecting the components of ``source`` in ``frame``. 
+      
+    """
+    import weakref
+    try:
+        dependents = source._dependents
+    except AttributeError:
+        dependents = {}
+        source._dependents = dependents
+    entry = dependents.get(id(dependent))
+    if entry is None or entry[0]() is not dependent:
+        entry = (weakref.ref(dependent), set())
+        dependents[id(dependent)] = entry
+    entry[1].add(frame)
+
+def notify_dependents(source, frame=None):
+    r"""
+    Notify the objects declared by :func:`add_dependent` as depending on 
+    ``source`` that the latter has been modified. 
+    
+    INPUT:
+    
+    - ``source`` -- the modified object
+    - ``frame`` -- (default: None) vector frame in which the components of 
+      ``source`` have been modified, the components in other frames being 
+      unchanged; if None, ``source`` is considered as modified in all 
+      frames. 
+    
+    Only the dependents that have used the components of ``source`` in 
+    ``frame`` (or that have been declared without any frame) are notified. 
+    A dependent is no longer tracked after it has been notified of a 
+    modification in all frames, since it no longer depends on ``source``
+    until it recomputes some quantity from it.
+    
+    EXAMPLE::
+    
+        sage: from sage.geometry.manifolds.utilities import add_dependent, notify_dependents
+        sage: class Dependent(object):
+        ....:     def _source_modified(self, source, frame):
+        ....:         print "modified in frame", frame
+        sage: class Source(object):
+        ....:     pass
+        sage: s = Source() ; d = Dependent()
+        sage: add_dependent(s, d, frame='e')
+        sage: notify_dependents(s, frame='f')  # d has not used the frame f 
+        sage: notify_dependents(s, frame='e')
+        modified in frame e
+        sage: notify_dependents(s)  # d is no longer tracked
+    
+    """
+    dependents = getattr(source, '_dependents', None)
+    if not dependents:
+        return
+    for key, (ref, frames) in dependents.items():
+        dependent = ref()
+        if dependent is None:
+            del dependents[key]
+        elif frame is None or None in frames or frame in frames:
+            if frame is None or frames == set([frame]):
+                del dependents[key]
+            else:
+                frames.discard(frame)
+            dependent._source_modified(source, frame)
+
+
+def index_blocks(indices, pairs):
+    r"""
+    Partition a set of indices into the connected components of the graph 
+    whose edges are given by pairs of indices. 
+    
+    This is used to find the blocks of a matrix of components from its 
+    pattern of nonzero entries. 
+    
+    INPUT:
+    
+    - ``indices`` -- iterable of indices (the vertices of the graph)
+    - ``pairs`` -- iterable of pairs of indices (the edges of the graph)
+    
+    OUTPUT:
+    
+    - list of sorted lists of indices, each of them being a connected 
+      component; the list is ordered by the first element of each block
+    
+    EXAMPLES::
+    
+        sage: from sage.geometry.manifolds.utilities import index_blocks
+        sage: index_blocks(range(4), [(0,3)])
+        [[0, 3], [1], [2]]
+        sage: index_blocks(range(1,5), [(1,1), (2,3), (3,4)])
+        [[1], [2, 3, 4]]
+
+    """
+    block = {}  # index -> block containing it
+    for i in indices:
+        block[i] = [i]
+    for i, j in pairs:
+        bi = block[i]
+        bj = block[j]
+        if bi is not bj:
+            if len(bi) < len(bj):
+                bi, bj = bj, bi
+            bi.extend(bj)
+            for k in bj:
+                block[k] = bi
+    result = []
+    seen = set()
+    for b in block.itervalues():
+        if id(b) not in seen:
+            seen.add(id(b))
+            result.append(sorted(b))
+    result.sort()
+    return result
+
+
 #***********************************************************
 
-def simple_determinant(aa):
+def _is_structural_zero(x):
+    r"""
+    Return True if ``x`` is zero without any computation (for a symbolic 
+    expression, no simplification is attempted). 
+    """
+    if hasattr(x, 'is_trivial_zero'):
+        return x.is_trivial_zero()
+    return x == 0
+
+def _simplified_if_nonzero(x, simplify=None):
+    r"""
+    Return ``x`` simplified by ``simplify`` (by default, by 
+    :func:`simplify_chain` with the profile ``'full'``) if it cannot be 
+    shown to be zero, ``None`` otherwise.
+    
+    Contrary to :func:`_is_structural_zero`, this detects the expressions 
+    that are zero via some identity, like `\cos^2 t + \sin^2 t - 1`.
+    """
+    if _is_structural_zero(x):
+        return None
+    if hasattr(x, 'is_trivial_zero'):
+        if simplify is None:
+            x = simplify_chain(x)
+        else:
+            x = simplify(x)
+        if _is_structural_zero(x):
+            return None
+    return x
+
+def simple_determinant(aa, simplify=None):
     r"""
     Compute the determinant of a square matrix.
     
-    This function is a workaround to bypass a bug in Sage det method.
+    This function is a workaround to bypass a bug in Sage det method. 
+    
+    The structure of the matrix is first examined from the pattern of its 
+    zero entries: 
+
+    * if the matrix is block-diagonal (up to a simultaneous permutation of 
+      rows and columns), the determinant is the product of the determinants 
+      of the blocks;
+    * if the matrix is triangular, the determinant is the product of the
+      diagonal elements. 
+      
+    Otherwise, the determinant is computed by the fraction-free Gaussian 
+    elimination of Bareiss, which requires `O(n^3)` operations (instead of
+    `O(n!)` for a cofactor expansion), each intermediate result being 
+    simplified by ``simplify_rational``. Since the pivots must be nonzero, 
+    they are simplified before being accepted. 
+    
+    INPUT:
+    
+    - ``aa`` -- square matrix
+    - ``simplify`` -- (default: None) function used to simplify the 
+      candidate pivots, in order to detect those that are zero; if None, 
+      :func:`simplify_chain` is used with the profile ``'full'``
+    
+    OUTPUT:
+    
+    - the determinant of ``aa``
+    
+    EXAMPLES::
+    
+        sage: from sage.geometry.manifolds.utilities import simple_determinant
+        sage: var('a b c')
+        (a, b, c)
+        sage: simple_determinant(matrix([[a, b], [c, a]]))
+        a^2 - b*c
+        sage: m = matrix([[1, a, b], [a, 2, c], [b, c, 3]])
+        sage: bool(simple_determinant(m) == m.det())
+        True
+        
+    Block-diagonal case (here a 2x2 block and a 1x1 block, once the second
+    and third rows and columns are swapped)::
+    
+        sage: m = matrix([[a, 0, b], [0, c, 0], [b, 0, 1]])
+        sage: bool(simple_determinant(m) == (a - b^2)*c)
+        True
+        
+    Triangular case::
+    
+        sage: simple_determinant(matrix([[a, b, c], [0, b, a], [0, 0, c]]))
+        a*b*c
+        
+    Case of a diagonal element that is zero only via a trigonometric 
+    identity (it is not used as a pivot)::
+    
+        sage: from sage.geometry.manifolds.utilities import simplify_chain
+        sage: t = var('t')
+        sage: m = matrix([[cos(t)^2 + sin(t)^2 - 1, 1, 1], [1, 0, 1], [1, 1, a]])
+        sage: simplify_chain(simple_determinant(m))
+        -a + 2
+        sage: bool(_ == simplify_chain(m.det()))
+        True
+        
+    The simplification of the pivots can be specified, for instance to use 
+    that of some chart::
+    
+        sage: d = simple_determinant(m, lambda x: simplify_chain(x, 'trig'))
+        sage: simplify_chain(d)
+        -a + 2
+
     """
-    from sage.matrix.constructor import matrix
     n = aa.nrows()
     if n == 1:
         return aa[0,0]
-    res = 0
-    sign = True
+    # 1/ Search for a block-diagonal structure: connected components of the 
+    #    graph linking i and j if aa[i,j] or aa[j,i] is nonzero
+    block_label = range(n)
+    def root(i):
+        while block_label[i] != i:
+            i = block_label[i]
+        return i
+    for i in range(n):
+        for j in range(i+1, n):
+            if not (_is_structural_zero(aa[i,j]) and 
+                    _is_structural_zero(aa[j,i])):
+                ri = root(i)
+                rj = root(j)
+                if ri != rj:
+                    block_label[max(ri, rj)] = min(ri, rj)
+    blocks = {}
+    for i in range(n):
+        ri = root(i)
+        if ri in blocks:
+            blocks[ri].append(i)
+        else:
+            blocks[ri] = [i]
+    if len(blocks) > 1:
+        res = 1
+        for block in blocks.itervalues():
+            res *= simple_determinant(aa.matrix_from_rows_and_columns(block,
+                                                                      block),
+                                      simplify)
+        return res
+    # 2/ Triangular matrix
+    lower = True
+    upper = True
     for i in range(n):
-        b = []
-        for k in range(i):
-            r = []
-            for l in range(1,n):
-               r.append(aa[k,l])
-            b.append(r)
-        for k in range(i+1,n):
-            r = []
-            for l in range(1,n):
-               r.append(aa[k,l])
-            b.append(r)
-        bb = matrix(b)
-        if sign:
-            res += aa[i,0] * simple_determinant(bb)
+        for j in range(i+1, n):
+            if not _is_structural_zero(aa[i,j]):
+                lower = False
+            if not _is_structural_zero(aa[j,i]):
+                upper = False
+    if lower or upper:
+        res = aa[0,0]
+        for i in range(1, n):
+            res *= aa[i,i]
+        return res
+    # 3/ Bareiss fraction-free elimination
+    def simplif(x):
+        if hasattr(x, 'simplify_rational'):
+            return x.simplify_rational()
+        return x
+    mm = [[aa[i,j] for j in range(n)] for i in range(n)]
+    sign = 1
+    prev_pivot = 1
+    for k in range(n-1):
+        # search for a nonzero pivot, the entries that are zero only after
+        # simplification being discarded: 
+        for p in range(k, n):
+            pivot = _simplified_if_nonzero(mm[p][k], simplify)
+            if pivot is not None:
+                if p != k:
+                    mm[k], mm[p] = mm[p], mm[k]
+                    sign = -sign
+                mm[k][k] = pivot
+                break
         else:
-            res -= aa[i,0] * simple_determinant(bb)
-        sign = not sign
-    return res
+            return 0   # the column k is zero on and below the diagonal
+        for i in range(k+1, n):
+            for j in range(k+1, n):
+                # the division is exact: 
+                mm[i][j] = simplif((mm[i][j]*pivot - mm[i][k]*mm[k][j]) / 
+                                   prev_pivot)
+        prev_pivot = pivot
+    if sign == 1:
+        return mm[n-1][n-1]
+    return -mm[n-1][n-1]
 
 
+def simple_inverse(aa, simplify=None, blocks=None):
+    r"""
+    Compute the inverse of a square matrix.
+    
+    This function avoids the generic symbolic Gaussian elimination of Sage 
+    ``inverse`` method, which yields huge unsimplified rational expressions. 
+    
+    The matrix is first split into diagonal blocks (up to a simultaneous 
+    permutation of rows and columns) from the pattern of its zero entries 
+    (see :func:`index_blocks`) and each block is inverted separately, as its 
+    adjugate matrix divided by its determinant: 
+    
+    * the blocks of size 1, 2 or 3 are inverted by closed formulas;
+    * for larger blocks, the cofactors are computed by 
+      :func:`simple_determinant`.
+      
+    The determinant of each block is computed and simplified only once. 
+    
+    INPUT:
+    
+    - ``aa`` -- square matrix
+    - ``simplify`` -- (default: None) function used to simplify the 
+      determinant of each block and the entries of the inverse, as well as
+      the pivots in :func:`simple_determinant`; if None, no simplification 
+      is performed (except for the pivots, see :func:`simple_determinant`)
+    - ``blocks`` -- (default: None) list of the diagonal blocks of ``aa``, 
+      each block being a list of row (and column) indices, if they are 
+      already known; if None, they are determined from the zero entries of 
+      ``aa``
+    
+    OUTPUT:
+    
+    - the inverse of ``aa``, as a matrix
+    
+    EXAMPLES::
+    
+        sage: from sage.geometry.manifolds.utilities import simple_inverse
+        sage: a, b, c = var('a b c')
+        sage: simple_inverse(matrix([[a, 0], [0, b]]))
+        [1/a   0]
+        [  0 1/b]
+        
+    Block-diagonal case (a 2x2 block and a 1x1 block, once the second and 
+    third rows and columns are swapped)::
+    
+        sage: m = matrix([[a, 0, b], [0, c, 0], [b, 0, 1]])
+        sage: mi = simple_inverse(m, simplify=lambda x: x.simplify_rational())
+        sage: mi[1,1], mi[0,2]
+        (1/c, b/(b^2 - a))
+        sage: (mi*m).apply_map(lambda x: x.simplify_rational())
+        [1 0 0]
+        [0 1 0]
+        [0 0 1]
+        sage: simple_inverse(m, simplify=lambda x: x.simplify_rational(), 
+        ....:                blocks=[[0, 2], [1]]) == mi
+        True
+        
+    Generic 4x4 case::
+    
+        sage: m = matrix([[a, 1, 0, 1], [b, a, 1, 0], [0, c, a, 1], [1, 0, b, a]])
+        sage: mi = simple_inverse(m)
+        sage: (mi*m).apply_map(lambda x: x.simplify_rational()) == identity_matrix(4)
+        True
+
+    """
+    from sage.matrix.constructor import matrix
+    pivot_simplify = simplify
+    if simplify is None:
+        simplify = lambda x: x
+    n = aa.nrows()
+    if blocks is None:
+        pairs = [(i,j) for i in range(n) for j in range(i+1, n) 
+                 if not (_is_structural_zero(aa[i,j]) and 
+                         _is_structural_zero(aa[j,i]))]
+        blocks = index_blocks(range(n), pairs)
+    inv = [[0 for j in range(n)] for i in range(n)]
+    for block in blocks:
+        nb = len(block)
+        bb = [[aa[i,j] for j in block] for i in block]
+        # Cofactor matrix of the block:
+        if nb == 1:
+            cof = [[1]]
+        elif nb == 2:
+            cof = [[bb[1][1], -bb[1][0]], [-bb[0][1], bb[0][0]]]
+        elif nb == 3:
+            cof = [[bb[(i+1)%3][(j+1)%3]*bb[(i+2)%3][(j+2)%3] - 
+                    bb[(i+1)%3][(j+2)%3]*bb[(i+2)%3][(j+1)%3] 
+                    for j in range(3)] for i in range(3)]
+        else:
+            bmat = matrix(bb)
+            cof = []
+            for i in range(nb):
+                rows = [k for k in range(nb) if k != i]
+                cof.append([(-1)**(i+j) * simple_determinant(
+                            bmat.matrix_from_rows_and_columns(rows, 
+                                   [k for k in range(nb) if k != j]),
+                            pivot_simplify) 
+                            for j in range(nb)])
+        # Determinant of the block (expansion along the first row):
+        if nb == 1:
+            det = bb[0][0]
+        else:
+            det = 0
+            for j in range(nb):
+                det += bb[0][j] * cof[0][j]
+        det = simplify(det)
+        if _is_structural_zero(det):
+            raise ZeroDivisionError("The matrix is not invertible.")
+        # Inverse = adjugate (transpose of the cofactor matrix) / determinant:
+        for p in range(nb):
+            for q in range(nb):
+                inv[block[p]][block[q]] = simplify(cof[q][p] / det)
+    return matrix(inv)
+
+
+def numpy_function(expr, variables):
+    r"""
+    Compile a symbolic expression into a function acting on NumPy arrays.
+    
+    INPUT:
+    
+    - ``expr`` -- symbolic expression (possibly a relation)
+    - ``variables`` -- list of symbolic variables, in the order of the 
+      arguments of the compiled function
+      
+    OUTPUT:
+    
+    - a Python function taking as many arguments as ``variables`` and 
+      evaluating ``expr`` elementwise on NumPy arrays (or numbers), or 
+      None if ``expr`` cannot be compiled
+      
+    The expression is converted to SymPy and compiled by SymPy's 
+    ``lambdify`` with the ``numpy`` module; if this fails, the 
+    :func:`~sage.ext.fast_callable.fast_callable` version of ``expr`` is 
+    vectorized by ``numpy.vectorize``. 
+    
+    EXAMPLES::
+    
+        sage: from sage.geometry.manifolds.utilities import numpy_function
+        sage: import numpy
+        sage: x, y = var('x y')
+        sage: f = numpy_function(x*cos(y), [x, y])
+        sage: f(numpy.array([1., 2.]), numpy.array([0., 0.]))
+        array([ 1.,  2.])
+        sage: g = numpy_function(x^2 + y^2 < 1, [x, y])
+        sage: g(numpy.array([0., 1.]), numpy.array([0.5, 0.5]))
+        array([ True, False], dtype=bool)
+
+    """
+    import numpy
+    try:
+        from sympy import lambdify
+        return lambdify([v._sympy_() for v in variables], expr._sympy_(), 
+                        modules='numpy')
+    except Exception:   # any failure in the conversion to SymPy
+        pass
+    from sage.ext.fast_callable import fast_callable
+    from sage.rings.real_double import RDF
+    try:
+        func = fast_callable(expr, vars=variables, domain=RDF)
+    except (TypeError, ValueError, NotImplementedError):
+        return None
+    return numpy.vectorize(func, otypes=[numpy.float64])
+
 
 def simplify_sqrt_real(expr):
     r"""
@@ -387,21 +947,332 @@ def simplify_abs_trig(expr):
     
 
 
-def simplify_chain(expr):
+# Elementary simplification passes available to simplify_chain, with the 
+# features (cf. expression_features) that an expression must have for the
+# pass to be useful (None = the pass is always useful):
+_simplification_passes = {
+    'factorial': (lambda expr: expr.simplify_factorial(), ('factorial',)),
+    'trig': (lambda expr: expr.simplify_trig(), ('trig',)), 
+    'rational': (lambda expr: expr.simplify_rational(), None),
+    'sqrt_real': (simplify_sqrt_real, ('sqrt',)),
+    'abs_trig': (simplify_abs_trig, ('abs',)),
+    'radical': (lambda expr: expr.simplify_radical(), ('sqrt', 'log')), 
+    'log': (lambda expr: expr.simplify_log('one'), ('log',))
+    }
+
+# Named simplification profiles: sequence of passes and flag indicating 
+# whether the passes not required by the expression are skipped:
+_simplification_profiles = {
+    'none': ((), False),
+    'rational-only': (('rational',), False), 
+    'trig': (('trig', 'rational', 'trig'), False), 
+    'full': (('factorial', 'trig', 'rational', 'sqrt_real', 'abs_trig', 
+              'radical', 'log', 'rational', 'trig'), False),
+    'auto': (('factorial', 'trig', 'rational', 'sqrt_real', 'abs_trig', 
+              'radical', 'log', 'rational', 'trig'), True)
+    }
+
+_trig_functions = frozenset(['sin', 'cos', 'tan', 'cot', 'sec', 'csc', 
+                             'sinh', 'cosh', 'tanh', 'coth', 'sech', 'csch',
+                             'arcsin', 'arccos', 'arctan', 'arccot', 'arcsec',
+                             'arccsc', 'arctan2', 'arcsinh', 'arccosh', 
+                             'arctanh', 'arccoth', 'arcsech', 'arccsch'])
+
+def expression_features(expr):
+    r"""
+    Determine which kinds of functions appear in a symbolic expression, in
+    view of selecting the relevant simplifications. 
+    
+    INPUT:
+    
+    - ``expr`` -- symbolic expression
+    
+    OUTPUT:
+    
+    - set of strings among ``'trig'`` (trigonometric or hyperbolic 
+      functions), ``'sqrt'`` (non-integer powers), ``'abs'`` (absolute 
+      value), ``'log'`` (logarithm or exponential) and ``'factorial'`` 
+      (factorial, binomial or gamma function)
+      
+    EXAMPLES::
+    
+        sage: from sage.geometry.manifolds.utilities import expression_features
+        sage: expression_features(x^2 + 1/(x-1))
+        set([])
+        sage: sorted(expression_features(sqrt(x^2 + 1)*cos(x)))
+        ['sqrt', 'trig']
+        sage: sorted(expression_features(abs(log(x)) + factorial(x)))
+        ['abs', 'factorial', 'log']
+
+    """
+    import operator
+    features = set()
+    if not hasattr(expr, 'operator'):
+        return features
+    to_scan = [expr]
+    while to_scan:
+        ex = to_scan.pop()
+        op = ex.operator()
+        if op is None:
+            continue   # symbol or constant
+        operands = ex.operands()
+        if op is operator.pow:
+            if not operands[1].is_integer():
+                features.add('sqrt')
+        else:
+            try:
+                name = op.name()
+            except AttributeError:
+                name = None   # arithmetic operator
+            if name in _trig_functions:
+                features.add('trig')
+            elif name == 'abs':
+                features.add('abs')
+            elif name in ['log', 'exp']:
+                features.add('log')
+            elif name in ['factorial', 'binomial', 'gamma']:
+                features.add('factorial')
+        to_scan.extend(operands)
+    return features
+
+def register_simplification_profile(name, passes, skip_unneeded=False):
+    r"""
+    Define (or redefine) a named simplification profile for 
+    :func:`simplify_chain`. 
+    
+    The profile can then be selected for the functions of the coordinates 
+    of a chart via :meth:`Chart.set_simplification_profile` or 
+    :meth:`Manifold.set_simplification_profile`. 
+    
+    INPUT:
+    
+    - ``name`` -- string; name of the profile
+    - ``passes`` -- sequence of names of elementary simplifications, to be 
+      performed in that order, among ``'factorial'``, ``'trig'``, 
+      ``'rational'``, ``'sqrt_real'``, ``'abs_trig'``, ``'radical'`` and 
+      ``'log'``
+    - ``skip_unneeded`` -- (default: False) if True, the simplifications 
+      that are irrelevant for a given expression (e.g. ``'trig'`` for an 
+      expression without any trigonometric function) are skipped
+      
+    EXAMPLES::
+    
+        sage: from sage.geometry.manifolds.utilities import \
+        ...     register_simplification_profile, simplify_chain
+        sage: register_simplification_profile('log-only', ['log'])
+        sage: simplify_chain(log(x) + log(2), 'log-only')
+        log(2*x)
+        
+    Redefining a profile clears the cache of :func:`simplify_chain`, so 
+    that the new sequence of simplifications is taken into account::
+    
+        sage: register_simplification_profile('my-profile', ['rational'])
+        sage: simplify_chain(cos(x)^2 + sin(x)^2, 'my-profile')
+        cos(x)^2 + sin(x)^2
+        sage: register_simplification_profile('my-profile', ['trig'])
+        sage: simplify_chain(cos(x)^2 + sin(x)^2, 'my-profile')
+        1
+
+    """
+    for pass_name in passes:
+        if pass_name not in _simplification_passes:
+            raise ValueError("Unknown simplification: " + str(pass_name))
+    _simplification_profiles[name] = (tuple(passes), skip_unneeded)
+    clear_simplification_cache()
+
+def simplification_profiles():
+    r"""
+    Return the names of the available simplification profiles. 
+    
+    EXAMPLE::
+    
+        sage: from sage.geometry.manifolds.utilities import simplification_profiles
+        sage: simplification_profiles()  # random (depends on user-defined profiles)
+        ['auto', 'full', 'none', 'rational-only', 'trig']
+        sage: 'full' in simplification_profiles()
+        True
+        
+    """
+    return sorted(_simplification_profiles.keys())
+
+# LRU cache of the results of simplify_chain (see simplification_cache_info):
+_simplif_cache = OrderedDict()
+_simplif_cache_maxsize = 4096
+_simplif_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+def simplification_cache_info():
+    r"""
+    Return some information about the cache of :func:`simplify_chain`.
+    
+    The results of :func:`simplify_chain` are stored in a LRU (least 
+    recently used) cache, the key being made of the expression to be 
+    simplified, the domains of its variables, the sequence of 
+    simplifications defined by the profile and the current assumptions.
+    
+    OUTPUT:
+    
+    - dictionary with the keys ``'hits'``, ``'misses'``, ``'evictions'`` 
+      (numbers of cache hits, cache misses and entries removed because the 
+      cache was full), ``'size'`` (current number of entries) and 
+      ``'maxsize'`` (maximum number of entries)
+      
+    EXAMPLES::
+    
+        sage: from sage.geometry.manifolds.utilities import simplify_chain, \
+        ...     simplification_cache_info, clear_simplification_cache
+        sage: clear_simplification_cache()
+        sage: simplify_chain(cos(x)^2 + sin(x)^2)
+        1
+        sage: simplify_chain(cos(x)^2 + sin(x)^2)  # result from the cache
+        1
+        sage: info = simplification_cache_info()
+        sage: info['hits'], info['misses'], info['size']
+        (1, 1, 1)
+
+    """
+    info = dict(_simplif_cache_stats)
+    info['size'] = len(_simplif_cache)
+    info['maxsize'] = _simplif_cache_maxsize
+    return info
+
+def clear_simplification_cache():
+    r"""
+    Empty the cache of :func:`simplify_chain` and reset its statistics. 
+    
+    See :func:`simplification_cache_info` for details. 
+    
+    """
+    _simplif_cache.clear()
+    for key in _simplif_cache_stats:
+        _simplif_cache_stats[key] = 0
+
+def set_simplification_cache_size(maxsize):
+    r"""
+    Set the maximum number of entries in the cache of :func:`simplify_chain`.
+    
+    INPUT:
+    
+    - ``maxsize`` -- non-negative integer; ``0`` disables the cache
+    
+    EXAMPLES::
+    
+        sage: from sage.geometry.manifolds.utilities import \
+        ...     set_simplification_cache_size, simplification_cache_info
+        sage: set_simplification_cache_size(100)
+        sage: simplification_cache_info()['maxsize']
+        100
+        sage: set_simplification_cache_size(4096)  # back to the default
+        
+    """
+    global _simplif_cache_maxsize
+    if maxsize < 0:
+        raise ValueError("The cache size must be non-negative.")
+    _simplif_cache_maxsize = maxsize
+    while len(_simplif_cache) > maxsize:
+        _simplif_cache.popitem(last=False)
+        _simplif_cache_stats['evictions'] += 1
+
+def simplify_chain(expr, profile='full'):
     r"""
     Perform a chain of simplications to a symbolic expression.
     
+    INPUT:
+    
+    - ``expr`` -- symbolic expression to be simplified
+    - ``profile`` -- (default: 'full') name of the simplification profile, 
+      i.e. of the sequence of simplifications to be performed; the 
+      predefined profiles are 
+        * ``'full'``: ``simplify_factorial``, ``simplify_trig``, 
+          ``simplify_rational``, :func:`simplify_sqrt_real`, 
+          :func:`simplify_abs_trig`, ``simplify_radical``, 
+          ``simplify_log('one')``, ``simplify_rational`` and 
+          ``simplify_trig``
+        * ``'auto'``: same as ``'full'``, except that the simplifications 
+          that are irrelevant for ``expr`` are skipped (see 
+          :func:`expression_features`)
+        * ``'trig'``: ``simplify_trig``, ``simplify_rational`` and
+          ``simplify_trig``
+        * ``'rational-only'``: ``simplify_rational``
+        * ``'none'``: no simplification at all
+      other profiles can be defined via :func:`register_simplification_profile`
+      
+    OUTPUT:
+    
+    - the simplified expression; the results are kept in a cache (see 
+      :func:`simplification_cache_info`), so that the same expression is 
+      not simplified twice under the same assumptions
+    
+    EXAMPLES::
+    
+        sage: from sage.geometry.manifolds.utilities import simplify_chain
+        sage: simplify_chain(cos(x)^2 + sin(x)^2)
+        1
+        sage: simplify_chain((x^2-1)/(x+1), 'rational-only')
+        x - 1
+        sage: simplify_chain(cos(x)^2 + sin(x)^2, 'none')
+        cos(x)^2 + sin(x)^2
+        sage: simplify_chain((x^2-1)/(x+1), 'auto')  # trig functions not searched
+        x - 1
+        
+    Symbols with the same name but different domains do not share the 
+    cached results::
+    
+        sage: from sage.geometry.manifolds.utilities import \
+        ...     simplification_cache_info, clear_simplification_cache
+        sage: clear_simplification_cache()
+        sage: y = var('y')  # complex variable
+        sage: simplify_chain(cos(y)^2 + sin(y)^2)
+        1
+        sage: y = var('y', domain='real')
+        sage: simplify_chain(cos(y)^2 + sin(y)^2)  # not taken from the cache
+        1
+        sage: simplification_cache_info()['misses']
+        2
+        
     """
-    expr = expr.simplify_factorial()
-    expr = expr.simplify_trig()
-    expr = expr.simplify_rational()
-    expr = simplify_sqrt_real(expr)
-    expr = simplify_abs_trig(expr)
-    expr = expr.simplify_radical()
-    expr = expr.simplify_log('one')
-    expr = expr.simplify_rational()
-    expr = expr.simplify_trig()
+    from sage.symbolic.assumptions import assumptions
+    try:
+        passes, skip_unneeded = _simplification_profiles[profile]
+    except KeyError:
+        raise ValueError("Unknown simplification profile: " + str(profile))
+    if not passes:
+        return expr
+    if _simplif_cache_maxsize > 0:
+        # The string representation is used in the key, since the comparison
+        # of symbolic expressions would involve some simplification; since
+        # distinct symbols may have the same string representation, the 
+        # domains of the variables are part of the key, as well as the 
+        # assumptions, on which the result depends. The passes are stored 
+        # instead of the profile name, which may be redefined: 
+        try:
+            variables = expr.variables()
+        except AttributeError:  # expr is not a symbolic expression
+            variables = ()
+        key = (str(expr), passes, skip_unneeded, 
+               tuple((str(var), var.is_real(), var.is_positive()) 
+                     for var in variables),
+               tuple(str(assum) for assum in assumptions()))
+        if key in _simplif_cache:
+            _simplif_cache_stats['hits'] += 1
+            result = _simplif_cache.pop(key)
+            _simplif_cache[key] = result  # most recently used entry
+            return result
+        _simplif_cache_stats['misses'] += 1
+    if skip_unneeded:
+        features = expression_features(expr)
+    for pass_name in passes:
+        simplif, required = _simplification_passes[pass_name]
+        if skip_unneeded and required is not None:
+            if not features.intersection(required):
+                continue
+        expr = simplif(expr)
+    if _simplif_cache_maxsize > 0:
+        _simplif_cache[key] = expr
+        if len(_simplif_cache) > _simplif_cache_maxsize:
+            _simplif_cache.popitem(last=False)  # least recently used entry
+            _simplif_cache_stats['evictions'] += 1
     return expr
 
+
     
     
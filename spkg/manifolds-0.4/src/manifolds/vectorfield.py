@@ -149,17 +149,19 @@ class VectorField(TensorField) :
         """
         return VectorField(self.domain)
 
-    def _del_derived(self):
+    def _del_derived(self, frame=None):
         r"""
         Delete the derived quantities
         """
-        TensorField._del_derived(self)
+        TensorField._del_derived(self, frame)
         self._del_dependencies()
         
     def _init_dependencies(self):
         r"""
         Initialize list of quantities that depend on ``self``
         """
+        # weak references to the tensor fields whose Lie derivative along 
+        # self is stored, indexed by the ids of these tensor fields:
         self._lie_der_along_self = {}
 
     def _del_dependencies(self):
@@ -167,8 +169,10 @@ class VectorField(TensorField) :
         Clear list of quantities that depend on ``self``
         """
         if self._lie_der_along_self != {}:
-            for idtens, tens in self._lie_der_along_self.items():
-                del tens._lie_derivatives[id(self)]
+            for tens_ref in self._lie_der_along_self.itervalues():
+                tens = tens_ref()
+                if tens is not None:
+                    tens._lie_derivatives.pop(id(self), None)
             self._lie_der_along_self.clear()
 
         
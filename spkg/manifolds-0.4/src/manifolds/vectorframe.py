@@ -388,9 +388,9 @@ class VectorFrame(SageObject):
             for j in range(si,nsi):
                 self.coframe.form[i-si].add_comp(the_new_frame)[[j]] = \
                                                        transf.comp(self)[[i,j]]
-        for sdom in self.domain.superdomains:
-            sdom.frame_changes[(self, the_new_frame)] = transf
-            sdom.frame_changes[(the_new_frame, self)] = inv_transf
+        self.domain._set_change('frame_changes', (self, the_new_frame), transf)
+        self.domain._set_change('frame_changes', (the_new_frame, self), 
+                                inv_transf)
         return the_new_frame
         
     def new_subframe(self, domain, symbol, latex_symbol=None):